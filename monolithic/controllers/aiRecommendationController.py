@@ -2,108 +2,54 @@ from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.db.models import Avg, Count, Q
 from store.models import Book, Rating, Order, OrderItem, Category, Customer
+from dao.popularityDAO import PopularityDAO
+from dao.recommendationDAO import (
+    RecommendationDAO, COLLABORATIVE, CONTENT_BASED,
+    score_collaborative, content_preferences, score_content_based
+)
 import numpy as np
-from collections import defaultdict, Counter
+from collections import defaultdict
 import json
 
-def calculate_similarity(ratings1, ratings2, book_ids):
-    """
-    Tính độ tương đồng cosine giữa 2 user dựa trên ratings
-    """
-    common_books = set(ratings1.keys()) & set(ratings2.keys()) & book_ids
-    
-    if len(common_books) == 0:
-        return 0
-    
-    # Vector ratings
-    vec1 = np.array([ratings1[book] for book in common_books])
-    vec2 = np.array([ratings2[book] for book in common_books])
-    
-    # Cosine similarity
-    norm1 = np.linalg.norm(vec1)
-    norm2 = np.linalg.norm(vec2)
-    
-    if norm1 == 0 or norm2 == 0:
-        return 0
-    
-    return np.dot(vec1, vec2) / (norm1 * norm2)
-
 
 @require_http_methods(["GET"])
 def ai_collaborative_filtering(request, customer_id):
     """
     AI Collaborative Filtering: Gợi ý sách dựa trên người dùng tương tự
     Sử dụng User-based Collaborative Filtering với Cosine Similarity
+
+    Đọc danh sách tính sẵn (lệnh precompute_recommendations); chỉ khách hàng
+    chưa được tính (cold user) mới phải quét toàn bộ ratings.
     """
     try:
         limit = int(request.GET.get('limit', 10))
         
-        # Lấy tất cả ratings
-        all_ratings = Rating.objects.select_related('customer', 'book').all()
-        
-        # Tạo ma trận user-book ratings
-        user_ratings = defaultdict(dict)
-        for rating in all_ratings:
-            user_ratings[rating.customer_id][rating.book_id] = float(rating.score)
-        
-        # Kiểm tra user có ratings không
-        if customer_id not in user_ratings or len(user_ratings[customer_id]) == 0:
-            # Fallback: gợi ý sách rating cao nhất
-            return recommend_top_rated_fallback(limit)
-        
-        # Tìm users tương tự
-        target_user_ratings = user_ratings[customer_id]
-        all_book_ids = set(target_user_ratings.keys())
-        
-        similarities = []
-        for user_id, ratings in user_ratings.items():
-            if user_id != customer_id:
-                similarity = calculate_similarity(target_user_ratings, ratings, all_book_ids)
-                if similarity > 0:
-                    similarities.append((user_id, similarity))
-        
-        # Sắp xếp theo độ tương đồng
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        top_similar_users = similarities[:10]  # Top 10 users tương tự
-        
-        if len(top_similar_users) == 0:
-            return recommend_top_rated_fallback(limit)
-        
-        # Tính điểm predicted cho các sách chưa đọc
-        book_scores = defaultdict(float)
-        book_weights = defaultdict(float)
-        
-        read_books = set(target_user_ratings.keys())
-        
-        for user_id, similarity in top_similar_users:
-            for book_id, rating in user_ratings[user_id].items():
-                if book_id not in read_books:
-                    book_scores[book_id] += similarity * rating
-                    book_weights[book_id] += similarity
-        
-        # Tính điểm trung bình weighted
-        recommendations = []
-        for book_id, total_score in book_scores.items():
-            if book_weights[book_id] > 0:
-                predicted_score = total_score / book_weights[book_id]
-                recommendations.append((book_id, predicted_score))
-        
-        # Sắp xếp và lấy top recommendations
-        recommendations.sort(key=lambda x: x[1], reverse=True)
-        top_book_ids = [book_id for book_id, _ in recommendations[:limit]]
+        precomputed = RecommendationDAO.get_precomputed(customer_id, COLLABORATIVE, limit)
+        if precomputed is not None:
+            top_book_ids, details = precomputed
+            source = 'precomputed'
+        else:
+            # Kiểm tra user có ratings không
+            if not Rating.objects.filter(customer_id=customer_id).exists():
+                # Fallback: gợi ý sách rating cao nhất
+                return recommend_top_rated_fallback(limit, request.GET.get('category_id'))
+            
+            # Tạo ma trận user-book ratings
+            user_ratings = defaultdict(dict)
+            for rating_customer_id, book_id, score in Rating.objects.values_list(
+                'customer_id', 'book_id', 'score'
+            ).iterator():
+                user_ratings[rating_customer_id][book_id] = float(score)
+            
+            recommendations, details = score_collaborative(customer_id, user_ratings, limit)
+            top_book_ids = [book_id for book_id, _ in recommendations]
+            source = 'live'
         
         if len(top_book_ids) == 0:
-            return recommend_top_rated_fallback(limit)
-        
-        # Lấy thông tin sách
-        books = Book.objects.filter(id__in=top_book_ids).select_related('category').annotate(
-            avg_rating=Avg('rating__score'),
-            rating_count=Count('rating')
-        )
+            return recommend_top_rated_fallback(limit, request.GET.get('category_id'))
         
-        # Tạo dict để giữ thứ tự
-        book_dict = {book.id: book for book in books}
-        ordered_books = [book_dict[book_id] for book_id in top_book_ids if book_id in book_dict]
+        # Lấy thông tin sách theo đúng thứ tự gợi ý
+        ordered_books = RecommendationDAO.get_books_in_order(top_book_ids)
         
         data = [{
             'id': book.id,
@@ -122,7 +68,8 @@ def ai_collaborative_filtering(request, customer_id):
             'success': True, 
             'recommendations': data,
             'algorithm': 'AI Collaborative Filtering (User-based)',
-            'similar_users_count': len(top_similar_users)
+            'similar_users_count': details.get('similar_users_count', 0),
+            'source': source
         })
         
     except Exception as e:
@@ -134,74 +81,54 @@ def ai_content_based_filtering(request, customer_id):
     """
     AI Content-Based Filtering: Gợi ý sách dựa trên nội dung (category, author)
     của những sách user đã đánh giá cao
+
+    Đọc danh sách tính sẵn; cold user được tính trực tiếp.
     """
     try:
         limit = int(request.GET.get('limit', 10))
         
-        # Lấy ratings của customer
-        user_ratings = Rating.objects.filter(
-            customer_id=customer_id
-        ).select_related('book', 'book__category').order_by('-score')
-        
-        if not user_ratings.exists():
-            return recommend_top_rated_fallback(limit)
-        
-        # Phân tích preferences
-        liked_books = user_ratings.filter(score__gte=4.0)  # Rating >= 4.0
-        
-        if not liked_books.exists():
-            liked_books = user_ratings[:5]  # Lấy top 5 rated books
-        
-        # Đếm categories và authors yêu thích
-        category_scores = Counter()
-        author_scores = Counter()
-        rated_book_ids = set()
-        
-        for rating in liked_books:
-            weight = float(rating.score) / 5.0  # Normalize to 0-1
-            category_scores[rating.book.category_id] += weight
-            author_scores[rating.book.author] += weight
-            rated_book_ids.add(rating.book_id)
-        
-        # Lấy top categories và authors
-        top_categories = [cat_id for cat_id, _ in category_scores.most_common(5)]
-        top_authors = [author for author, _ in author_scores.most_common(5)]
-        
-        # Tìm sách tương tự
-        similar_books = Book.objects.filter(
-            Q(category_id__in=top_categories) | Q(author__in=top_authors)
-        ).exclude(
-            id__in=rated_book_ids
-        ).select_related('category').annotate(
-            avg_rating=Avg('rating__score'),
-            rating_count=Count('rating')
-        )
-        
-        # Tính điểm cho mỗi sách
-        book_scores = []
-        for book in similar_books:
-            score = 0
+        precomputed = RecommendationDAO.get_precomputed(customer_id, CONTENT_BASED, limit)
+        if precomputed is not None:
+            top_book_ids, details = precomputed
+            source = 'precomputed'
+        else:
+            # Lấy ratings của customer
+            customer_ratings = list(Rating.objects.filter(
+                customer_id=customer_id
+            ).order_by('-score').values_list('book_id', 'score', 'book__category_id', 'book__author'))
             
-            # Điểm từ category
-            if book.category_id in category_scores:
-                score += category_scores[book.category_id] * 2
+            if not customer_ratings:
+                return recommend_top_rated_fallback(limit, request.GET.get('category_id'))
             
-            # Điểm từ author
-            if book.author in author_scores:
-                score += author_scores[book.author] * 1.5
+            # Phân tích preferences
+            preferences = content_preferences(customer_ratings)
+            category_scores, author_scores, rated_book_ids = preferences
+            top_categories = [cat_id for cat_id, _ in category_scores.most_common(5)]
+            top_authors = [author for author, _ in author_scores.most_common(5)]
             
-            # Bonus cho sách có rating cao
-            if book.avg_rating:
-                score += float(book.avg_rating) * 0.3
+            # Tìm sách tương tự
+            similar_books = Book.objects.filter(
+                Q(category_id__in=top_categories) | Q(author__in=top_authors)
+            ).exclude(
+                id__in=rated_book_ids
+            ).annotate(
+                avg_rating=Avg('rating__score')
+            ).values_list('id', 'category_id', 'author', 'avg_rating')
             
-            book_scores.append((book, score))
+            avg_ratings = {}
+            candidates = []
+            for book_id, category_id, author, avg_rating in similar_books:
+                candidates.append((book_id, category_id, author))
+                avg_ratings[book_id] = avg_rating
+            
+            book_scores, details = score_content_based(preferences, candidates, avg_ratings, limit)
+            top_book_ids = [book_id for book_id, _ in book_scores]
+            source = 'live'
         
-        # Sắp xếp theo điểm
-        book_scores.sort(key=lambda x: x[1], reverse=True)
-        top_books = [book for book, _ in book_scores[:limit]]
+        if len(top_book_ids) == 0:
+            return recommend_top_rated_fallback(limit, request.GET.get('category_id'))
         
-        if len(top_books) == 0:
-            return recommend_top_rated_fallback(limit)
+        top_books = RecommendationDAO.get_books_in_order(top_book_ids)
         
         data = [{
             'id': book.id,
@@ -216,11 +143,15 @@ def ai_content_based_filtering(request, customer_id):
             'algorithm': 'Content-Based Filtering'
         } for book in top_books]
         
+        top_categories = details.get('top_category_ids', [])
+        category_names = Category.objects.in_bulk(top_categories)
+        
         return JsonResponse({
             'success': True, 
             'recommendations': data,
             'algorithm': 'AI Content-Based Filtering',
-            'top_categories': [Category.objects.get(id=cat_id).name for cat_id in top_categories]
+            'top_categories': [category_names[cat_id].name for cat_id in top_categories if cat_id in category_names],
+            'source': source
         })
         
     except Exception as e:
@@ -282,7 +213,7 @@ def ai_hybrid_recommendation(request, customer_id):
             recommendations.append(book)
         
         if len(recommendations) == 0:
-            return recommend_top_rated_fallback(limit)
+            return recommend_top_rated_fallback(limit, request.GET.get('category_id'))
         
         return JsonResponse({
             'success': True,
@@ -338,7 +269,7 @@ def ai_trending_books(request):
         top_books = [book for book, _ in book_scores[:limit]]
         
         if len(top_books) == 0:
-            return recommend_top_rated_fallback(limit)
+            return recommend_top_rated_fallback(limit, request.GET.get('category_id'))
         
         data = [{
             'id': book.id,
@@ -413,44 +344,17 @@ def ai_personalized_homepage(request, customer_id):
 
 
 # Helper function: Fallback khi không đủ dữ liệu
-def recommend_top_rated_fallback(limit=10):
+def recommend_top_rated_fallback(limit=10, category_id=None):
     """
     Fallback: Gợi ý sách rating cao nhất khi không đủ dữ liệu cho AI
+
+    Đọc danh sách phổ biến tính sẵn trong bộ nhớ (PopularityDAO), xếp theo rating
+    trung bình Bayesian - không chạy truy vấn aggregate nào.
     """
-    books = Book.objects.annotate(
-        avg_rating=Avg('rating__score'),
-        rating_count=Count('rating')
-    ).filter(
-        rating_count__gt=0
-    ).select_related('category').order_by('-avg_rating')[:limit]
-    
-    data = [{
-        'id': book.id,
-        'title': book.title,
-        'author': book.author,
-        'price': float(book.price),
-        'stock_quantity': book.stock_quantity,
-        'category_name': book.category.name,
-        'average_rating': float(book.avg_rating) if book.avg_rating else 0,
-        'total_ratings': book.rating_count,
-        'reason': 'Top rated books',
-        'algorithm': 'Fallback: Rating-based'
-    } for book in books]
-    
-    if len(data) == 0:
-        # Nếu không có rating nào, lấy random books
-        books = Book.objects.select_related('category').all()[:limit]
-        data = [{
-            'id': book.id,
-            'title': book.title,
-            'author': book.author,
-            'price': float(book.price),
-            'stock_quantity': book.stock_quantity,
-            'category_name': book.category.name,
-            'average_rating': 0,
-            'total_ratings': 0,
-            'reason': 'Popular books',
-            'algorithm': 'Fallback: Random selection'
-        } for book in books]
-    
+    if category_id is not None:
+        try:
+            category_id = int(category_id)
+        except (TypeError, ValueError):
+            category_id = None
+    data = PopularityDAO.get_popular_books(limit, category_id)
     return JsonResponse({'success': True, 'recommendations': data})
@@ -1,15 +1,44 @@
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.db.models import Q, Avg
 from store.models import Book, Category, Rating
 from dao.categoryDAO import CategoryDAO
+from dao.cartDAO import CartDAO
+from dao.recommendationDAO import RecommendationDAO, HISTORY
+from dao.ratingDAO import RatingDAO, RATING_IMPORT_CHUNK_SIZE
+from dao.feedParser import FEED_FORMATS, detect_format, parse_feed_lines
+from dao.catalogDAO import CatalogDAO
+from dao.bookDAO import BookDAO
+from controllers.conditional import version_headers, not_modified, with_version
+import csv
 import json
 
+
+def _book_data(book, avg_rating):
+    return {
+        'id': book.id,
+        'title': book.title,
+        'author': book.author,
+        'price': float(book.price),
+        'stock_quantity': book.stock_quantity,
+        'category_name': book.category.name,
+        'category_id': book.category.id,
+        'average_rating': float(avg_rating) if avg_rating else 0
+    }
+
+
 # API: Lấy danh sách tất cả sách
 @require_http_methods(["GET"])
 def list_books(request):
-    """Lấy danh sách tất cả sách"""
+    """Lấy danh sách tất cả sách (trả 304 nếu catalog không đổi)"""
+    updated_at, count = BookDAO.get_catalog_version()
+    etag, last_modified = version_headers(f'books-{count}', updated_at)
+    # 304 nếu client đang giữ đúng phiên bản (If-None-Match / If-Modified-Since)
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+    
     books = Book.objects.select_related('category').all()
     data = [{
         'id': book.id,
@@ -20,34 +49,77 @@ def list_books(request):
         'category_name': book.category.name,
         'category_id': book.category.id
     } for book in books]
-    return JsonResponse({'success': True, 'books': data})
+    return with_version(JsonResponse({'success': True, 'books': data}), etag, last_modified)
 
 # API: Lấy thông tin chi tiết một cuốn sách
 @require_http_methods(["GET"])
 def get_book(request, book_id):
-    """Lấy thông tin chi tiết một cuốn sách"""
+    """Lấy thông tin chi tiết một cuốn sách (trả 304 nếu sách không đổi)"""
+    # Chỉ đọc cột updated_at - client giữ đúng phiên bản thì không load / serialize gì
+    updated_at = BookDAO.get_version(book_id)
+    if updated_at is None:
+        return JsonResponse({'success': False, 'error': 'Book not found'}, status=404)
+    etag, last_modified = version_headers(f'book-{book_id}', updated_at)
+    # 304 nếu client đang giữ đúng phiên bản (If-None-Match / If-Modified-Since)
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+    
     try:
         book = Book.objects.select_related('category').get(id=book_id)
         
         # Tính rating trung bình
         avg_rating = Rating.objects.filter(book=book).aggregate(Avg('score'))['score__avg']
         
-        return JsonResponse({
+        return with_version(JsonResponse({
             'success': True,
-            'book': {
-                'id': book.id,
-                'title': book.title,
-                'author': book.author,
-                'price': float(book.price),
-                'stock_quantity': book.stock_quantity,
-                'category_name': book.category.name,
-                'category_id': book.category.id,
-                'average_rating': float(avg_rating) if avg_rating else 0
-            }
-        })
+            'book': _book_data(book, avg_rating)
+        }), *version_headers(f'book-{book_id}', book.updated_at))
     except Book.DoesNotExist:
         return JsonResponse({'success': False, 'error': 'Book not found'}, status=404)
 
+# API: Toàn bộ dữ liệu của trang chi tiết sách trong một request
+@require_http_methods(["GET"])
+def get_book_page(request, book_id):
+    """
+    Dữ liệu trang chi tiết sách: sách, tổng hợp rating, trang rating mới nhất và sách tương tự
+
+    Thay cho 3 request get_book + get_book_ratings + recommend_similar_books: sách
+    được load một lần và dùng chung, rating trung bình / số rating tính bằng một aggregate.
+    Query params: ratings_page (từ 1), ratings_page_size (mặc định 10, tối đa 50).
+    """
+    try:
+        page = max(int(request.GET.get('ratings_page', 1)), 1)
+        page_size = min(max(int(request.GET.get('ratings_page_size', 10)), 1), 50)
+    except ValueError:
+        return JsonResponse({'success': False, 'error': 'ratings_page and ratings_page_size must be integers'}, status=400)
+    
+    try:
+        book = Book.objects.select_related('category').get(id=book_id)
+    except Book.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Book not found'}, status=404)
+    
+    avg_rating, total_ratings = BookDAO.get_rating_summary(book.id)
+    ratings = BookDAO.get_latest_ratings(book.id, (page - 1) * page_size, page_size)
+    
+    return JsonResponse({
+        'success': True,
+        'book': _book_data(book, avg_rating),
+        'ratings': {
+            'average_rating': float(avg_rating) if avg_rating else 0,
+            'total_ratings': total_ratings,
+            'page': page,
+            'page_size': page_size,
+            'has_more': page * page_size < total_ratings,
+            'items': [{
+                'id': r.id,
+                'score': float(r.score),
+                'customer_name': r.customer.name
+            } for r in ratings]
+        },
+        'similar_books': _similar_books_data(book)
+    })
+
 # API: Tìm kiếm sách theo title, author, category
 @require_http_methods(["GET"])
 def search_books(request):
@@ -104,16 +176,12 @@ def list_categories(request):
 @csrf_exempt
 @require_http_methods(["POST"])
 def add_rating(request, book_id):
-    """Khách hàng đánh giá sách"""
+    """Khách hàng đánh giá sách (đánh giá lại thì cập nhật score)"""
     try:
         data = json.loads(request.body)
         book = Book.objects.get(id=book_id)
         
-        rating = Rating.objects.create(
-            score=data['score'],
-            book=book,
-            customer_id=data['customer_id']
-        )
+        rating = RatingDAO.upsert_rating(data['customer_id'], book.id, data['score'])
         
         return JsonResponse({
             'id': rating.id,
@@ -122,6 +190,40 @@ def add_rating(request, book_id):
     except Book.DoesNotExist:
         return JsonResponse({'error': 'Book not found'}, status=404)
 
+# API: Nhân viên import rating hàng loạt từ file CSV / NDJSON
+@csrf_exempt
+@require_http_methods(["POST"])
+def import_ratings(request):
+    """
+    Import rating hàng loạt (feed của đối tác)
+
+    Body: file multipart (field "file") hoặc nội dung file thô.
+    Định dạng: ?format=csv|ndjson, mặc định đoán theo tên file / Content-Type.
+    CSV cần header customer_id,book_id,score. ?dry_run=1 chỉ kiểm tra dữ liệu.
+    """
+    upload = request.FILES.get('file')
+    if upload is not None:
+        lines, name = upload, upload.name
+    else:
+        # Đọc body theo từng dòng, không nạp cả file vào bộ nhớ
+        lines, name = request, ''
+    
+    fmt = request.GET.get('format') or detect_format(name, request.content_type)
+    if fmt not in FEED_FORMATS:
+        return JsonResponse({'success': False, 'error': f'Unsupported format: {fmt}'}, status=400)
+    
+    try:
+        chunk_size = min(int(request.GET.get('chunk_size', RATING_IMPORT_CHUNK_SIZE)), RATING_IMPORT_CHUNK_SIZE)
+        summary = RatingDAO.import_ratings(
+            parse_feed_lines(lines, fmt),
+            chunk_size=max(chunk_size, 1),
+            dry_run=request.GET.get('dry_run') in ('1', 'true')
+        )
+    except (ValueError, csv.Error) as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+    
+    return JsonResponse({'success': True, **summary})
+
 # ==================== STAFF BOOK MANAGEMENT APIs ====================
 
 # API: Nhân viên thêm sách mới vào kho
@@ -161,6 +263,53 @@ def add_book_to_inventory(request):
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=400)
 
+# API: Nhân viên import catalog sách hàng loạt từ file CSV / NDJSON
+@csrf_exempt
+@require_http_methods(["POST"])
+def import_catalog(request):
+    """
+    Import catalog hàng loạt: dòng có id cập nhật sách đã có, dòng không có id tạo sách mới
+
+    Body: file multipart (field "file") hoặc nội dung file thô.
+    Cột: id,title,author,price,stock_quantity,category (tên category).
+    ?format=csv|ndjson (mặc định đoán theo tên file / Content-Type), ?dry_run=1 chỉ kiểm tra.
+    """
+    upload = request.FILES.get('file')
+    if upload is not None:
+        lines, name = upload, upload.name
+    else:
+        # Đọc body theo từng dòng, không nạp cả file vào bộ nhớ
+        lines, name = request, ''
+    
+    fmt = request.GET.get('format') or detect_format(name, request.content_type)
+    if fmt not in FEED_FORMATS:
+        return JsonResponse({'success': False, 'error': f'Unsupported format: {fmt}'}, status=400)
+    
+    try:
+        summary = CatalogDAO.import_catalog(
+            parse_feed_lines(lines, fmt),
+            dry_run=request.GET.get('dry_run') in ('1', 'true')
+        )
+    except (ValueError, csv.Error) as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+    
+    return JsonResponse({'success': True, **summary})
+
+# API: Nhân viên export toàn bộ catalog (stream, không dựng cả file trong bộ nhớ)
+@require_http_methods(["GET"])
+def export_catalog(request):
+    """Export catalog dạng CSV (mặc định) hoặc NDJSON (?format=ndjson)"""
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in FEED_FORMATS:
+        return JsonResponse({'success': False, 'error': f'Unsupported format: {fmt}'}, status=400)
+    
+    response = StreamingHttpResponse(
+        CatalogDAO.export_catalog(fmt),
+        content_type='text/csv; charset=utf-8' if fmt == 'csv' else 'application/x-ndjson; charset=utf-8'
+    )
+    response['Content-Disposition'] = f'attachment; filename="catalog.{fmt}"'
+    return response
+
 # API: Nhân viên cập nhật số lượng sách trong kho
 @csrf_exempt
 @require_http_methods(["PUT", "PATCH"])
@@ -179,6 +328,7 @@ def update_book_stock(request, book_id):
             book.stock_quantity += data['add_quantity']
         
         book.save()
+        CartDAO.invalidate_carts_with_books([book.id])
         
         return JsonResponse({
             'success': True,
@@ -216,6 +366,7 @@ def update_book(request, book_id):
             book.category = category
         
         book.save()
+        CartDAO.invalidate_carts_with_books([book.id])
         
         return JsonResponse({
             'success': True,
@@ -236,6 +387,7 @@ def delete_book(request, book_id):
     """Nhân viên xóa sách khỏi kho"""
     try:
         book = Book.objects.get(id=book_id)
+        CartDAO.invalidate_carts_with_books([book.id])
         book.delete()
         return JsonResponse({'success': True, 'message': 'Book deleted successfully'})
     except Book.DoesNotExist:
@@ -279,6 +431,20 @@ import json
 def recommend_books_by_history(request, customer_id):
     """Gợi ý sách dựa trên lịch sử mua hàng của khách hàng"""
     try:
+        # Danh sách tính sẵn (precompute_recommendations); cold user mới truy vấn trực tiếp
+        precomputed = RecommendationDAO.get_precomputed(customer_id, HISTORY, 10)
+        if precomputed is not None:
+            data = [{
+                'id': book.id,
+                'title': book.title,
+                'author': book.author,
+                'price': float(book.price),
+                'category_name': book.category.name,
+                'average_rating': float(book.avg_rating) if book.avg_rating else 0,
+                'reason': 'Based on your purchase history'
+            } for book in RecommendationDAO.get_books_in_order(precomputed[0])]
+            return JsonResponse({'success': True, 'recommendations': data})
+        
         # Lấy các categories mà customer đã mua
         purchased_categories = Category.objects.filter(
             book__orderitem__order__customer_id=customer_id
@@ -378,6 +544,18 @@ def recommend_books_by_popular_category(request):
     except Exception as e:
         return JsonResponse({'success': False, 'error': str(e)}, status=400)
 
+def _similar_books_data(book):
+    """Sách cùng author hoặc cùng category của một sách đã load"""
+    return [{
+        'id': b.id,
+        'title': b.title,
+        'author': b.author,
+        'price': float(b.price),
+        'category_name': b.category.name,
+        'average_rating': float(b.avg_rating) if b.avg_rating else 0,
+        'similarity': 'Same author' if b.author == book.author else 'Same category'
+    } for b in BookDAO.get_similar_books(book)]
+
 # API: Gợi ý sách tương tự (cùng author hoặc category)
 @require_http_methods(["GET"])
 def recommend_similar_books(request, book_id):
@@ -386,23 +564,7 @@ def recommend_similar_books(request, book_id):
         book = Book.objects.select_related('category').get(id=book_id)
         
         # Tìm sách cùng author hoặc cùng category
-        similar_books = Book.objects.filter(
-            Q(author=book.author) | Q(category=book.category)
-        ).exclude(
-            id=book_id
-        ).select_related('category').annotate(
-            avg_rating=Avg('rating__score')
-        ).order_by('-avg_rating')[:10]
-        
-        data = [{
-            'id': b.id,
-            'title': b.title,
-            'author': b.author,
-            'price': float(b.price),
-            'category_name': b.category.name,
-            'average_rating': float(b.avg_rating) if b.avg_rating else 0,
-            'similarity': 'Same author' if b.author == book.author else 'Same category'
-        } for b in similar_books]
+        data = _similar_books_data(book)
         
         return JsonResponse({'success': True, 'similar_books': data})
     except Book.DoesNotExist:
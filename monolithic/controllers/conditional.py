@@ -0,0 +1,22 @@
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+# Conditional GET dùng chung cho các controller: ETag / Last-Modified tính từ updated_at
+
+
+def version_headers(key, updated_at):
+    """ETag và Last-Modified (giây epoch) từ phiên bản (updated_at) của dữ liệu"""
+    timestamp = updated_at.timestamp() if updated_at else 0
+    return quote_etag(f'{key}-{int(timestamp * 1000000)}'), int(timestamp)
+
+
+def not_modified(request, etag, last_modified):
+    """Response 304 nếu client đang giữ đúng phiên bản (If-None-Match / If-Modified-Since), ngược lại None"""
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def with_version(response, etag, last_modified):
+    """Gắn ETag và Last-Modified vào response"""
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return response
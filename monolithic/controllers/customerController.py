@@ -154,55 +154,19 @@ def logout_api(request):
     """API đăng xuất"""
     return JsonResponse({'success': True, 'message': 'Đã đăng xuất!'})
 
-from django.http import JsonResponse
+from django.http import JsonResponse, HttpResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from store.models import Cart, CartItem, Book, Customer
+from dao.cartDAO import CartDAO, CartOperationError
 import json
 # API: Lấy giỏ hàng hiện tại của khách hàng
 @require_http_methods(["GET"])
 def get_cart(request, customer_id):
-    """Lấy giỏ hàng active của khách hàng"""
+    """Lấy giỏ hàng active của khách hàng (đọc từ snapshot đã tính sẵn trong cache)"""
     try:
-        # Lấy cart active của customer
-        cart = Cart.objects.filter(customer_id=customer_id, is_active=True).first()
-        
-        if not cart:
-            return JsonResponse({
-                'success': True,
-                'cart': {
-                    'id': None,
-                    'customer_id': customer_id,
-                    'items': [],
-                    'total': 0
-                },
-                'message': 'No active cart found'
-            })
-        
-        # Lấy các items trong cart
-        cart_items = CartItem.objects.filter(cart=cart).select_related('book', 'book__category')
-        
-        items = [{
-            'id': item.id,
-            'book_id': item.book.id,
-            'book_title': item.book.title,
-            'book_price': float(item.book.price),
-            'book_stock': item.book.stock_quantity,
-            'quantity': item.quantity,
-            'subtotal': float(item.book.price * item.quantity)
-        } for item in cart_items]
-        
-        total = sum(item['subtotal'] for item in items)
-        
-        return JsonResponse({
-            'success': True,
-            'cart': {
-                'id': cart.id,
-                'customer_id': customer_id,
-                'items': items,
-                'total': total
-            }
-        })
+        snapshot = CartDAO.get_cart_snapshot(customer_id)
+        return HttpResponse(snapshot, content_type='application/json')
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=400)
 
@@ -222,6 +186,7 @@ def create_cart(request, customer_id):
             customer=customer,
             is_active=True
         )
+        CartDAO.invalidate_cart(customer.id)
         
         return JsonResponse({
             'cart_id': cart.id,
@@ -240,52 +205,50 @@ def add_to_cart(request):
     """Thêm sách vào giỏ hàng"""
     try:
         data = json.loads(request.body)
-        customer_id = data.get('customer_id')
-        customer = Customer.objects.get(id=customer_id)
-        book = Book.objects.get(id=data['book_id'])
-        quantity = data.get('quantity', 1)
+        customer_id = int(data.get('customer_id'))
+        book_id = int(data['book_id'])
+        quantity = int(data.get('quantity', 1))
         
-        # Kiểm tra stock
-        if book.stock_quantity < quantity:
-            return JsonResponse({
-                'error': 'Not enough stock',
-                'available': book.stock_quantity
-            }, status=400)
+        if quantity < 1:
+            return JsonResponse({'error': 'Quantity must be at least 1'}, status=400)
         
-        # Lấy hoặc tạo cart active
-        cart, created = Cart.objects.get_or_create(
-            customer=customer,
-            is_active=True
-        )
+        # Đường nhanh: một lệnh upsert có điều kiện tồn kho
+        row = CartDAO.upsert_cart_item(customer_id, book_id, quantity)
         
-        # Kiểm tra xem sách đã có trong cart chưa
-        cart_item, created = CartItem.objects.get_or_create(
-            cart=cart,
-            book=book,
-            defaults={'quantity': quantity}
-        )
+        if row is None and not Cart.objects.filter(customer_id=customer_id, is_active=True).exists():
+            # Chưa có cart active -> tạo cart rồi thử lại
+            customer = Customer.objects.get(id=customer_id)
+            Cart.objects.create(customer=customer, is_active=True)
+            row = CartDAO.upsert_cart_item(customer_id, book_id, quantity)
         
-        if not created:
-            # Nếu đã có, cộng thêm quantity
-            cart_item.quantity += quantity
-            
-            # Kiểm tra stock lại
-            if book.stock_quantity < cart_item.quantity:
-                return JsonResponse({
-                    'error': 'Not enough stock',
-                    'available': book.stock_quantity,
-                    'current_in_cart': cart_item.quantity - quantity
-                }, status=400)
+        if row is None:
+            # Sách không tồn tại hoặc không đủ stock
+            book = Book.objects.get(id=book_id)
+            current_in_cart = CartItem.objects.filter(
+                cart__customer_id=customer_id,
+                cart__is_active=True,
+                book=book
+            ).values_list('quantity', flat=True).first()
             
-            cart_item.save()
+            response = {
+                'error': 'Not enough stock',
+                'available': book.stock_quantity
+            }
+            if current_in_cart:
+                response['current_in_cart'] = current_in_cart
+            return JsonResponse(response, status=400)
+        
+        item_id, cart_id, item_quantity, created = row
+        
+        CartDAO.invalidate_cart(customer_id)
         
         return JsonResponse({
             'success': True,
             'cart_item': {
-                'id': cart_item.id,
-                'cart_id': cart.id,
-                'book_id': book.id,
-                'quantity': cart_item.quantity
+                'id': item_id,
+                'cart_id': cart_id,
+                'book_id': book_id,
+                'quantity': item_quantity
             },
             'message': 'Book added to cart successfully'
         }, status=201 if created else 200)
@@ -304,7 +267,7 @@ def update_cart_item(request):
     try:
         data = json.loads(request.body)
         cart_item_id = data.get('item_id')
-        cart_item = CartItem.objects.get(id=cart_item_id)
+        cart_item = CartItem.objects.select_related('cart', 'book').get(id=cart_item_id)
         
         new_quantity = data['quantity']
         
@@ -317,6 +280,7 @@ def update_cart_item(request):
         
         cart_item.quantity = new_quantity
         cart_item.save()
+        CartDAO.invalidate_cart(cart_item.cart.customer_id)
         
         return JsonResponse({
             'success': True,
@@ -331,6 +295,25 @@ def update_cart_item(request):
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=400)
 
+# API: Cập nhật nhiều sách trong giỏ hàng cùng lúc
+@csrf_exempt
+@require_http_methods(["PATCH"])
+def bulk_update_cart_items(request):
+    """Áp dụng lô thao tác add / set / remove lên giỏ hàng trong một transaction"""
+    try:
+        data = json.loads(request.body)
+        customer = Customer.objects.get(id=data.get('customer_id'))
+        CartDAO.apply_operations(customer, data.get('operations'))
+        
+        snapshot = CartDAO.get_cart_snapshot(customer.id)
+        return HttpResponse(snapshot, content_type='application/json')
+    except Customer.DoesNotExist:
+        return JsonResponse({'error': 'Customer not found'}, status=404)
+    except CartOperationError as e:
+        return JsonResponse({'error': 'Invalid cart operations', 'details': e.errors}, status=400)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
 # API: Xóa sách khỏi giỏ hàng
 @csrf_exempt
 @require_http_methods(["DELETE"])
@@ -339,8 +322,9 @@ def remove_from_cart(request):
     try:
         data = json.loads(request.body)
         cart_item_id = data.get('item_id')
-        cart_item = CartItem.objects.get(id=cart_item_id)
+        cart_item = CartItem.objects.select_related('cart').get(id=cart_item_id)
         cart_item.delete()
+        CartDAO.invalidate_cart(cart_item.cart.customer_id)
         return JsonResponse({'success': True, 'message': 'Item removed from cart successfully'})
     except CartItem.DoesNotExist:
         return JsonResponse({'error': 'Cart item not found'}, status=404)
@@ -353,6 +337,7 @@ def clear_cart(request, customer_id):
     try:
         cart = Cart.objects.get(customer_id=customer_id, is_active=True)
         CartItem.objects.filter(cart=cart).delete()
+        CartDAO.invalidate_cart(customer_id)
         return JsonResponse({'message': 'Cart cleared successfully'})
     except Cart.DoesNotExist:
         return JsonResponse({'error': 'Active cart not found'}, status=404)
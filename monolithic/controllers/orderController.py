@@ -3,6 +3,8 @@ from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.db import transaction
 from store.models import Order, OrderItem, Cart, CartItem, Shipping, Payment, Book
+from dao.analyticsDAO import AnalyticsDAO
+from dao.cartDAO import CartDAO
 import json
 from datetime import datetime
 
@@ -137,13 +139,24 @@ def create_order_from_cart(request, customer_id):
                 OrderItem.objects.create(
                     order=order,
                     book=cart_item.book,
-                    quantity=cart_item.quantity
+                    quantity=cart_item.quantity,
+                    price=cart_item.book.price
                 )
                 
                 # Giảm stock
                 cart_item.book.stock_quantity -= cart_item.quantity
                 cart_item.book.save()
             
+            # Cập nhật bảng tổng hợp cho dashboard staff
+            AnalyticsDAO.record_order_created(
+                order,
+                [(cart_item.book_id, cart_item.quantity, cart_item.book.price) for cart_item in cart_items]
+            )
+            
+            # Giỏ hàng đã checkout + giỏ của khách khác có cùng sách (tồn kho đã giảm)
+            CartDAO.invalidate_cart(customer_id)
+            CartDAO.invalidate_carts_with_books([cart_item.book_id for cart_item in cart_items])
+            
             # Xóa cart items và deactivate cart
             cart_items.delete()
             cart.is_active = False
@@ -174,12 +187,18 @@ def create_order_from_cart(request, customer_id):
 def update_order_status(request, order_id):
     """Nhân viên cập nhật trạng thái đơn hàng"""
     try:
-        order = Order.objects.get(id=order_id)
         data = json.loads(request.body)
         
-        if 'status' in data:
-            order.status = data['status']
-            order.save()
+        with transaction.atomic():
+            order = Order.objects.select_for_update().get(id=order_id)
+            
+            if 'status' in data and data['status'] != order.status:
+                old_status = order.status
+                order.status = data['status']
+                order.save()
+                
+                # Cập nhật bảng tổng hợp cho dashboard staff
+                AnalyticsDAO.record_status_change(order, old_status, order.status)
         
         return JsonResponse({
             'success': True,
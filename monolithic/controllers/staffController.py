@@ -1,6 +1,7 @@
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from store.models import Staff
+from dao.analyticsDAO import AnalyticsDAO
 
 # API: Lấy danh sách nhân viên
 @require_http_methods(["GET"])
@@ -27,3 +28,56 @@ def get_staff(request, staff_id):
         })
     except Staff.DoesNotExist:
         return JsonResponse({'error': 'Staff not found'}, status=404)
+
+# API: Thống kê cho dashboard của nhân viên
+@require_http_methods(["GET"])
+def get_dashboard_analytics(request):
+    """
+    Thống kê đơn hàng theo trạng thái, doanh thu theo ngày, sách bán chạy và sách sắp hết hàng.
+
+    Đọc từ các bảng tổng hợp (OrderStatusSummary, DailyRevenue, BookSalesSummary)
+    thay vì quét bảng Order / OrderItem.
+    """
+    try:
+        days = int(request.GET.get('days', 30))
+        top_limit = int(request.GET.get('top', 10))
+        low_stock_threshold = int(request.GET.get('low_stock_threshold', 10))
+
+        orders_per_status = [{
+            'status': s.status,
+            'order_count': s.order_count,
+            'revenue': float(s.revenue)
+        } for s in AnalyticsDAO.get_orders_per_status()]
+
+        revenue_per_day = [{
+            'date': str(d.date),
+            'order_count': d.order_count,
+            'revenue': float(d.revenue)
+        } for d in AnalyticsDAO.get_revenue_per_day(days)]
+
+        top_books = [{
+            'book_id': b.book_id,
+            'title': b.book.title,
+            'author': b.book.author,
+            'units_sold': b.units_sold,
+            'revenue': float(b.revenue)
+        } for b in AnalyticsDAO.get_top_books(top_limit)]
+
+        low_stock = [{
+            'book_id': book.id,
+            'title': book.title,
+            'stock_quantity': book.stock_quantity
+        } for book in AnalyticsDAO.get_low_stock_books(low_stock_threshold)]
+
+        return JsonResponse({
+            'success': True,
+            'analytics': {
+                'orders_per_status': orders_per_status,
+                'revenue_per_day': revenue_per_day,
+                'top_books': top_books,
+                'low_stock': low_stock,
+                'low_stock_threshold': low_stock_threshold
+            }
+        })
+    except ValueError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
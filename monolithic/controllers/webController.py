@@ -0,0 +1,121 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, Http404
+from django.template.loader import render_to_string
+from django.utils.http import urlencode
+from django.views.decorators.http import require_http_methods
+from django.db.models import Q
+from store.models import Book
+from dao.bookDAO import BookDAO
+from dao.categoryDAO import CategoryDAO
+import hashlib
+
+# Số rating mới nhất hiển thị trên trang chi tiết sách
+DETAIL_RATINGS_PAGE_SIZE = 10
+
+# Số sách mỗi trang catalog
+CATALOG_PAGE_SIZE = 24
+# Chỉ cache các trang đầu - trang sâu hơn ít được xem, render trực tiếp
+MAX_CACHED_CATALOG_PAGE = 20
+# Từ khóa tìm kiếm được cắt bớt để key cache không dài tùy ý
+SEARCH_QUERY_MAX_LENGTH = 100
+
+
+def _normalize_query(query):
+    """
+    Chuẩn hóa từ khóa tìm kiếm: gộp khoảng trắng, chữ thường, giới hạn độ dài.
+    icontains không phân biệt hoa thường nên kết quả không đổi, còn các biến thể
+    của cùng một từ khóa dùng chung một key cache.
+    """
+    return ' '.join(query.split()).lower()[:SEARCH_QUERY_MAX_LENGTH]
+
+
+def _page_number(value):
+    """Số trang từ query string (từ 1), giá trị không hợp lệ -> trang 1"""
+    return max(int(value), 1) if value.isdigit() else 1
+
+
+def _page_key(page, *parts):
+    """
+    Key cache của một trang: gồm phiên bản dữ liệu của trang (updated_at mới nhất,
+    số sách) nên trang cũ tự hết hiệu lực khi có sách / rating liên quan thay đổi
+    """
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'web:{page}:{digest}'
+
+
+def _cached_page(key, render):
+    """
+    Trả HTML đã cache, hoặc render rồi cache lại
+
+    Trang không chứa gì riêng của người dùng (đăng nhập nằm ở localStorage phía
+    client) nên mọi request dùng chung một bản cache.
+    """
+    html = cache.get(key)
+    if html is None:
+        html = render()
+        cache.set(key, html, settings.WEB_PAGE_CACHE_TTL)
+    return HttpResponse(html)
+
+
+# Trang chủ / catalog: danh sách sách render phía server
+@require_http_methods(["GET"])
+def catalog(request):
+    """Danh sách sách theo trang (?page=), lọc theo ?q= (title / author) và ?category= (ID)"""
+    query = _normalize_query(request.GET.get('q', ''))
+    category_id = request.GET.get('category', '')
+    if not category_id.isdigit():
+        category_id = ''
+    page = _page_number(request.GET.get('page', ''))
+
+    def render():
+        books = Book.objects.select_related('category').order_by('id')
+        if query:
+            books = books.filter(Q(title__icontains=query) | Q(author__icontains=query))
+        if category_id:
+            books = books.filter(category_id=category_id)
+        # Lấy thêm một sách để biết còn trang sau, không cần COUNT
+        offset = (page - 1) * CATALOG_PAGE_SIZE
+        books = list(books[offset:offset + CATALOG_PAGE_SIZE + 1])
+        filters = {key: value for key, value in (('q', query), ('category', category_id)) if value}
+        return render_to_string('book/list.html', {
+            'books': books[:CATALOG_PAGE_SIZE],
+            'categories': CategoryDAO.get_all_categories(),
+            'query': query,
+            'category_id': int(category_id) if category_id else None,
+            'page': page,
+            'previous_page_url': f'?{urlencode({**filters, "page": page - 1})}' if page > 1 else None,
+            'next_page_url': f'?{urlencode({**filters, "page": page + 1})}' if len(books) > CATALOG_PAGE_SIZE else None,
+            'fragment_ttl': settings.WEB_FRAGMENT_CACHE_TTL,
+        })
+
+    if page > MAX_CACHED_CATALOG_PAGE:
+        return HttpResponse(render())
+
+    updated_at, count = BookDAO.get_catalog_version()
+    return _cached_page(_page_key('catalog', updated_at, count, query, category_id, page), render)
+
+
+# Trang chi tiết sách render phía server
+@require_http_methods(["GET"])
+def book_detail(request, book_id):
+    """Chi tiết sách, rating mới nhất và sách tương tự (cùng dữ liệu với GET /api/books/<id>/page/)"""
+    try:
+        book = Book.objects.select_related('category').get(id=book_id)
+    except Book.DoesNotExist:
+        raise Http404('Book not found')
+    # Chỉ phụ thuộc vào sách này và các sách tương tự, không vào cả catalog
+    updated_at, count = BookDAO.get_book_page_version(book)
+
+    def render():
+        avg_rating, total_ratings = BookDAO.get_rating_summary(book.id)
+        return render_to_string('book/detail.html', {
+            'book': book,
+            'average_rating': float(avg_rating) if avg_rating else 0,
+            'total_ratings': total_ratings,
+            'ratings': BookDAO.get_latest_ratings(book.id, 0, DETAIL_RATINGS_PAGE_SIZE),
+            'similar_books': BookDAO.get_similar_books(book),
+            'fragment_ttl': settings.WEB_FRAGMENT_CACHE_TTL,
+        })
+
+    return _cached_page(_page_key('book', updated_at, count, book_id), render)
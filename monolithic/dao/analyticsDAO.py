@@ -0,0 +1,155 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.db import transaction, IntegrityError
+from django.db.models import F, Sum, Count, DecimalField
+from django.utils import timezone
+from store.models import (
+    Book, Order, OrderItem,
+    OrderStatusSummary, DailyRevenue, BookSalesSummary
+)
+
+# Đơn hàng ở các trạng thái này không được tính vào doanh thu / số lượng bán
+EXCLUDED_STATUSES = {'Cancelled'}
+
+
+class AnalyticsDAO:
+    """
+    DAO cho các bảng tổng hợp của dashboard staff.
+
+    Các bảng được cập nhật tăng dần (F() + delta) khi tạo đơn / đổi trạng thái,
+    nên các hàm đọc chỉ chạm vào vài dòng đã tính sẵn.
+    """
+
+    @staticmethod
+    def _increment(model, lookup, **deltas):
+        """Cộng delta vào dòng tổng hợp, tạo dòng mới nếu chưa có"""
+        changes = {field: F(field) + delta for field, delta in deltas.items()}
+        if model.objects.filter(**lookup).update(**changes):
+            return
+        try:
+            with transaction.atomic():
+                model.objects.create(**lookup, **deltas)
+        except IntegrityError:
+            # Request khác vừa tạo dòng này -> cộng dồn vào dòng đó
+            model.objects.filter(**lookup).update(**changes)
+
+    @staticmethod
+    def _apply_sales(order, items, sign):
+        """Cộng (sign=1) hoặc trừ (sign=-1) doanh thu ngày và số lượng bán của từng sách"""
+        AnalyticsDAO._increment(
+            DailyRevenue, {'date': order.order_date},
+            order_count=sign,
+            revenue=sign * order.total_price
+        )
+        for book_id, quantity, price in items:
+            AnalyticsDAO._increment(
+                BookSalesSummary, {'book_id': book_id},
+                units_sold=sign * quantity,
+                revenue=sign * price * quantity
+            )
+
+    @staticmethod
+    def record_order_created(order, items):
+        """
+        Ghi nhận đơn hàng mới vào các bảng tổng hợp
+
+        items: danh sách (book_id, quantity, price) của đơn hàng - price là đơn giá lúc đặt hàng
+        """
+        AnalyticsDAO._increment(
+            OrderStatusSummary, {'status': order.status},
+            order_count=1,
+            revenue=order.total_price
+        )
+        if order.status not in EXCLUDED_STATUSES:
+            AnalyticsDAO._apply_sales(order, items, 1)
+
+    @staticmethod
+    def record_status_change(order, old_status, new_status):
+        """Chuyển đơn hàng từ trạng thái cũ sang trạng thái mới trong các bảng tổng hợp"""
+        if old_status == new_status:
+            return
+
+        AnalyticsDAO._increment(
+            OrderStatusSummary, {'status': old_status},
+            order_count=-1,
+            revenue=-order.total_price
+        )
+        AnalyticsDAO._increment(
+            OrderStatusSummary, {'status': new_status},
+            order_count=1,
+            revenue=order.total_price
+        )
+
+        was_counted = old_status not in EXCLUDED_STATUSES
+        is_counted = new_status not in EXCLUDED_STATUSES
+        if was_counted != is_counted:
+            # Chỉ khi hủy / khôi phục đơn mới cần đọc lại các dòng của đơn hàng
+            items = OrderItem.objects.filter(order=order).values_list('book_id', 'quantity', 'price')
+            AnalyticsDAO._apply_sales(order, items, 1 if is_counted else -1)
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild():
+        """Tính lại toàn bộ bảng tổng hợp từ Order / OrderItem (dùng khi khởi tạo dữ liệu)"""
+        OrderStatusSummary.objects.all().delete()
+        DailyRevenue.objects.all().delete()
+        BookSalesSummary.objects.all().delete()
+
+        OrderStatusSummary.objects.bulk_create([
+            OrderStatusSummary(
+                status=row['status'],
+                order_count=row['order_count'],
+                revenue=row['revenue'] or Decimal('0')
+            )
+            for row in Order.objects.values('status').annotate(
+                order_count=Count('id'), revenue=Sum('total_price')
+            )
+        ])
+
+        counted_orders = Order.objects.exclude(status__in=EXCLUDED_STATUSES)
+        DailyRevenue.objects.bulk_create([
+            DailyRevenue(
+                date=row['order_date'],
+                order_count=row['order_count'],
+                revenue=row['revenue'] or Decimal('0')
+            )
+            for row in counted_orders.values('order_date').annotate(
+                order_count=Count('id'), revenue=Sum('total_price')
+            )
+        ])
+
+        BookSalesSummary.objects.bulk_create([
+            BookSalesSummary(
+                book_id=row['book_id'],
+                units_sold=row['units_sold'] or 0,
+                revenue=row['revenue'] or Decimal('0')
+            )
+            for row in OrderItem.objects.filter(order__in=counted_orders).values('book_id').annotate(
+                units_sold=Sum('quantity'),
+                revenue=Sum(
+                    F('quantity') * F('price'),
+                    output_field=DecimalField(max_digits=14, decimal_places=2)
+                )
+            )
+        ])
+
+    @staticmethod
+    def get_orders_per_status():
+        return OrderStatusSummary.objects.order_by('status')
+
+    @staticmethod
+    def get_revenue_per_day(days=30):
+        start_date = timezone.now().date() - timedelta(days=days - 1)
+        return DailyRevenue.objects.filter(date__gte=start_date).order_by('date')
+
+    @staticmethod
+    def get_top_books(limit=10):
+        return BookSalesSummary.objects.filter(
+            units_sold__gt=0
+        ).select_related('book').order_by('-units_sold')[:limit]
+
+    @staticmethod
+    def get_low_stock_books(threshold=10, limit=20):
+        return Book.objects.filter(
+            stock_quantity__lt=threshold
+        ).order_by('stock_quantity')[:limit]
@@ -0,0 +1,76 @@
+from django.db.models import Avg, Count, Max, Q
+from django.utils import timezone
+from store.models import Book, Rating
+
+
+class BookDAO:
+    """
+    DAO cho phiên bản (updated_at) của sách, dùng cho ETag / Last-Modified.
+
+    Các truy vấn ở đây chỉ đọc cột updated_at (có index), không load cả dòng,
+    nên request có điều kiện trả 304 mà không cần serialize gì.
+    """
+
+    @staticmethod
+    def get_version(book_id):
+        """updated_at của một sách, None nếu không có sách"""
+        return Book.objects.filter(id=book_id).values_list('updated_at', flat=True).first()
+
+    @staticmethod
+    def get_catalog_version():
+        """(updated_at mới nhất, số sách) của cả catalog - số sách đổi khi có sách bị xóa"""
+        version = Book.objects.aggregate(updated_at=Max('updated_at'), count=Count('id'))
+        return version['updated_at'], version['count']
+
+    @staticmethod
+    def get_book_page_version(book):
+        """
+        (updated_at mới nhất, số sách) của sách và các sách có thể nằm trong
+        get_similar_books (cùng author hoặc cùng category) - trang chi tiết không
+        phụ thuộc vào phần còn lại của catalog
+        """
+        version = Book.objects.filter(
+            Q(id=book.id) | Q(author=book.author) | Q(category_id=book.category_id)
+        ).aggregate(updated_at=Max('updated_at'), count=Count('id'))
+        return version['updated_at'], version['count']
+
+    @staticmethod
+    def touch(book_ids=None, category_id=None):
+        """
+        Tăng phiên bản của sách khi dữ liệu hiển thị kèm sách thay đổi
+        (rating trung bình, tên category) mà bản thân dòng sách không đổi
+        """
+        books = Book.objects.all()
+        if book_ids is not None:
+            books = books.filter(id__in=list(book_ids))
+        if category_id is not None:
+            books = books.filter(category_id=category_id)
+        return books.update(updated_at=timezone.now())
+
+    @staticmethod
+    def get_rating_summary(book_id):
+        """(rating trung bình hoặc None, số rating) - một truy vấn aggregate"""
+        summary = Rating.objects.filter(book_id=book_id).aggregate(average=Avg('score'), total=Count('id'))
+        return summary['average'], summary['total']
+
+    @staticmethod
+    def get_latest_ratings(book_id, offset=0, limit=10):
+        """Một trang rating mới nhất của sách (kèm khách hàng)"""
+        return list(
+            Rating.objects.filter(book_id=book_id).select_related('customer').order_by('-id')[offset:offset + limit]
+        )
+
+    @staticmethod
+    def get_similar_books(book, limit=10):
+        """
+        Sách cùng author hoặc cùng category, rating cao trước
+
+        book: sách đã load (cần author và category_id) - không đọc lại sách gốc
+        """
+        return Book.objects.filter(
+            Q(author=book.author) | Q(category_id=book.category_id)
+        ).exclude(
+            id=book.id
+        ).select_related('category').annotate(
+            avg_rating=Avg('rating__score')
+        ).order_by('-avg_rating')[:limit]
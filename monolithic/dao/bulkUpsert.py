@@ -0,0 +1,24 @@
+from django.db import connections, router
+
+
+def bulk_upsert(model, objs, unique_fields, update_fields, batch_size=None):
+    """
+    INSERT nhiều dòng, dòng trùng khóa unique thì cập nhật update_fields
+
+    PostgreSQL / SQLite sinh ON CONFLICT (unique_fields) DO UPDATE. MySQL chỉ có
+    ON DUPLICATE KEY UPDATE (áp dụng cho mọi unique index, không nhận danh sách cột)
+    nên unique_fields chỉ được truyền khi DB hỗ trợ - bảng phải có unique
+    constraint trên đúng unique_fields.
+    MySQL không trả về pk của dòng vừa ghi: cần id thì đọc lại theo unique_fields.
+    """
+    connection = connections[router.db_for_write(model)]
+    conflict_target = {}
+    if connection.features.supports_update_conflicts_with_target:
+        conflict_target['unique_fields'] = unique_fields
+    return model.objects.bulk_create(
+        objs,
+        batch_size=batch_size,
+        update_conflicts=True,
+        update_fields=update_fields,
+        **conflict_target
+    )
@@ -0,0 +1,306 @@
+import json
+from django.core.cache import cache
+from django.db import connection, transaction
+from store.models import Book, Cart, CartItem
+
+# Snapshot giỏ hàng được lưu sẵn dưới dạng JSON trong cache.
+# TTL chỉ là lưới an toàn - snapshot bị xóa ngay khi giỏ hàng hoặc sách trong giỏ thay đổi.
+CART_SNAPSHOT_TTL = 300
+
+
+# Số thao tác tối đa trong một request PATCH /api/cart/items/
+MAX_CART_OPERATIONS = 100
+CART_OPERATIONS = ('add', 'set', 'remove')
+
+
+class _StockExceeded(Exception):
+    """Dùng nội bộ để rollback upsert khi số lượng trong giỏ vượt tồn kho"""
+
+
+class CartOperationError(Exception):
+    """Lô thao tác giỏ hàng không hợp lệ - không thao tác nào được ghi"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__('; '.join(error['error'] for error in errors))
+
+
+class CartDAO:
+
+    @staticmethod
+    def _snapshot_key(customer_id):
+        return f'cart_snapshot:{customer_id}'
+
+    @staticmethod
+    def build_cart_snapshot(customer_id):
+        """Đọc giỏ hàng active từ DB và trả về JSON (bytes) của response get_cart"""
+        cart = Cart.objects.filter(customer_id=customer_id, is_active=True).first()
+
+        if not cart:
+            data = {
+                'success': True,
+                'cart': {
+                    'id': None,
+                    'customer_id': customer_id,
+                    'items': [],
+                    'total': 0
+                },
+                'message': 'No active cart found'
+            }
+        else:
+            cart_items = CartItem.objects.filter(cart=cart).select_related('book')
+
+            items = [{
+                'id': item.id,
+                'book_id': item.book.id,
+                'book_title': item.book.title,
+                'book_price': float(item.book.price),
+                'book_stock': item.book.stock_quantity,
+                'quantity': item.quantity,
+                'subtotal': float(item.book.price * item.quantity)
+            } for item in cart_items]
+
+            data = {
+                'success': True,
+                'cart': {
+                    'id': cart.id,
+                    'customer_id': customer_id,
+                    'items': items,
+                    'total': sum(item['subtotal'] for item in items)
+                }
+            }
+
+        return json.dumps(data).encode('utf-8')
+
+    @staticmethod
+    def get_cart_snapshot(customer_id):
+        """Lấy JSON giỏ hàng từ cache, build lại nếu chưa có"""
+        key = CartDAO._snapshot_key(customer_id)
+        snapshot = cache.get(key)
+        if snapshot is None:
+            snapshot = CartDAO.build_cart_snapshot(customer_id)
+            cache.set(key, snapshot, CART_SNAPSHOT_TTL)
+        return snapshot
+
+    @staticmethod
+    def invalidate_cart(*customer_ids):
+        """Xóa snapshot giỏ hàng sau khi transaction hiện tại commit"""
+        keys = [CartDAO._snapshot_key(customer_id) for customer_id in customer_ids]
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+    @staticmethod
+    def invalidate_carts_with_books(book_ids):
+        """Xóa snapshot của mọi giỏ hàng active đang chứa các sách này (giá / tồn kho thay đổi)"""
+        customer_ids = set(CartItem.objects.filter(
+            book_id__in=book_ids,
+            cart__is_active=True
+        ).values_list('cart__customer_id', flat=True))
+        if customer_ids:
+            CartDAO.invalidate_cart(*customer_ids)
+
+    @staticmethod
+    def _read_cart_item(cursor, customer_id, book_id):
+        """Đọc lại dòng giỏ hàng vừa ghi: (item_id, cart_id, quantity, stock_quantity)"""
+        item_table = CartItem._meta.db_table
+        cart_table = Cart._meta.db_table
+        book_table = Book._meta.db_table
+        cursor.execute(
+            f'SELECT i.id, i.cart_id, i.quantity, b.stock_quantity '
+            f'FROM {item_table} i '
+            f'JOIN {cart_table} c ON c.id = i.cart_id '
+            f'JOIN {book_table} b ON b.id = i.book_id '
+            f'WHERE c.customer_id = %s AND c.is_active = %s AND i.book_id = %s '
+            f'ORDER BY c.id DESC LIMIT 1',
+            [customer_id, True, book_id]
+        )
+        return cursor.fetchone()
+
+    @staticmethod
+    def upsert_cart_item(customer_id, book_id, quantity):
+        """
+        Thêm sách vào giỏ hàng active bằng lệnh INSERT ... SELECT có upsert.
+
+        Lệnh chỉ ghi khi khách hàng có giỏ active, sách tồn tại và tổng số lượng
+        trong giỏ không vượt tồn kho. Trả về (item_id, cart_id, quantity, created)
+        hoặc None nếu không ghi được - khi đó controller tự tìm lý do (đường chậm).
+        created lấy từ kết quả của DB (dòng được INSERT hay UPDATE), không đoán theo quantity.
+        """
+        item_table = CartItem._meta.db_table
+        cart_table = Cart._meta.db_table
+        book_table = Book._meta.db_table
+
+        # FROM cart, book (không dùng JOIN ... ON) và luôn có WHERE để SQLite
+        # không nhầm ON CONFLICT với điều kiện join
+        select_sql = (
+            f'SELECT c.id, b.id, %s FROM {cart_table} c, {book_table} b '
+            f'WHERE c.customer_id = %s AND c.is_active = %s '
+            f'AND b.id = %s AND b.stock_quantity >= %s '
+            f'ORDER BY c.id DESC LIMIT 1'
+        )
+        params = [quantity, customer_id, True, book_id, quantity]
+
+        with connection.cursor() as cursor:
+            if connection.vendor == 'mysql':
+                # MySQL không có RETURNING: upsert rồi đọc lại dòng vừa ghi trong cùng transaction,
+                # rollback nếu tổng số lượng vượt tồn kho (dòng đã bị khóa bởi lệnh upsert)
+                try:
+                    with transaction.atomic():
+                        cursor.execute(
+                            f'INSERT INTO {item_table} (cart_id, book_id, quantity) {select_sql} '
+                            f'ON DUPLICATE KEY UPDATE quantity = {item_table}.quantity + %s',
+                            params + [quantity]
+                        )
+                        if cursor.rowcount == 0:
+                            return None
+                        # Số dòng bị ảnh hưởng của ON DUPLICATE KEY UPDATE:
+                        # 1 = dòng mới được INSERT, 2 = cộng dồn vào dòng đã có
+                        created = cursor.rowcount == 1
+                        row = CartDAO._read_cart_item(cursor, customer_id, book_id)
+                        if row is None:
+                            return None
+                        if row[2] > row[3]:
+                            raise _StockExceeded()
+                        return row[0], row[1], row[2], created
+                except _StockExceeded:
+                    return None
+
+            # PostgreSQL / SQLite: INSERT ... DO NOTHING rồi UPDATE có điều kiện tồn kho,
+            # lệnh nào ghi được dòng thì biết chắc dòng đó mới hay cũ
+            returning = connection.features.can_return_columns_from_insert
+            returning_sql = ' RETURNING id, cart_id, quantity' if returning else ''
+
+            cursor.execute(
+                f'INSERT INTO {item_table} (cart_id, book_id, quantity) {select_sql} '
+                f'ON CONFLICT (cart_id, book_id) DO NOTHING{returning_sql}',
+                params
+            )
+            if returning:
+                row = cursor.fetchone()
+                if row is not None:
+                    return row[0], row[1], row[2], True
+            elif cursor.rowcount == 1:
+                row = CartDAO._read_cart_item(cursor, customer_id, book_id)
+                return row[0], row[1], row[2], True
+
+            cursor.execute(
+                f'UPDATE {item_table} SET quantity = {item_table}.quantity + %s '
+                f'WHERE {item_table}.book_id = %s '
+                f'AND {item_table}.cart_id = (SELECT id FROM {cart_table} '
+                f'WHERE customer_id = %s AND is_active = %s ORDER BY id DESC LIMIT 1) '
+                f'AND {item_table}.quantity + %s <= '
+                f'(SELECT stock_quantity FROM {book_table} WHERE id = %s){returning_sql}',
+                [quantity, book_id, customer_id, True, quantity, book_id]
+            )
+            if returning:
+                row = cursor.fetchone()
+            elif cursor.rowcount == 1:
+                row = CartDAO._read_cart_item(cursor, customer_id, book_id)
+            else:
+                row = None
+            if row is None:
+                return None
+            return row[0], row[1], row[2], False
+
+    @staticmethod
+    def _parse_operations(operations):
+        """Kiểm tra định dạng lô thao tác, trả về danh sách (op, book_id, quantity)"""
+        if not isinstance(operations, list) or not operations:
+            raise CartOperationError([{'error': 'operations must be a non-empty list'}])
+        if len(operations) > MAX_CART_OPERATIONS:
+            raise CartOperationError([{'error': f'At most {MAX_CART_OPERATIONS} operations per request'}])
+
+        parsed, errors = [], []
+        for index, operation in enumerate(operations):
+            try:
+                op = operation['op']
+                book_id = int(operation['book_id'])
+                quantity = int(operation.get('quantity', 0 if op == 'remove' else 1))
+            except (TypeError, KeyError, ValueError, AttributeError):
+                errors.append({'index': index, 'error': 'Each operation needs op and book_id'})
+                continue
+
+            if op not in CART_OPERATIONS:
+                errors.append({'index': index, 'error': f'Unknown op: {op}'})
+            elif (op == 'add' and quantity < 1) or (op == 'set' and quantity < 0):
+                errors.append({'index': index, 'error': 'Invalid quantity'})
+            else:
+                parsed.append((op, book_id, quantity))
+
+        if errors:
+            raise CartOperationError(errors)
+        return parsed
+
+    @staticmethod
+    @transaction.atomic
+    def apply_operations(customer, operations):
+        """
+        Áp dụng một lô thao tác add / set / remove lên giỏ hàng active trong một transaction
+
+        operations: danh sách {'op': 'add'|'set'|'remove', 'book_id', 'quantity'} theo thứ tự;
+        set với quantity 0 tương đương remove. Tồn kho của mọi sách thay đổi được kiểm tra
+        bằng một truy vấn - chỉ cần một lỗi là cả lô bị bỏ (CartOperationError).
+        """
+        parsed = CartDAO._parse_operations(operations)
+
+        # Khóa cart để các lô của cùng khách hàng chạy tuần tự
+        cart = Cart.objects.select_for_update().filter(
+            customer=customer, is_active=True
+        ).order_by('-id').first()
+        if cart is None:
+            cart = Cart.objects.create(customer=customer, is_active=True)
+
+        items = {item.book_id: item for item in CartItem.objects.filter(cart=cart)}
+
+        # Gộp các thao tác thành số lượng cuối cùng của từng sách
+        quantities = {book_id: item.quantity for book_id, item in items.items()}
+        for op, book_id, quantity in parsed:
+            if op == 'add':
+                quantities[book_id] = quantities.get(book_id, 0) + quantity
+            elif op == 'set':
+                quantities[book_id] = quantity
+            else:
+                quantities[book_id] = 0
+
+        changed = {
+            book_id: quantity for book_id, quantity in quantities.items()
+            if quantity != (items[book_id].quantity if book_id in items else 0)
+        }
+
+        # Một truy vấn kiểm tra tồn kho cho mọi sách có số lượng tăng / đổi
+        check_ids = [book_id for book_id, quantity in changed.items() if quantity > 0]
+        stock = dict(Book.objects.filter(id__in=check_ids).values_list('id', 'stock_quantity'))
+        errors = []
+        for book_id in check_ids:
+            if book_id not in stock:
+                errors.append({'book_id': book_id, 'error': 'Book not found'})
+            elif stock[book_id] < changed[book_id]:
+                errors.append({
+                    'book_id': book_id,
+                    'error': 'Not enough stock',
+                    'available': stock[book_id],
+                    'requested': changed[book_id]
+                })
+        if errors:
+            raise CartOperationError(errors)
+
+        new_items, updated_items, removed_ids = [], [], []
+        for book_id, quantity in changed.items():
+            if quantity == 0:
+                if book_id in items:
+                    removed_ids.append(items[book_id].id)
+            elif book_id in items:
+                items[book_id].quantity = quantity
+                updated_items.append(items[book_id])
+            else:
+                new_items.append(CartItem(cart=cart, book_id=book_id, quantity=quantity))
+
+        if new_items:
+            CartItem.objects.bulk_create(new_items)
+        if updated_items:
+            CartItem.objects.bulk_update(updated_items, ['quantity'])
+        if removed_ids:
+            CartItem.objects.filter(id__in=removed_ids).delete()
+
+        if changed:
+            CartDAO.invalidate_cart(customer.id)
+        return cart
@@ -0,0 +1,139 @@
+from decimal import Decimal, InvalidOperation
+from django.db import transaction
+from django.utils import timezone
+from store.models import Book, Category
+from dao.cartDAO import CartDAO
+from dao.feedParser import chunked, new_summary, add_error, format_feed_rows
+
+# Số dòng mỗi chunk khi import và số dòng mỗi lần đọc khi export
+CATALOG_CHUNK_SIZE = 500
+# Cột của file catalog (import và export dùng chung)
+CATALOG_COLUMNS = ('id', 'title', 'author', 'price', 'stock_quantity', 'category')
+
+TITLE_MAX_LENGTH = Book._meta.get_field('title').max_length
+AUTHOR_MAX_LENGTH = Book._meta.get_field('author').max_length
+
+
+def _validate(record, category_ids):
+    """
+    Trả về (book_id hoặc None, dict field) hoặc chuỗi lỗi
+
+    Dòng có id cập nhật sách đã có, dòng không có id tạo sách mới.
+    category là tên category; category_ids là map tên -> id đã nạp sẵn.
+    """
+    if record is None:
+        return 'Invalid JSON object'
+    try:
+        book_id = int(record['id']) if record.get('id') not in (None, '') else None
+        title = str(record['title']).strip()
+        author = str(record['author']).strip()
+        price = Decimal(str(record['price'])).quantize(Decimal('0.01'))
+        stock_quantity = int(record['stock_quantity'])
+        category_name = str(record['category']).strip()
+    except KeyError as e:
+        return f'Missing field {e.args[0]}'
+    except (TypeError, ValueError, InvalidOperation):
+        return 'id and stock_quantity must be integers, price must be a number'
+
+    if not title or len(title) > TITLE_MAX_LENGTH:
+        return f'Title must be 1-{TITLE_MAX_LENGTH} characters'
+    if not author or len(author) > AUTHOR_MAX_LENGTH:
+        return f'Author must be 1-{AUTHOR_MAX_LENGTH} characters'
+    if price < 0 or stock_quantity < 0:
+        return 'Price and stock_quantity cannot be negative'
+    if category_name not in category_ids:
+        return f'Category not found: {category_name}'
+
+    return book_id, {
+        'title': title,
+        'author': author,
+        'price': price,
+        'stock_quantity': stock_quantity,
+        'category_id': category_ids[category_name],
+    }
+
+
+class CatalogDAO:
+    """
+    DAO cho import / export catalog sách hàng loạt.
+
+    Import đọc file theo từng chunk: category được tra trong map tên -> id nạp
+    một lần, sách có sẵn được đọc bằng một truy vấn mỗi chunk, rồi ghi bằng
+    bulk_create / bulk_update. Export stream từng dòng, không giữ cả catalog
+    trong bộ nhớ.
+    """
+
+    @staticmethod
+    def get_category_ids():
+        """Map tên category -> id (một truy vấn)"""
+        return {name: category_id for category_id, name in Category.objects.values_list('id', 'name')}
+
+    @staticmethod
+    def _import_chunk(chunk, category_ids, summary, dry_run):
+        to_create = []
+        updates = {}
+        for line_number, record in chunk:
+            result = _validate(record, category_ids)
+            if isinstance(result, str):
+                add_error(summary, line_number, result)
+            elif result[0] is None:
+                to_create.append(Book(**result[1]))
+            else:
+                # Cùng id nhiều lần trong chunk: dòng sau thắng
+                updates[result[0]] = (line_number, result[1])
+
+        now = timezone.now()
+        books = Book.objects.in_bulk(list(updates))
+        to_update = []
+        for book_id, (line_number, fields) in updates.items():
+            book = books.get(book_id)
+            if book is None:
+                add_error(summary, line_number, f'Book {book_id} not found')
+                continue
+            for field, value in fields.items():
+                setattr(book, field, value)
+            # bulk_update không tự cập nhật auto_now
+            book.updated_at = now
+            to_update.append(book)
+
+        if not dry_run:
+            with transaction.atomic():
+                Book.objects.bulk_create(to_create)
+                Book.objects.bulk_update(
+                    to_update, ['title', 'author', 'price', 'stock_quantity', 'category_id', 'updated_at']
+                )
+            if to_update:
+                # Giỏ hàng có sách vừa đổi giá / tồn kho phải dựng lại snapshot
+                CartDAO.invalidate_carts_with_books([book.id for book in to_update])
+
+        summary['created'] += len(to_create)
+        summary['updated'] += len(to_update)
+        summary['chunks'] += 1
+
+    @staticmethod
+    def import_catalog(rows, chunk_size=CATALOG_CHUNK_SIZE, dry_run=False, progress=None):
+        """
+        Import catalog sách theo từng chunk
+
+        rows: (số dòng, dict) từ parse_feed_lines với các cột CATALOG_COLUMNS.
+        Mỗi chunk được ghi trong transaction riêng - dòng lỗi bị bỏ qua và được báo lại.
+
+        dry_run: chỉ kiểm tra, không ghi
+        progress: hàm progress(summary) được gọi sau mỗi chunk
+        """
+        summary = new_summary(dry_run, created=0, updated=0)
+        category_ids = CatalogDAO.get_category_ids()
+        for chunk in chunked(rows, chunk_size):
+            summary['processed'] += len(chunk)
+            CatalogDAO._import_chunk(chunk, category_ids, summary, dry_run)
+            if progress:
+                progress(summary)
+        return summary
+
+    @staticmethod
+    def export_catalog(fmt, chunk_size=CATALOG_CHUNK_SIZE):
+        """Sinh ra từng dòng CSV / NDJSON của toàn bộ catalog (đọc DB theo từng chunk)"""
+        rows = Book.objects.order_by('id').values_list(
+            'id', 'title', 'author', 'price', 'stock_quantity', 'category__name'
+        ).iterator(chunk_size=chunk_size)
+        return format_feed_rows(CATALOG_COLUMNS, rows, fmt)
@@ -1,4 +1,5 @@
 from store.models import Category
+from dao.bookDAO import BookDAO
 
 
 class CategoryDAO:
@@ -28,6 +29,9 @@ class CategoryDAO:
             category.description = description
             
         category.save()
+        if name is not None:
+            # Tên category nằm trong response của sách
+            BookDAO.touch(category_id=category.id)
         return category
     
     @staticmethod
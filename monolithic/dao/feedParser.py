@@ -0,0 +1,85 @@
+import csv
+import json
+
+# Định dạng file import / export hàng loạt (rating, catalog)
+FEED_FORMATS = ('csv', 'ndjson')
+# Chỉ trả về chi tiết của N lỗi đầu tiên (tổng số lỗi vẫn được đếm)
+MAX_REPORTED_ERRORS = 100
+
+
+def detect_format(name='', content_type=''):
+    """Đoán định dạng từ tên file / content type, mặc định là csv"""
+    name = (name or '').lower()
+    content_type = (content_type or '').lower()
+    if name.endswith(('.ndjson', '.jsonl')) or 'ndjson' in content_type or 'jsonl' in content_type:
+        return 'ndjson'
+    return 'csv'
+
+
+def parse_feed_lines(lines, fmt):
+    """
+    Đọc từng dòng của file import (iterable các dòng bytes hoặc str), không đọc cả file vào bộ nhớ
+
+    CSV cần dòng header; NDJSON là một object JSON mỗi dòng.
+    Sinh ra (số dòng, dict) hoặc (số dòng, None) với dòng JSON hỏng.
+    """
+    text_lines = (line.decode('utf-8-sig') if isinstance(line, bytes) else line for line in lines)
+
+    if fmt == 'csv':
+        reader = csv.DictReader(text_lines)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_number, line in enumerate(text_lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        yield line_number, record if isinstance(record, dict) else None
+
+
+def new_summary(dry_run, **counters):
+    """Kết quả import: số dòng đã đọc, số chunk, lỗi và các bộ đếm riêng"""
+    return {'processed': 0, 'chunks': 0, **counters, 'error_count': 0, 'errors': [], 'dry_run': dry_run}
+
+
+def add_error(summary, line_number, error):
+    summary['error_count'] += 1
+    if len(summary['errors']) < MAX_REPORTED_ERRORS:
+        summary['errors'].append({'line': line_number, 'error': error})
+
+
+def chunked(rows, chunk_size):
+    """Gom các dòng thành từng list chunk_size phần tử"""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _Echo:
+    """File giả cho csv.writer: trả lại dòng vừa ghi thay vì lưu"""
+
+    def write(self, value):
+        return value
+
+
+def format_feed_rows(header, rows, fmt):
+    """Sinh ra từng dòng CSV (có header) hoặc NDJSON từ các tuple theo thứ tự header"""
+    if fmt == 'csv':
+        writer = csv.writer(_Echo())
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
+        return
+
+    for row in rows:
+        yield json.dumps(dict(zip(header, row)), ensure_ascii=False, default=str) + '\n'
@@ -0,0 +1,177 @@
+import threading
+import time
+from collections import defaultdict
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Avg, Count
+from django.utils import timezone
+from store.models import Book, Rating, PopularityList
+from dao.bulkUpsert import bulk_upsert
+
+GLOBAL_SCOPE = 'global'
+
+
+def category_scope(category_id):
+    return f'category:{category_id}'
+
+
+def get_list_size():
+    """Số sách lưu trong mỗi danh sách"""
+    return getattr(settings, 'POPULARITY_LIST_SIZE', 50)
+
+
+def get_prior_weight():
+    """Số rating 'ảo' ở mức trung bình chung được cộng vào mỗi sách (Bayesian average)"""
+    return getattr(settings, 'POPULARITY_PRIOR_WEIGHT', 5)
+
+
+def get_cache_ttl():
+    """Số giây mỗi process giữ danh sách trong bộ nhớ trước khi đọc lại bảng"""
+    return getattr(settings, 'POPULARITY_CACHE_TTL', 300)
+
+
+def bayesian_average(avg_rating, rating_count, global_mean, prior_weight):
+    """
+    Rating trung bình Bayesian: kéo sách ít rating về mức trung bình chung,
+    để sách 1 rating 5 sao không đứng trên sách 100 rating 4.8 sao
+    """
+    return (avg_rating * rating_count + global_mean * prior_weight) / (rating_count + prior_weight)
+
+
+class PopularityDAO:
+    """
+    DAO cho danh sách sách phổ biến dùng khi không đủ dữ liệu cá nhân hóa (cold start).
+
+    Lệnh refresh_popularity tính một lần toàn bộ danh sách (toàn cục và theo từng
+    category) vào bảng PopularityList. Mỗi process đọc bảng này vào bộ nhớ và chỉ
+    đọc lại sau POPULARITY_CACHE_TTL giây, nên response fallback không chạy truy
+    vấn aggregate nào. Giá / tồn kho trong danh sách là giá trị tại lúc tính.
+    """
+
+    _lists = None
+    _loaded_at = 0.0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _item(book, avg_rating, rating_count, score, reason, algorithm):
+        return {
+            'id': book['id'],
+            'title': book['title'],
+            'author': book['author'],
+            'price': float(book['price']),
+            'stock_quantity': book['stock_quantity'],
+            'category_name': book['category__name'],
+            'average_rating': float(avg_rating) if avg_rating else 0,
+            'total_ratings': rating_count,
+            'bayesian_rating': round(score, 4),
+            'reason': reason,
+            'algorithm': algorithm
+        }
+
+    @staticmethod
+    def compute_lists(book_model=Book, rating_model=Rating):
+        """
+        Tính toàn bộ danh sách phổ biến trong bộ nhớ (một truy vấn aggregate cho cả catalog)
+
+        Trả về {scope: items}, không ghi gì. Migration truyền model lịch sử vào.
+        """
+        size = get_list_size()
+        prior_weight = get_prior_weight()
+        global_mean = float(rating_model.objects.aggregate(value=Avg('score'))['value'] or 0)
+
+        books = book_model.objects.annotate(
+            avg_rating=Avg('rating__score'),
+            rating_count=Count('rating')
+        ).filter(
+            rating_count__gt=0
+        ).values(
+            'id', 'title', 'author', 'price', 'stock_quantity',
+            'category_id', 'category__name', 'avg_rating', 'rating_count'
+        )
+
+        ranked = sorted(
+            (
+                (bayesian_average(float(book['avg_rating']), book['rating_count'], global_mean, prior_weight), book)
+                for book in books
+            ),
+            key=lambda x: (-x[0], x[1]['id'])
+        )
+
+        lists = defaultdict(list)
+        for score, book in ranked:
+            item = PopularityDAO._item(
+                book, book['avg_rating'], book['rating_count'], score,
+                'Top rated books', 'Fallback: Rating-based'
+            )
+            if len(lists[GLOBAL_SCOPE]) < size:
+                lists[GLOBAL_SCOPE].append(item)
+            category_list = lists[category_scope(book['category_id'])]
+            if len(category_list) < size:
+                category_list.append(item)
+
+        if not lists[GLOBAL_SCOPE]:
+            # Nếu không có rating nào, lấy random books
+            lists[GLOBAL_SCOPE] = [
+                PopularityDAO._item(book, 0, 0, 0.0, 'Popular books', 'Fallback: Random selection')
+                for book in book_model.objects.values(
+                    'id', 'title', 'author', 'price', 'stock_quantity', 'category__name'
+                )[:size]
+            ]
+        return dict(lists)
+
+    @staticmethod
+    @transaction.atomic
+    def refresh():
+        """Tính lại và ghi toàn bộ danh sách phổ biến (lệnh refresh_popularity, sau import rating)"""
+        lists = PopularityDAO.compute_lists()
+
+        # Upsert theo scope (unique) thay vì xóa hết rồi INSERT: hai lần refresh chạy
+        # cùng lúc không đụng unique constraint
+        computed_at = timezone.now()
+        bulk_upsert(
+            PopularityList,
+            [PopularityList(scope=scope, items=items, computed_at=computed_at) for scope, items in lists.items()],
+            unique_fields=['scope'],
+            update_fields=['items', 'computed_at']
+        )
+        PopularityList.objects.exclude(scope__in=list(lists)).delete()
+        PopularityDAO.clear_cache()
+
+    @staticmethod
+    def clear_cache():
+        """Buộc process hiện tại đọc lại bảng ở lần gọi sau"""
+        with PopularityDAO._lock:
+            PopularityDAO._lists = None
+
+    @staticmethod
+    def _get_lists():
+        with PopularityDAO._lock:
+            if PopularityDAO._lists is not None and time.monotonic() - PopularityDAO._loaded_at < get_cache_ttl():
+                return PopularityDAO._lists
+
+        lists = dict(PopularityList.objects.values_list('scope', 'items'))
+        if not lists:
+            # Bảng trống (chưa chạy refresh_popularity / migration backfill): tính trong bộ nhớ
+            # và giữ trong process theo TTL. Request không ghi bảng - việc đó để cho lệnh
+            # refresh_popularity, nên các request đầu tiên chạy song song không tranh nhau INSERT.
+            lists = PopularityDAO.compute_lists()
+
+        with PopularityDAO._lock:
+            PopularityDAO._lists = lists
+            PopularityDAO._loaded_at = time.monotonic()
+        return lists
+
+    @staticmethod
+    def get_popular_books(limit=10, category_id=None):
+        """
+        Sách phổ biến nhất (toàn cục hoặc trong một category) dưới dạng dict đã serialize
+
+        Category không có sách nào được rating thì dùng danh sách toàn cục.
+        """
+        lists = PopularityDAO._get_lists()
+        items = None
+        if category_id is not None:
+            items = lists.get(category_scope(category_id))
+        if items is None:
+            items = lists.get(GLOBAL_SCOPE, [])
+        return items[:limit]
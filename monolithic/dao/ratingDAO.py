@@ -0,0 +1,123 @@
+from decimal import Decimal, InvalidOperation
+from django.db import transaction
+from store.models import Book, Customer, Rating
+from dao.popularityDAO import PopularityDAO
+from dao.bookDAO import BookDAO
+from dao.feedParser import chunked, new_summary, add_error
+from dao.bulkUpsert import bulk_upsert
+
+# Số dòng được ghi trong một lệnh upsert
+RATING_IMPORT_CHUNK_SIZE = 1000
+
+MIN_SCORE = Decimal('1')
+MAX_SCORE = Decimal('5')
+
+
+def _validate(record):
+    """Trả về (customer_id, book_id, score) hoặc chuỗi lỗi"""
+    if record is None:
+        return 'Invalid JSON object'
+    try:
+        customer_id = int(record['customer_id'])
+        book_id = int(record['book_id'])
+        score = Decimal(str(record['score'])).quantize(Decimal('0.01'))
+    except KeyError as e:
+        return f'Missing field {e.args[0]}'
+    except (TypeError, ValueError, InvalidOperation):
+        return 'customer_id and book_id must be integers, score must be a number'
+    if not MIN_SCORE <= score <= MAX_SCORE:
+        return 'Score must be between 1 and 5'
+    return customer_id, book_id, score
+
+
+class RatingDAO:
+
+    @staticmethod
+    def upsert_ratings(ratings):
+        """
+        Ghi (tạo mới hoặc cập nhật score) nhiều rating bằng một lệnh upsert
+        (ON CONFLICT / ON DUPLICATE KEY UPDATE trên unique (customer, book))
+
+        ratings: danh sách (customer_id, book_id, score), mỗi (customer_id, book_id) một lần
+        Rating trung bình nằm trong response của sách nên phiên bản của các sách được tăng
+        sau khi ghi, trong cùng transaction (request đọc phiên bản mới thì cũng thấy rating mới).
+        """
+        with transaction.atomic():
+            saved = bulk_upsert(
+                Rating,
+                [
+                    Rating(customer_id=customer_id, book_id=book_id, score=score)
+                    for customer_id, book_id, score in ratings
+                ],
+                unique_fields=['customer', 'book'],
+                update_fields=['score']
+            )
+            BookDAO.touch({book_id for _, book_id, _ in ratings})
+        return saved
+
+    @staticmethod
+    def upsert_rating(customer_id, book_id, score):
+        """
+        Tạo hoặc cập nhật rating của khách hàng cho một sách
+
+        Đọc lại dòng sau upsert: khi bị cập nhật (và trên MySQL) bulk_create không trả về id.
+        """
+        RatingDAO.upsert_ratings([(customer_id, book_id, score)])
+        return Rating.objects.get(customer_id=customer_id, book_id=book_id)
+
+    @staticmethod
+    def _import_chunk(chunk, summary, dry_run):
+        """Kiểm tra và ghi một chunk: 2 truy vấn kiểm tra + 1 lệnh upsert"""
+        valid = {}
+        for line_number, record in chunk:
+            result = _validate(record)
+            if isinstance(result, str):
+                add_error(summary, line_number, result)
+            else:
+                # Trùng (customer, book) trong cùng chunk: dòng sau thắng
+                valid[result[:2]] = (line_number, result[2])
+
+        customer_ids = set(Customer.objects.filter(
+            id__in={customer_id for customer_id, _ in valid}
+        ).values_list('id', flat=True))
+        book_ids = set(Book.objects.filter(
+            id__in={book_id for _, book_id in valid}
+        ).values_list('id', flat=True))
+
+        ratings = []
+        for (customer_id, book_id), (line_number, score) in valid.items():
+            if customer_id not in customer_ids:
+                add_error(summary, line_number, f'Customer {customer_id} not found')
+            elif book_id not in book_ids:
+                add_error(summary, line_number, f'Book {book_id} not found')
+            else:
+                ratings.append((customer_id, book_id, score))
+
+        if ratings and not dry_run:
+            RatingDAO.upsert_ratings(ratings)
+        summary['imported'] += len(ratings)
+        summary['chunks'] += 1
+
+    @staticmethod
+    def import_ratings(rows, chunk_size=RATING_IMPORT_CHUNK_SIZE, dry_run=False, progress=None):
+        """
+        Import rating từ nguồn bên ngoài theo từng chunk
+
+        rows: (số dòng, dict) từ parse_feed_lines. Mỗi chunk được kiểm tra và
+        upsert trong transaction riêng - dòng lỗi bị bỏ qua và được báo lại.
+        Các bảng tổng hợp phụ thuộc rating (danh sách phổ biến) được tính lại
+        một lần sau khi import, không phải mỗi dòng.
+
+        dry_run: chỉ kiểm tra, không ghi
+        progress: hàm progress(summary) được gọi sau mỗi chunk
+        """
+        summary = new_summary(dry_run, imported=0)
+        for chunk in chunked(rows, chunk_size):
+            summary['processed'] += len(chunk)
+            RatingDAO._import_chunk(chunk, summary, dry_run)
+            if progress:
+                progress(summary)
+
+        if summary['imported'] and not dry_run:
+            PopularityDAO.refresh()
+        return summary
@@ -0,0 +1,372 @@
+import multiprocessing
+from collections import defaultdict, Counter
+import numpy as np
+from django.conf import settings
+from django.db import connections
+from django.db.models import Avg, Count
+from django.utils import timezone
+from store.models import Book, Rating, OrderItem, Customer, CustomerRecommendation
+from dao.bulkUpsert import bulk_upsert
+
+# Các thuật toán được tính sẵn theo từng khách hàng
+COLLABORATIVE = 'collaborative'
+CONTENT_BASED = 'content_based'
+HISTORY = 'history'
+ALGORITHMS = (COLLABORATIVE, CONTENT_BASED, HISTORY)
+
+
+def get_precompute_limit():
+    """Số sách lưu sẵn cho mỗi (khách hàng, thuật toán)"""
+    return getattr(settings, 'RECOMMENDATION_PRECOMPUTE_LIMIT', 20)
+
+
+# ---------------------------------------------------------------------------
+# Các hàm tính điểm thuần (không truy vấn DB) - dùng chung cho request và batch
+# ---------------------------------------------------------------------------
+
+def calculate_similarity(ratings1, ratings2, book_ids):
+    """
+    Tính độ tương đồng cosine giữa 2 user dựa trên ratings
+    """
+    common_books = set(ratings1.keys()) & set(ratings2.keys()) & book_ids
+
+    if len(common_books) == 0:
+        return 0
+
+    # Vector ratings
+    vec1 = np.array([ratings1[book] for book in common_books])
+    vec2 = np.array([ratings2[book] for book in common_books])
+
+    # Cosine similarity
+    norm1 = np.linalg.norm(vec1)
+    norm2 = np.linalg.norm(vec2)
+
+    if norm1 == 0 or norm2 == 0:
+        return 0
+
+    return np.dot(vec1, vec2) / (norm1 * norm2)
+
+
+def score_collaborative(customer_id, user_ratings, limit):
+    """
+    User-based Collaborative Filtering (Cosine Similarity)
+
+    user_ratings: {customer_id: {book_id: score}} của tất cả khách hàng
+    Trả về (danh sách (book_id, điểm dự đoán) tốt nhất trước, details)
+    """
+    target_user_ratings = user_ratings.get(customer_id)
+    if not target_user_ratings:
+        return [], {}
+
+    # Tìm users tương tự
+    all_book_ids = set(target_user_ratings.keys())
+    similarities = []
+    for user_id, ratings in user_ratings.items():
+        if user_id != customer_id:
+            similarity = calculate_similarity(target_user_ratings, ratings, all_book_ids)
+            if similarity > 0:
+                similarities.append((user_id, similarity))
+
+    similarities.sort(key=lambda x: x[1], reverse=True)
+    top_similar_users = similarities[:10]  # Top 10 users tương tự
+
+    # Tính điểm predicted cho các sách chưa đọc
+    book_scores = defaultdict(float)
+    book_weights = defaultdict(float)
+    for user_id, similarity in top_similar_users:
+        for book_id, rating in user_ratings[user_id].items():
+            if book_id not in all_book_ids:
+                book_scores[book_id] += similarity * rating
+                book_weights[book_id] += similarity
+
+    recommendations = [
+        (book_id, float(total_score / book_weights[book_id]))
+        for book_id, total_score in book_scores.items()
+        if book_weights[book_id] > 0
+    ]
+    recommendations.sort(key=lambda x: x[1], reverse=True)
+    return recommendations[:limit], {'similar_users_count': len(top_similar_users)}
+
+
+def content_preferences(customer_ratings):
+    """
+    Phân tích sở thích từ ratings của khách hàng
+
+    customer_ratings: danh sách (book_id, score, category_id, author), score giảm dần
+    Trả về (category_scores, author_scores, rated_book_ids)
+    """
+    liked_books = [rating for rating in customer_ratings if rating[1] >= 4.0]  # Rating >= 4.0
+    if not liked_books:
+        liked_books = customer_ratings[:5]  # Lấy top 5 rated books
+
+    category_scores = Counter()
+    author_scores = Counter()
+    rated_book_ids = set()
+    for book_id, score, category_id, author in liked_books:
+        weight = float(score) / 5.0  # Normalize to 0-1
+        category_scores[category_id] += weight
+        author_scores[author] += weight
+        rated_book_ids.add(book_id)
+    return category_scores, author_scores, rated_book_ids
+
+
+def score_content_based(preferences, books, avg_ratings, limit):
+    """
+    Content-Based Filtering theo category / author yêu thích
+
+    preferences: kết quả của content_preferences
+    books: danh sách (book_id, category_id, author) - ứng viên (có thể là cả catalog)
+    avg_ratings: {book_id: điểm trung bình}
+    Trả về (danh sách (book_id, điểm) tốt nhất trước, details)
+    """
+    category_scores, author_scores, rated_book_ids = preferences
+    top_categories = [cat_id for cat_id, _ in category_scores.most_common(5)]
+    top_authors = {author for author, _ in author_scores.most_common(5)}
+    top_category_set = set(top_categories)
+
+    book_scores = []
+    for book_id, category_id, author in books:
+        if book_id in rated_book_ids:
+            continue
+        if category_id not in top_category_set and author not in top_authors:
+            continue
+
+        score = 0
+        # Điểm từ category
+        if category_id in category_scores:
+            score += category_scores[category_id] * 2
+        # Điểm từ author
+        if author in author_scores:
+            score += author_scores[author] * 1.5
+        # Bonus cho sách có rating cao
+        if avg_ratings.get(book_id):
+            score += float(avg_ratings[book_id]) * 0.3
+        book_scores.append((book_id, float(score)))
+
+    book_scores.sort(key=lambda x: x[1], reverse=True)
+    return book_scores[:limit], {'top_category_ids': top_categories}
+
+
+def score_history(purchased_book_ids, purchased_category_ids, books, avg_ratings, limit):
+    """
+    Sách cùng category với sách đã mua, chưa mua, rating trung bình cao trước
+    (sách chưa có rating xếp cuối)
+    """
+    candidates = [
+        (book_id, avg_ratings.get(book_id))
+        for book_id, category_id, _ in books
+        if category_id in purchased_category_ids and book_id not in purchased_book_ids
+    ]
+    candidates.sort(key=lambda x: (x[1] is None, -(x[1] or 0)))
+    return [(book_id, float(avg or 0)) for book_id, avg in candidates[:limit]], {}
+
+
+# ---------------------------------------------------------------------------
+# Batch: snapshot dữ liệu + tính điểm theo shard khách hàng trên nhiều process
+# ---------------------------------------------------------------------------
+
+# Snapshot của lần chạy hiện tại; process con (fork) đọc chung bản này
+_snapshot = None
+
+
+def load_snapshot(chunk_size=2000):
+    """
+    Đọc toàn bộ dữ liệu cần cho gợi ý bằng các truy vấn streaming (.iterator())
+
+    Mỗi bảng được quét một lần theo từng chunk, không giữ queryset / model instance.
+    """
+    books = list(
+        Book.objects.order_by('id').values_list('id', 'category_id', 'author').iterator(chunk_size=chunk_size)
+    )
+    book_info = {book_id: (category_id, author) for book_id, category_id, author in books}
+
+    user_ratings = defaultdict(dict)
+    rating_sums = defaultdict(float)
+    rating_counts = defaultdict(int)
+    for customer_id, book_id, score in Rating.objects.order_by().values_list(
+        'customer_id', 'book_id', 'score'
+    ).iterator(chunk_size=chunk_size):
+        score = float(score)
+        user_ratings[customer_id][book_id] = score
+        rating_sums[book_id] += score
+        rating_counts[book_id] += 1
+    avg_ratings = {book_id: rating_sums[book_id] / rating_counts[book_id] for book_id in rating_sums}
+
+    purchases = defaultdict(lambda: (set(), set()))
+    for customer_id, book_id in OrderItem.objects.order_by().values_list(
+        'order__customer_id', 'book_id'
+    ).iterator(chunk_size=chunk_size):
+        purchased_books, purchased_categories = purchases[customer_id]
+        purchased_books.add(book_id)
+        if book_id in book_info:
+            purchased_categories.add(book_info[book_id][0])
+
+    customer_ids = list(Customer.objects.order_by('id').values_list('id', flat=True).iterator(chunk_size=chunk_size))
+
+    return {
+        'books': books,
+        'book_info': book_info,
+        'user_ratings': dict(user_ratings),
+        'avg_ratings': avg_ratings,
+        'purchases': dict(purchases),
+        'customer_ids': customer_ids,
+    }
+
+
+def recommend_from_snapshot(snapshot, customer_id, limit):
+    """Tính danh sách gợi ý của mọi thuật toán cho một khách hàng từ snapshot"""
+    results = {}
+
+    results[COLLABORATIVE] = score_collaborative(customer_id, snapshot['user_ratings'], limit)
+
+    ratings = snapshot['user_ratings'].get(customer_id, {})
+    customer_ratings = sorted(
+        (
+            (book_id, score) + snapshot['book_info'][book_id]
+            for book_id, score in ratings.items()
+            if book_id in snapshot['book_info']
+        ),
+        key=lambda x: x[1], reverse=True
+    )
+    if customer_ratings:
+        results[CONTENT_BASED] = score_content_based(
+            content_preferences(customer_ratings), snapshot['books'], snapshot['avg_ratings'], limit
+        )
+    else:
+        results[CONTENT_BASED] = ([], {})
+
+    purchased_books, purchased_categories = snapshot['purchases'].get(customer_id, (set(), set()))
+    results[HISTORY] = score_history(
+        purchased_books, purchased_categories, snapshot['books'], snapshot['avg_ratings'], limit
+    )
+    return results
+
+
+def score_shard(args):
+    """Chạy trong process con: tính gợi ý cho các khách hàng có id % shards == shard"""
+    shard, shards, limit = args
+    rows = []
+    for customer_id in _snapshot['customer_ids']:
+        if customer_id % shards != shard:
+            continue
+        for algorithm, (ranked, details) in recommend_from_snapshot(_snapshot, customer_id, limit).items():
+            rows.append((customer_id, algorithm, ranked, details))
+    return shard, rows
+
+
+class RecommendationDAO:
+    """
+    DAO cho danh sách gợi ý tính sẵn (CustomerRecommendation).
+
+    Lệnh precompute_recommendations ghi top-N cho mọi khách hàng; các API gợi ý
+    đọc danh sách này và chỉ tính trực tiếp cho khách hàng chưa có (cold user).
+    """
+
+    @staticmethod
+    def get_precomputed(customer_id, algorithm, limit):
+        """
+        Lấy danh sách tính sẵn
+
+        Sách khách hàng đã mua hoặc đã đánh giá sau lần tính được bỏ ra khỏi danh sách.
+        Trả về (book_ids, details) hoặc None nếu khách hàng chưa được tính
+        hoặc danh sách còn lại ngắn hơn limit trong khi batch đã cắt bớt
+        (danh sách đầy đủ theo limit của lần batch đó).
+        """
+        row = CustomerRecommendation.objects.filter(
+            customer_id=customer_id, algorithm=algorithm
+        ).values_list('book_ids', 'details', 'computed_at', 'limit').first()
+        if row is None:
+            return None
+        book_ids, details, computed_at, stored_limit = row
+
+        # Rating không có thời điểm nên lấy mọi sách đã đánh giá (index theo customer);
+        # order_date là ngày nên lấy từ ngày tính - thừa vẫn đúng vì đằng nào cũng phải loại
+        consumed = set(
+            Rating.objects.filter(customer_id=customer_id).values_list('book_id', flat=True)
+        ) | set(
+            OrderItem.objects.filter(
+                order__customer_id=customer_id, order__order_date__gte=computed_at.date()
+            ).values_list('book_id', flat=True)
+        )
+        fresh_ids = [book_id for book_id in book_ids if book_id not in consumed]
+        if len(fresh_ids) < limit and len(book_ids) >= stored_limit:
+            return None
+        return fresh_ids[:limit], details
+
+    @staticmethod
+    def get_books_in_order(book_ids):
+        """Lấy sách (kèm avg_rating, rating_count) theo đúng thứ tự book_ids"""
+        books = Book.objects.filter(id__in=book_ids).select_related('category').annotate(
+            avg_rating=Avg('rating__score'),
+            rating_count=Count('rating')
+        )
+        book_dict = {book.id: book for book in books}
+        return [book_dict[book_id] for book_id in book_ids if book_id in book_dict]
+
+    @staticmethod
+    def save_rows(rows, computed_at, limit):
+        """
+        Ghi (upsert) một shard kết quả: rows là danh sách (customer_id, algorithm, ranked, details)
+
+        limit của batch được lưu cùng dòng để lúc đọc biết danh sách có bị cắt bớt hay không.
+        """
+        bulk_upsert(
+            CustomerRecommendation,
+            [
+                CustomerRecommendation(
+                    customer_id=customer_id,
+                    algorithm=algorithm,
+                    book_ids=[book_id for book_id, _ in ranked],
+                    scores=[round(score, 4) for _, score in ranked],
+                    details=details,
+                    computed_at=computed_at,
+                    limit=limit
+                )
+                for customer_id, algorithm, ranked, details in rows
+            ],
+            unique_fields=['customer', 'algorithm'],
+            update_fields=['book_ids', 'scores', 'details', 'computed_at', 'limit'],
+            batch_size=500
+        )
+
+    @staticmethod
+    def precompute(workers=1, shards=None, limit=None, chunk_size=2000, progress=None):
+        """
+        Tính lại danh sách gợi ý cho mọi khách hàng
+
+        Dữ liệu được đọc một lần (streaming), rồi chia khách hàng thành các shard
+        (customer_id % shards) và tính trên `workers` process. Mỗi shard được
+        ghi (upsert) ngay khi xong, nên request luôn đọc được danh sách cũ hoặc mới.
+
+        progress: hàm progress(shard, số dòng) được gọi sau mỗi shard
+        Trả về số dòng đã ghi
+        """
+        global _snapshot
+
+        limit = limit or get_precompute_limit()
+        shards = shards or max(workers * 4, 1)
+        computed_at = timezone.now()
+
+        _snapshot = load_snapshot(chunk_size)
+        tasks = [(shard, shards, limit) for shard in range(shards)]
+        written = 0
+        try:
+            if workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+                # Process con kế thừa snapshot (copy-on-write); không được dùng chung kết nối DB
+                connections.close_all()
+                with multiprocessing.get_context('fork').Pool(workers) as pool:
+                    for shard, rows in pool.imap_unordered(score_shard, tasks):
+                        RecommendationDAO.save_rows(rows, computed_at, limit)
+                        written += len(rows)
+                        if progress:
+                            progress(shard, len(rows))
+            else:
+                for task in tasks:
+                    shard, rows = score_shard(task)
+                    RecommendationDAO.save_rows(rows, computed_at, limit)
+                    written += len(rows)
+                    if progress:
+                        progress(shard, len(rows))
+        finally:
+            _snapshot = None
+        return written
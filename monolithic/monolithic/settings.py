@@ -93,6 +93,35 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# Snapshot giỏ hàng (dao/cartDAO.py) được lưu ở đây. Khi chạy nhiều worker
+# cần dùng cache dùng chung (Redis / Memcached) để việc xóa snapshot có hiệu lực cho mọi worker.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "bookstore-monolithic",
+    }
+}
+
+# Gợi ý tính sẵn (dao/recommendationDAO.py, lệnh precompute_recommendations):
+# số sách lưu cho mỗi (khách hàng, thuật toán). Request cần nhiều hơn sẽ tính trực tiếp.
+RECOMMENDATION_PRECOMPUTE_LIMIT = 20
+
+# Danh sách phổ biến cho cold start (dao/popularityDAO.py, lệnh refresh_popularity):
+# số sách mỗi danh sách, số rating "ảo" của Bayesian average, số giây giữ trong bộ nhớ mỗi process.
+POPULARITY_LIST_SIZE = 50
+POPULARITY_PRIOR_WEIGHT = 5
+POPULARITY_CACHE_TTL = 300
+
+# Trang web render phía server (controllers/webController.py): số giây giữ HTML cả trang
+# (key gồm phiên bản catalog nên sách đổi là trang mới) và số giây giữ fragment thẻ sách
+# (key gồm updated_at của sách nên có thể giữ lâu).
+WEB_PAGE_CACHE_TTL = 300
+WEB_FRAGMENT_CACHE_TTL = 86400
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -65,5 +65,19 @@ class OrderAdmin(admin.ModelAdmin):
 
 @admin.register(OrderItem)
 class OrderItemAdmin(admin.ModelAdmin):
-    list_display = ['id', 'order', 'book', 'quantity']
-    search_fields = ['book__title', 'order__customer__name']
\ No newline at end of file
+    list_display = ['id', 'order', 'book', 'quantity', 'price']
+    search_fields = ['book__title', 'order__customer__name']
+
+@admin.register(OrderStatusSummary)
+class OrderStatusSummaryAdmin(admin.ModelAdmin):
+    list_display = ['id', 'status', 'order_count', 'revenue']
+
+@admin.register(DailyRevenue)
+class DailyRevenueAdmin(admin.ModelAdmin):
+    list_display = ['id', 'date', 'order_count', 'revenue']
+    date_hierarchy = 'date'
+
+@admin.register(BookSalesSummary)
+class BookSalesSummaryAdmin(admin.ModelAdmin):
+    list_display = ['book', 'units_sold', 'revenue']
+    search_fields = ['book__title']
\ No newline at end of file
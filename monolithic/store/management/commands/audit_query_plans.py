@@ -0,0 +1,80 @@
+import json
+import re
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from store.models import Book, Cart, CartItem, Rating, Order, OrderItem
+
+# Các truy vấn nóng cần luôn đi qua index.
+# Mỗi truy vấn: tên -> hàm trả về QuerySet (tham số mẫu không ảnh hưởng tới plan).
+HOT_QUERIES = {
+    'active_cart': lambda: Cart.objects.filter(customer_id=1, is_active=True),
+    'cart_items': lambda: CartItem.objects.filter(cart_id=1),
+    'book_ratings': lambda: Rating.objects.filter(book_id=1).values('score'),
+    'customer_liked_ratings': lambda: Rating.objects.filter(customer_id=1, score__gte=4),
+    'order_items': lambda: OrderItem.objects.filter(order_id=1).values('book_id', 'quantity'),
+    'order_item_lookup': lambda: OrderItem.objects.filter(order_id=1, book_id=1),
+    'customer_orders': lambda: Order.objects.filter(customer_id=1).order_by('-order_date'),
+    'orders_by_status': lambda: Order.objects.filter(status='Pending').order_by('-order_date'),
+    'low_stock_books': lambda: Book.objects.filter(stock_quantity__lt=10),
+}
+
+
+def find_full_scans(plan, vendor):
+    """Trả về danh sách bảng bị quét toàn bộ trong plan của EXPLAIN"""
+    if vendor == 'mysql':
+        tables = []
+
+        def walk(node):
+            if isinstance(node, dict):
+                if node.get('access_type') == 'ALL':
+                    tables.append(node.get('table_name', '?'))
+                for value in node.values():
+                    walk(value)
+            elif isinstance(node, list):
+                for value in node:
+                    walk(value)
+
+        walk(json.loads(plan))
+        return tables
+    if vendor == 'postgresql':
+        return re.findall(r'Seq Scan on (\S+)', plan)
+    # SQLite: "SCAN <table>" không kèm "USING ... INDEX" là quét toàn bảng
+    return [
+        match.group(1)
+        for match in re.finditer(r'SCAN (?:TABLE )?(\S+)(.*)', plan)
+        if 'INDEX' not in match.group(2)
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Chạy EXPLAIN cho các truy vấn nóng và báo lỗi nếu có truy vấn quét toàn bảng'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'queries', nargs='*',
+            help='Tên các truy vấn cần kiểm tra (mặc định: tất cả)'
+        )
+
+    def handle(self, *args, **options):
+        names = options['queries'] or list(HOT_QUERIES)
+        unknown = [name for name in names if name not in HOT_QUERIES]
+        if unknown:
+            raise CommandError(f'Unknown queries: {", ".join(unknown)}')
+
+        vendor = connection.vendor
+        failures = []
+        for name in names:
+            queryset = HOT_QUERIES[name]()
+            plan = queryset.explain(format='JSON') if vendor == 'mysql' else queryset.explain()
+            if options['verbosity'] > 1:
+                self.stdout.write(f'--- {name}\n{plan}')
+
+            full_scans = find_full_scans(plan, vendor)
+            if full_scans:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f'FULL SCAN  {name}: {", ".join(full_scans)}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'OK         {name}'))
+
+        if failures:
+            raise CommandError(f'{len(failures)} hot queries regressed to a full scan: {", ".join(failures)}')
@@ -0,0 +1,29 @@
+import sys
+from django.core.management.base import BaseCommand
+from dao.catalogDAO import CatalogDAO, CATALOG_CHUNK_SIZE
+from dao.feedParser import FEED_FORMATS, detect_format
+
+
+class Command(BaseCommand):
+    help = 'Export toàn bộ catalog sách ra file CSV / NDJSON (ghi từng dòng)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', help='File đích (mặc định: stdout)')
+        parser.add_argument('--format', choices=FEED_FORMATS, help='Mặc định đoán theo đuôi file')
+        parser.add_argument('--chunk-size', type=int, default=CATALOG_CHUNK_SIZE, help='Số dòng mỗi lần đọc DB')
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or detect_format(options['path'] or '')
+        lines = CatalogDAO.export_catalog(fmt, chunk_size=max(options['chunk_size'], 1))
+
+        if not options['path']:
+            sys.stdout.writelines(lines)
+            return
+
+        count = 0
+        with open(options['path'], 'w', encoding='utf-8', newline='') as output:
+            for line in lines:
+                output.write(line)
+                count += 1
+        rows = count - 1 if fmt == 'csv' else count
+        self.stdout.write(self.style.SUCCESS(f'Exported {rows} books to {options["path"]}'))
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+from dao.catalogDAO import CatalogDAO, CATALOG_CHUNK_SIZE
+from dao.feedParser import FEED_FORMATS, detect_format, parse_feed_lines
+
+
+class Command(BaseCommand):
+    help = 'Import catalog sách từ file CSV / NDJSON (id,title,author,price,stock_quantity,category)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Đường dẫn file')
+        parser.add_argument('--format', choices=FEED_FORMATS, help='Mặc định đoán theo đuôi file')
+        parser.add_argument('--chunk-size', type=int, default=CATALOG_CHUNK_SIZE, help='Số dòng mỗi lần ghi')
+        parser.add_argument('--dry-run', action='store_true', help='Chỉ kiểm tra dữ liệu, không ghi')
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or detect_format(options['path'])
+
+        def progress(summary):
+            self.stdout.write(
+                f"{summary['processed']} rows: {summary['created']} created, "
+                f"{summary['updated']} updated, {summary['error_count']} errors"
+            )
+
+        try:
+            with open(options['path'], 'rb') as lines:
+                summary = CatalogDAO.import_catalog(
+                    parse_feed_lines(lines, fmt),
+                    chunk_size=max(options['chunk_size'], 1),
+                    dry_run=options['dry_run'],
+                    progress=progress
+                )
+        except OSError as e:
+            raise CommandError(str(e))
+
+        for error in summary['errors']:
+            self.stderr.write(f"line {error['line']}: {error['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Checked' if options['dry_run'] else 'Imported'} {summary['processed']} rows in "
+            f"{summary['chunks']} chunks: {summary['created']} created, {summary['updated']} updated, "
+            f"{summary['error_count']} errors"
+        ))
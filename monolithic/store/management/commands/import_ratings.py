@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from dao.ratingDAO import RatingDAO, RATING_IMPORT_CHUNK_SIZE
+from dao.feedParser import FEED_FORMATS, detect_format, parse_feed_lines
+
+
+class Command(BaseCommand):
+    help = 'Import rating hàng loạt từ file CSV (customer_id,book_id,score) hoặc NDJSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Đường dẫn file')
+        parser.add_argument('--format', choices=FEED_FORMATS, help='Mặc định đoán theo đuôi file')
+        parser.add_argument('--chunk-size', type=int, default=RATING_IMPORT_CHUNK_SIZE, help='Số dòng mỗi lần upsert')
+        parser.add_argument('--dry-run', action='store_true', help='Chỉ kiểm tra dữ liệu, không ghi')
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or detect_format(options['path'])
+
+        def progress(summary):
+            self.stdout.write(
+                f"{summary['processed']} rows, {summary['imported']} imported, {summary['error_count']} errors"
+            )
+
+        try:
+            with open(options['path'], 'rb') as lines:
+                summary = RatingDAO.import_ratings(
+                    parse_feed_lines(lines, fmt),
+                    chunk_size=max(options['chunk_size'], 1),
+                    dry_run=options['dry_run'],
+                    progress=progress if options['verbosity'] > 1 else None
+                )
+        except OSError as e:
+            raise CommandError(str(e))
+
+        for error in summary['errors']:
+            self.stderr.write(f"line {error['line']}: {error['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Checked' if options['dry_run'] else 'Imported'} {summary['imported']} of "
+            f"{summary['processed']} ratings in {summary['chunks']} chunks, {summary['error_count']} errors"
+        ))
@@ -0,0 +1,33 @@
+import time
+from django.core.management.base import BaseCommand
+from dao.recommendationDAO import RecommendationDAO, ALGORITHMS, get_precompute_limit
+from store.models import CustomerRecommendation
+
+
+class Command(BaseCommand):
+    help = 'Tính sẵn danh sách gợi ý top-N cho mọi khách hàng (chạy định kỳ, ví dụ mỗi đêm)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help='Số process tính điểm')
+        parser.add_argument('--shards', type=int, default=None, help='Số shard khách hàng (mặc định workers * 4)')
+        parser.add_argument('--limit', type=int, default=None,
+                            help=f'Số sách lưu cho mỗi thuật toán (mặc định {get_precompute_limit()})')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Số dòng mỗi lần đọc khi streaming')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+
+        def progress(shard, rows):
+            self.stdout.write(f'shard {shard}: {rows} lists')
+
+        written = RecommendationDAO.precompute(
+            workers=options['workers'],
+            shards=options['shards'],
+            limit=options['limit'],
+            chunk_size=options['chunk_size'],
+            progress=progress if options['verbosity'] > 1 else None
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Precomputed {written} lists ({", ".join(ALGORITHMS)}) in {time.perf_counter() - start:.1f}s, '
+            f'{CustomerRecommendation.objects.values("customer").distinct().count()} customers'
+        ))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from dao.analyticsDAO import AnalyticsDAO
+from store.models import OrderStatusSummary, DailyRevenue, BookSalesSummary
+
+
+class Command(BaseCommand):
+    help = 'Tính lại các bảng tổng hợp của dashboard staff từ bảng Order / OrderItem'
+
+    def handle(self, *args, **options):
+        AnalyticsDAO.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt analytics: {OrderStatusSummary.objects.count()} statuses, '
+            f'{DailyRevenue.objects.count()} days, '
+            f'{BookSalesSummary.objects.count()} books'
+        ))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from dao.popularityDAO import PopularityDAO, GLOBAL_SCOPE
+from store.models import PopularityList
+
+
+class Command(BaseCommand):
+    help = 'Tính lại danh sách sách phổ biến cho người dùng mới (chạy định kỳ, ví dụ mỗi giờ)'
+
+    def handle(self, *args, **options):
+        PopularityDAO.refresh()
+        self.stdout.write(self.style.SUCCESS(
+            f'Refreshed popularity: {PopularityList.objects.exclude(scope=GLOBAL_SCOPE).count()} categories, '
+            f'{len(PopularityDAO.get_popular_books(limit=None))} books in the global list'
+        ))
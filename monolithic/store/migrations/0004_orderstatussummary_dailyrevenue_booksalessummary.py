@@ -0,0 +1,62 @@
+# Generated by Django 5.1.1 on 2026-10-19 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0003_staff_email_staff_password"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="book",
+            name="stock_quantity",
+            field=models.IntegerField(db_index=True),
+        ),
+        migrations.CreateModel(
+            name="OrderStatusSummary",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("status", models.CharField(max_length=50, unique=True)),
+                ("order_count", models.IntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="DailyRevenue",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("date", models.DateField(unique=True)),
+                ("order_count", models.IntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="BookSalesSummary",
+            fields=[
+                (
+                    "book",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        serialize=False,
+                        to="store.book",
+                    ),
+                ),
+                ("units_sold", models.IntegerField(db_index=True, default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=14),
+                ),
+            ],
+        ),
+    ]
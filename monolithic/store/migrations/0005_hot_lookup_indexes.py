@@ -0,0 +1,47 @@
+# Generated by Django 5.1.1 on 2026-10-19 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0004_orderstatussummary_dailyrevenue_booksalessummary"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cart",
+            index=models.Index(
+                fields=["customer", "is_active"], name="cart_customer_active_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rating",
+            index=models.Index(fields=["book", "score"], name="rating_book_score_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="rating",
+            index=models.Index(
+                fields=["customer", "score"], name="rating_customer_score_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["customer", "order_date"], name="order_customer_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                fields=["status", "order_date"], name="order_status_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="orderitem",
+            index=models.Index(
+                fields=["order", "book", "quantity"], name="orderitem_order_book_idx"
+            ),
+        ),
+    ]
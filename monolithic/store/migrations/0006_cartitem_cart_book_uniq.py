@@ -0,0 +1,38 @@
+# Generated by Django 5.1.1 on 2026-10-19 11:20
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def merge_duplicate_cart_items(apps, schema_editor):
+    """Gộp các dòng trùng (cart, book) trước khi thêm unique constraint"""
+    CartItem = apps.get_model("store", "CartItem")
+    duplicates = (
+        CartItem.objects.values("cart_id", "book_id")
+        .annotate(item_count=Count("id"), total_quantity=Sum("quantity"))
+        .filter(item_count__gt=1)
+    )
+    for duplicate in duplicates:
+        items = CartItem.objects.filter(
+            cart_id=duplicate["cart_id"], book_id=duplicate["book_id"]
+        ).order_by("id")
+        keep = items.first()
+        CartItem.objects.filter(pk=keep.pk).update(quantity=duplicate["total_quantity"])
+        items.exclude(pk=keep.pk).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0005_hot_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_cart_items, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="cartitem",
+            constraint=models.UniqueConstraint(
+                fields=("cart", "book"), name="cartitem_cart_book_uniq"
+            ),
+        ),
+    ]
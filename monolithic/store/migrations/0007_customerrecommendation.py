@@ -0,0 +1,40 @@
+# Generated by Django 5.1.1 on 2026-10-19 14:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0006_cartitem_cart_book_uniq"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CustomerRecommendation",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("algorithm", models.CharField(max_length=30)),
+                ("book_ids", models.JSONField(default=list)),
+                ("scores", models.JSONField(default=list)),
+                ("details", models.JSONField(default=dict)),
+                ("computed_at", models.DateTimeField(db_index=True)),
+                (
+                    "customer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="store.customer",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("customer", "algorithm"),
+                        name="customerrec_customer_algo_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
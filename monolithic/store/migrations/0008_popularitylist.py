@@ -0,0 +1,22 @@
+# Generated by Django 5.1.1 on 2026-10-19 17:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0007_customerrecommendation"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PopularityList",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("scope", models.CharField(max_length=50, unique=True)),
+                ("items", models.JSONField(default=list)),
+                ("computed_at", models.DateTimeField()),
+            ],
+        ),
+    ]
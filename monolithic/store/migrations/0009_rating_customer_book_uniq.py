@@ -0,0 +1,35 @@
+# Generated by Django 5.1.1 on 2026-10-19 18:10
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def remove_duplicate_ratings(apps, schema_editor):
+    """Giữ rating mới nhất (id lớn nhất) của mỗi (customer, book) trước khi thêm unique constraint"""
+    Rating = apps.get_model("store", "Rating")
+    duplicates = (
+        Rating.objects.values("customer_id", "book_id")
+        .annotate(rating_count=Count("id"), latest_id=Max("id"))
+        .filter(rating_count__gt=1)
+    )
+    for duplicate in duplicates:
+        Rating.objects.filter(
+            customer_id=duplicate["customer_id"], book_id=duplicate["book_id"]
+        ).exclude(pk=duplicate["latest_id"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0008_popularitylist"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_ratings, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="rating",
+            constraint=models.UniqueConstraint(
+                fields=("customer", "book"), name="rating_customer_book_uniq"
+            ),
+        ),
+    ]
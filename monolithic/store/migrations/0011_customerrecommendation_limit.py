@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-19 20:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0010_book_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customerrecommendation",
+            name="limit",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.1 on 2026-10-19 20:50
+
+from django.db import migrations
+from django.utils import timezone
+
+
+def backfill_popularity(apps, schema_editor):
+    """Tính danh sách phổ biến lần đầu, để request không phải tự tính khi bảng còn trống"""
+    from dao.popularityDAO import PopularityDAO
+
+    PopularityList = apps.get_model("store", "PopularityList")
+    if PopularityList.objects.exists():
+        return
+    lists = PopularityDAO.compute_lists(
+        book_model=apps.get_model("store", "Book"),
+        rating_model=apps.get_model("store", "Rating"),
+    )
+    computed_at = timezone.now()
+    PopularityList.objects.bulk_create([
+        PopularityList(scope=scope, items=items, computed_at=computed_at)
+        for scope, items in lists.items()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0011_customerrecommendation_limit"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_popularity, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.1 on 2026-10-19 21:40
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_price(apps, schema_editor):
+    """Đơn hàng cũ không lưu đơn giá - lấy giá hiện tại của sách, là giá mà bảng tổng hợp đang dùng"""
+    Book = apps.get_model("store", "Book")
+    OrderItem = apps.get_model("store", "OrderItem")
+    OrderItem.objects.update(
+        price=Subquery(Book.objects.filter(id=OuterRef("book_id")).values("price")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("store", "0012_backfill_popularitylist"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="orderitem",
+            name="price",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_price, migrations.RunPython.noop),
+    ]
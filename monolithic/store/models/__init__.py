@@ -2,10 +2,14 @@ from .book import Book, Category, Rating
 from .customer import Customer, Address
 from .order import Order, OrderItem, Cart, CartItem, Shipping, Payment
 from .staff import Staff
+from .analytics import OrderStatusSummary, DailyRevenue, BookSalesSummary
+from .recommendation import CustomerRecommendation, PopularityList
 
 __all__ = [
     'Book', 'Category', 'Rating',
     'Customer', 'Address',
     'Order', 'OrderItem', 'Cart', 'CartItem', 'Shipping', 'Payment',
-    'Staff'
+    'Staff',
+    'OrderStatusSummary', 'DailyRevenue', 'BookSalesSummary',
+    'CustomerRecommendation', 'PopularityList'
 ]
\ No newline at end of file
@@ -0,0 +1,34 @@
+from django.db import models
+
+# Các bảng tổng hợp (summary tables) cho dashboard của staff.
+# Được cập nhật tăng dần mỗi khi tạo đơn hàng / đổi trạng thái đơn hàng,
+# để dashboard không phải quét lại bảng Order và OrderItem.
+
+# OrderStatusSummary: Status (unique), Order_Count (int), Revenue (double).
+class OrderStatusSummary(models.Model):
+    id = models.AutoField(primary_key=True)
+    status = models.CharField(max_length=50, unique=True)
+    order_count = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    def __str__(self):
+        return f"{self.status}: {self.order_count} orders"
+
+# DailyRevenue: Date (unique), Order_Count (int), Revenue (double) - không tính đơn đã hủy.
+class DailyRevenue(models.Model):
+    id = models.AutoField(primary_key=True)
+    date = models.DateField(unique=True)
+    order_count = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    def __str__(self):
+        return f"{self.date}: {self.revenue}"
+
+# BookSalesSummary: Book_ID (PK, FK ref Book), Units_Sold (int), Revenue (double) - không tính đơn đã hủy.
+class BookSalesSummary(models.Model):
+    book = models.OneToOneField('Book', on_delete=models.CASCADE, primary_key=True)
+    units_sold = models.IntegerField(default=0, db_index=True)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    def __str__(self):
+        return f"Book {self.book_id}: {self.units_sold} sold"
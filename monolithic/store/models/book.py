@@ -15,9 +15,12 @@ class Book(models.Model):
     id = models.AutoField(primary_key=True)
     title = models.CharField(max_length=200)
     author = models.CharField(max_length=100)
-    stock_quantity = models.IntegerField()
+    stock_quantity = models.IntegerField(db_index=True)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     category = models.ForeignKey(Category, on_delete=models.CASCADE)
+    # Phiên bản của sách cho ETag / Last-Modified - cũng được cập nhật khi rating
+    # hoặc category của sách thay đổi (xem BookDAO.touch)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.title
@@ -29,5 +32,16 @@ class Rating(models.Model):
     book = models.ForeignKey(Book, on_delete=models.CASCADE)
     customer = models.ForeignKey('Customer', on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            # Avg(score) theo sách đọc thẳng từ index, không cần đọc bảng
+            models.Index(fields=['book', 'score'], name='rating_book_score_idx'),
+            models.Index(fields=['customer', 'score'], name='rating_customer_score_idx'),
+        ]
+        constraints = [
+            # Mỗi khách hàng một rating cho mỗi sách - cần cho upsert ở RatingDAO
+            models.UniqueConstraint(fields=['customer', 'book'], name='rating_customer_book_uniq'),
+        ]
+
     def __str__(self):
         return f'Rating {self.score} for {self.book.title} by {self.customer.name}'
\ No newline at end of file
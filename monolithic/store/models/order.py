@@ -6,6 +6,11 @@ class Cart(models.Model):
     is_active = models.BooleanField(default=True)
     customer = models.ForeignKey('Customer', on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['customer', 'is_active'], name='cart_customer_active_idx'),
+        ]
+
     def __str__(self):
         return f"Cart {self.id} for Customer {self.customer.id}"
     
@@ -16,6 +21,12 @@ class CartItem(models.Model):
     cart = models.ForeignKey(Cart, on_delete=models.CASCADE)
     book = models.ForeignKey('Book', on_delete=models.CASCADE)
 
+    class Meta:
+        constraints = [
+            # Mỗi sách chỉ có một dòng trong giỏ - cần cho upsert ở CartDAO.upsert_cart_item
+            models.UniqueConstraint(fields=['cart', 'book'], name='cartitem_cart_book_uniq'),
+        ]
+
     def __str__(self):
         return f"CartItem {self.id} (Quantity: {self.quantity}) in Cart {self.cart.id} for Book {self.book.id}"
     
@@ -48,6 +59,12 @@ class Order(models.Model):
     shipping = models.ForeignKey(Shipping, on_delete=models.CASCADE)
     payment = models.ForeignKey(Payment, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['customer', 'order_date'], name='order_customer_date_idx'),
+            models.Index(fields=['status', 'order_date'], name='order_status_date_idx'),
+        ]
+
     def __str__(self):
         return f"Order {self.id} (Total Price: {self.total_price}, Status: {self.status})"
 
@@ -55,8 +72,16 @@ class Order(models.Model):
 class OrderItem(models.Model):
     id = models.AutoField(primary_key=True)
     quantity = models.IntegerField()
+    # Đơn giá tại thời điểm đặt hàng - giá sách có thể đổi sau đó
+    price = models.DecimalField(max_digits=10, decimal_places=2)
     order = models.ForeignKey(Order, on_delete=models.CASCADE)
     book = models.ForeignKey('Book', on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            # Covering index cho quantity để đọc các dòng của đơn hàng không cần đọc bảng
+            models.Index(fields=['order', 'book', 'quantity'], name='orderitem_order_book_idx'),
+        ]
+
     def __str__(self):
         return f"OrderItem {self.id} (Quantity: {self.quantity}) in Order {self.order.id} for Book {self.book.id}"    
\ No newline at end of file
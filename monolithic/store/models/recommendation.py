@@ -0,0 +1,37 @@
+from django.db import models
+
+# Danh sách gợi ý tính sẵn (batch) cho từng khách hàng, ghi bởi lệnh precompute_recommendations.
+# Request đọc thẳng danh sách này; khách hàng chưa có dòng (cold user) mới tính trực tiếp.
+
+# CustomerRecommendation: Customer_ID (FK), Algorithm, Book_Ids (JSON), Scores (JSON), Details (JSON), Computed_At,
+# Limit (số sách tối đa của lần batch đã ghi dòng này).
+class CustomerRecommendation(models.Model):
+    id = models.AutoField(primary_key=True)
+    customer = models.ForeignKey('Customer', on_delete=models.CASCADE)
+    algorithm = models.CharField(max_length=30)
+    book_ids = models.JSONField(default=list)
+    scores = models.JSONField(default=list)
+    details = models.JSONField(default=dict)
+    computed_at = models.DateTimeField(db_index=True)
+    limit = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            # Một danh sách cho mỗi (khách hàng, thuật toán) - cần cho upsert khi ghi batch
+            models.UniqueConstraint(fields=['customer', 'algorithm'], name='customerrec_customer_algo_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.algorithm} for Customer {self.customer_id}: {len(self.book_ids)} books"
+
+# PopularityList: Scope (unique: 'global' hoặc 'category:<id>'), Items (JSON), Computed_At.
+# Danh sách sách phổ biến cho người dùng mới (cold start), xếp theo rating trung bình Bayesian.
+# Được tính lại định kỳ bởi lệnh refresh_popularity và giữ trong bộ nhớ process (dao/popularityDAO.py).
+class PopularityList(models.Model):
+    id = models.AutoField(primary_key=True)
+    scope = models.CharField(max_length=50, unique=True)
+    items = models.JSONField(default=list)
+    computed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.scope}: {len(self.items)} books"
@@ -7,6 +7,7 @@ urlpatterns = [
     path('search/', bookController.search_books, name='search_books'),
     path('categories/', bookController.list_categories, name='list_categories'),
     path('<int:book_id>/', bookController.get_book, name='get_book'),
+    path('<int:book_id>/page/', bookController.get_book_page, name='get_book_page'),
     
     # Rating
     path('<int:book_id>/ratings/', bookController.get_book_ratings, name='get_book_ratings'),
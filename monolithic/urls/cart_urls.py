@@ -11,4 +11,5 @@ urlpatterns = [
     # Quản lý cart items
     path('update/', customerController.update_cart_item, name='update_cart_item'),
     path('remove/', customerController.remove_from_cart, name='remove_from_cart'),
+    path('items/', customerController.bulk_update_cart_items, name='bulk_update_cart_items'),
 ]
@@ -1,14 +1,15 @@
 from django.urls import path
 from django.views.generic import TemplateView
+from controllers import webController
 
 urlpatterns = [
     # Authentication pages
     path('login/', TemplateView.as_view(template_name='auth/login.html'), name='web_login'),
     path('register/', TemplateView.as_view(template_name='auth/register.html'), name='web_register'),
     
-    # Book pages
-    path('', TemplateView.as_view(template_name='book/list.html'), name='web_home'),
-    path('book/<int:book_id>/', TemplateView.as_view(template_name='book/detail.html'), name='web_book_detail'),
+    # Book pages (render phía server, cache theo phiên bản catalog - xem webController)
+    path('', webController.catalog, name='web_home'),
+    path('book/<int:book_id>/', webController.book_detail, name='web_book_detail'),
     
     # Cart pages
     path('cart/', TemplateView.as_view(template_name='cart/view.html'), name='web_cart'),
@@ -6,9 +6,17 @@ urlpatterns = [
     path('', staffController.list_staff, name='list_staff'),
     path('<int:staff_id>/', staffController.get_staff, name='get_staff'),
     
+    # Thống kê cho dashboard (đọc từ bảng tổng hợp)
+    path('analytics/', staffController.get_dashboard_analytics, name='get_dashboard_analytics'),
+    
     # Nhân viên quản lý sách (moved to bookController)
     path('books/add/', bookController.add_book_to_inventory, name='add_book_to_inventory'),
+    path('books/import/', bookController.import_catalog, name='import_catalog'),
+    path('books/export/', bookController.export_catalog, name='export_catalog'),
     path('books/<int:book_id>/update/', bookController.update_book, name='update_book'),
     path('books/<int:book_id>/stock/', bookController.update_book_stock, name='update_book_stock'),
     path('books/<int:book_id>/delete/', bookController.delete_book, name='delete_book'),
+    
+    # Import rating hàng loạt (CSV / NDJSON)
+    path('ratings/import/', bookController.import_ratings, name='import_ratings'),
 ]
\ No newline at end of file
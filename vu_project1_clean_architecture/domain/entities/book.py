@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Book:
     """
     Book entity representing catalog items
@@ -23,6 +23,30 @@ class Book:
         """Validate book entity after initialization"""
         self.validate()
     
+    @classmethod
+    def from_persisted(
+        cls,
+        id: int,
+        title: str,
+        author: str,
+        stock: int,
+        note: Optional[str] = None,
+        slug: Optional[str] = None
+    ) -> 'Book':
+        """
+        Trusted construction for rows that were validated when they were saved
+        
+        Skips __init__ / validate(), used by repositories for bulk reads.
+        """
+        book = cls.__new__(cls)
+        book.id = id
+        book.title = title
+        book.author = author
+        book.stock = stock
+        book.note = note
+        book.slug = slug
+        return book
+    
     def validate(self):
         """
         Business rules validation for Book entity
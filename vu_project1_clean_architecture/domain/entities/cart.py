@@ -18,6 +18,8 @@ class CartItem:
     book_title: str
     quantity: int
     price: Decimal
+    # Change tracking: set when a persisted item is modified
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate cart item after initialization"""
@@ -47,7 +49,13 @@ class CartItem:
         """
         if new_quantity <= 0:
             raise ValueError("Quantity must be positive")
-        self.quantity = new_quantity
+        if new_quantity != self.quantity:
+            self.quantity = new_quantity
+            self._dirty = True
+    
+    def is_dirty(self) -> bool:
+        """Check if a persisted item has unsaved changes"""
+        return self._dirty
 
 
 @dataclass
@@ -60,6 +68,8 @@ class Cart:
     customer_id: int
     items: List[CartItem] = field(default_factory=list)
     created_at: Optional[datetime] = None
+    # Change tracking: persisted items removed since the last save
+    _removed_items: List[CartItem] = field(default_factory=list, init=False, repr=False, compare=False)
     
     def add_item(self, book_id: int, book_title: str, quantity: int, price: Decimal) -> CartItem:
         """
@@ -101,9 +111,13 @@ class Cart:
         Returns:
             bool: True if item was removed
         """
-        initial_length = len(self.items)
+        removed = [item for item in self.items if item.book_id == book_id]
+        if not removed:
+            return False
+        
         self.items = [item for item in self.items if item.book_id != book_id]
-        return len(self.items) < initial_length
+        self._removed_items.extend(item for item in removed if item.id is not None)
+        return True
     
     def update_item_quantity(self, book_id: int, quantity: int) -> bool:
         """
@@ -143,4 +157,27 @@ class Cart:
     
     def clear(self):
         """Remove all items from cart"""
+        self._removed_items.extend(item for item in self.items if item.id is not None)
         self.items.clear()
+    
+    def get_new_items(self) -> List[CartItem]:
+        """Items added since the last save (not persisted yet)"""
+        return [item for item in self.items if item.id is None]
+    
+    def get_changed_items(self) -> List[CartItem]:
+        """Persisted items modified since the last save"""
+        return [item for item in self.items if item.id is not None and item.is_dirty()]
+    
+    def get_removed_items(self) -> List[CartItem]:
+        """Persisted items removed since the last save"""
+        return list(self._removed_items)
+    
+    def has_changes(self) -> bool:
+        """Check if the cart has unsaved changes"""
+        return bool(self.id is None or self._removed_items or self.get_new_items() or self.get_changed_items())
+    
+    def mark_clean(self):
+        """Reset change tracking after the repository has persisted the cart"""
+        for item in self.items:
+            item._dirty = False
+        self._removed_items.clear()
@@ -65,6 +65,13 @@ class InvalidCredentialsException(AuthenticationException):
         super().__init__("Invalid username or password")
 
 
+class LoginUnavailableException(AuthenticationException):
+    """Exception raised when credentials cannot be checked right now (login overload)"""
+    def __init__(self, retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__("Too many login attempts in progress, retry later")
+
+
 class UserAlreadyExistsException(DomainException):
     """Exception raised when user already exists"""
     def __init__(self, username: str):
@@ -3,7 +3,7 @@ Value Objects for Domain Layer
 Immutable objects that represent domain concepts
 """
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -54,3 +54,49 @@ class SearchCriteria:
     def has_query(self) -> bool:
         """Check if search has query term"""
         return self.query is not None and len(self.query.strip()) > 0
+
+
+MAX_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """Value object for keyset pagination: items after `cursor` (an entity ID), at most `limit`"""
+    cursor: Optional[int] = None
+    limit: int = 50
+    
+    def __post_init__(self):
+        if self.cursor is not None and self.cursor < 0:
+            raise ValueError("Cursor cannot be negative")
+        if self.limit < 1 or self.limit > MAX_PAGE_SIZE:
+            raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+
+
+@dataclass(frozen=True)
+class Page:
+    """Value object for one page of results"""
+    items: Tuple[Any, ...]
+    next_cursor: Optional[int] = None
+    
+    def has_next(self) -> bool:
+        """Check if there are more results after this page"""
+        return self.next_cursor is not None
+
+
+CART_OPERATIONS = ('add', 'set', 'remove')
+
+
+@dataclass(frozen=True)
+class CartOperation:
+    """Value object for one step of a bulk cart update"""
+    op: str
+    book_id: int
+    quantity: int = 0
+    
+    def __post_init__(self):
+        if self.op not in CART_OPERATIONS:
+            raise ValueError(f"Unknown cart operation: {self.op}")
+        if self.op == 'add' and self.quantity <= 0:
+            raise ValueError("Quantity to add must be positive")
+        if self.op == 'set' and self.quantity < 0:
+            raise ValueError("Quantity cannot be negative")
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class FrameworkConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'framework'
+
+    def ready(self):
+        # Connect the token cache invalidation receivers at startup, not on the first authenticated request
+        from framework import authentication  # noqa: F401
@@ -0,0 +1,35 @@
+"""
+Conditional GET helpers
+Framework layer - ETag / Last-Modified from a version timestamp
+"""
+from datetime import datetime
+from typing import Optional, Tuple
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def version_headers(key: str, updated_at: Optional[datetime]) -> Tuple[str, int]:
+    """
+    Build the validators of a resource version
+    
+    Args:
+        key: Resource key, part of the ETag
+        updated_at: Version timestamp (None for an empty collection)
+        
+    Returns:
+        (quoted ETag, Last-Modified as epoch seconds)
+    """
+    timestamp = updated_at.timestamp() if updated_at else 0
+    return quote_etag(f'{key}-{int(timestamp * 1000000)}'), int(timestamp)
+
+
+def not_modified(request, etag: str, last_modified: int):
+    """304 response when If-None-Match / If-Modified-Since match the version, otherwise None"""
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def with_version(response, etag: str, last_modified: int):
+    """Set ETag and Last-Modified on a response"""
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return response
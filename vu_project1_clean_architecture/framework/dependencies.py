@@ -2,18 +2,22 @@
 Dependency Injection Container
 Wires up all dependencies for clean architecture
 """
+from functools import cached_property
 from infrastructure.repositories import (
     DjangoBookRepository,
     DjangoCustomerRepository,
     DjangoCartRepository,
     DjangoAuthRepository
 )
+from infrastructure.identity_map import IdentityMap
+from infrastructure.read_models import DjangoCatalogQueries, DjangoCartQueries
 from usecases.book import ListBooksUseCase, GetBookDetailsUseCase
 from usecases.cart import (
     AddItemToCartUseCase,
     ViewCartUseCase,
     UpdateCartItemUseCase,
-    RemoveItemFromCartUseCase
+    RemoveItemFromCartUseCase,
+    ApplyCartOperationsUseCase
 )
 from usecases.auth import RegisterUserUseCase, LoginUserUseCase, GetUserProfileUseCase
 
@@ -22,51 +26,94 @@ class DependencyContainer:
     """
     Dependency Injection Container
     Manages all application dependencies
+    
+    Repositories are built eagerly; each use case is built the first time
+    it is requested, then reused.
     """
     
     def __init__(self):
+        # Request-scoped identity map shared by repositories (scope opened by IdentityMapMiddleware)
+        self.identity_map = IdentityMap()
+        
         # Initialize repositories (Infrastructure layer)
-        self.book_repository = DjangoBookRepository()
-        self.customer_repository = DjangoCustomerRepository()
-        self.cart_repository = DjangoCartRepository()
+        self.book_repository = DjangoBookRepository(self.identity_map)
+        self.customer_repository = DjangoCustomerRepository(self.identity_map)
+        self.cart_repository = DjangoCartRepository(self.identity_map, self.book_repository)
         self.auth_repository = DjangoAuthRepository()
-        
-        # Initialize use cases (Application layer)
-        self._init_book_use_cases()
-        self._init_cart_use_cases()
-        self._init_auth_use_cases()
-    
-    def _init_book_use_cases(self):
-        """Initialize book-related use cases"""
-        self.list_books_use_case = ListBooksUseCase(self.book_repository)
-        self.get_book_details_use_case = GetBookDetailsUseCase(self.book_repository)
-    
-    def _init_cart_use_cases(self):
-        """Initialize cart-related use cases"""
-        self.add_item_to_cart_use_case = AddItemToCartUseCase(
+    
+    # Book use cases
+    
+    @cached_property
+    def list_books_use_case(self):
+        return ListBooksUseCase(self.book_repository)
+    
+    @cached_property
+    def get_book_details_use_case(self):
+        return GetBookDetailsUseCase(self.book_repository)
+    
+    # Cart use cases
+    
+    @cached_property
+    def add_item_to_cart_use_case(self):
+        return AddItemToCartUseCase(
             self.book_repository,
             self.customer_repository,
             self.cart_repository
         )
-        self.view_cart_use_case = ViewCartUseCase(
+    
+    @cached_property
+    def view_cart_use_case(self):
+        return ViewCartUseCase(
             self.customer_repository,
             self.cart_repository
         )
-        self.update_cart_item_use_case = UpdateCartItemUseCase(
+    
+    @cached_property
+    def update_cart_item_use_case(self):
+        return UpdateCartItemUseCase(
             self.book_repository,
             self.customer_repository,
             self.cart_repository
         )
-        self.remove_item_from_cart_use_case = RemoveItemFromCartUseCase(
+    
+    @cached_property
+    def remove_item_from_cart_use_case(self):
+        return RemoveItemFromCartUseCase(
+            self.customer_repository,
+            self.cart_repository
+        )
+    
+    @cached_property
+    def apply_cart_operations_use_case(self):
+        return ApplyCartOperationsUseCase(
+            self.book_repository,
             self.customer_repository,
             self.cart_repository
         )
     
-    def _init_auth_use_cases(self):
-        """Initialize auth-related use cases"""
-        self.register_user_use_case = RegisterUserUseCase(self.auth_repository)
-        self.login_user_use_case = LoginUserUseCase(self.auth_repository)
-        self.get_user_profile_use_case = GetUserProfileUseCase(self.customer_repository)
+    # Read model queries (query side)
+    
+    @cached_property
+    def catalog_queries(self):
+        return DjangoCatalogQueries()
+    
+    @cached_property
+    def cart_queries(self):
+        return DjangoCartQueries()
+    
+    # Auth use cases
+    
+    @cached_property
+    def register_user_use_case(self):
+        return RegisterUserUseCase(self.auth_repository)
+    
+    @cached_property
+    def login_user_use_case(self):
+        return LoginUserUseCase(self.auth_repository)
+    
+    @cached_property
+    def get_user_profile_use_case(self):
+        return GetUserProfileUseCase(self.customer_repository)
 
 
 # Global container instance
@@ -81,35 +128,67 @@ def get_container() -> DependencyContainer:
     return _container
 
 
-def inject_dependencies(view_class):
+class Inject:
     """
-    Decorator to inject dependencies into view classes
+    Class-level descriptor bound to a container dependency
+    
+    The dependency is looked up once, then stored on the view class itself,
+    so view instances created per request pay nothing for injection.
     """
-    original_init = view_class.__init__
     
-    def new_init(self, **kwargs):
-        original_init(self, **kwargs)
-        container = get_container()
+    def __init__(self, dependency: str):
+        self.dependency = dependency
+        self.attribute = None
+    
+    def __set_name__(self, owner, name):
+        self.attribute = name
+    
+    def __get__(self, instance, owner):
+        value = getattr(get_container(), self.dependency)
+        setattr(owner, self.attribute, value)
+        return value
+
+
+# Explicit registry: view class -> {attribute: container dependency}
+VIEW_DEPENDENCIES = {}
+# Views whose dependencies are resolved on first use instead of at startup
+LAZY_VIEWS = set()
+
+
+def inject_dependencies(lazy: bool = False, **bindings):
+    """
+    Decorator to register the dependencies of a view class
+    
+    Args:
+        lazy: Resolve on first request instead of at startup (rarely used views)
+        **bindings: View attribute -> DependencyContainer attribute
+    
+    Example:
+        @inject_dependencies(list_books_use_case='list_books_use_case')
+        class BookListView(APIView): ...
+    """
+    def decorator(view_class):
+        for attribute, dependency in bindings.items():
+            descriptor = Inject(dependency)
+            setattr(view_class, attribute, descriptor)
+            descriptor.__set_name__(view_class, attribute)
         
-        # Inject use cases based on view class name
-        if 'BookList' in view_class.__name__:
-            self.list_books_use_case = container.list_books_use_case
-        elif 'BookDetail' in view_class.__name__:
-            self.get_book_details_use_case = container.get_book_details_use_case
-        elif 'CartView' in view_class.__name__ and 'Add' not in view_class.__name__ and 'Update' not in view_class.__name__ and 'Remove' not in view_class.__name__:
-            self.view_cart_use_case = container.view_cart_use_case
-        elif 'AddToCart' in view_class.__name__:
-            self.add_item_use_case = container.add_item_to_cart_use_case
-        elif 'UpdateCartItem' in view_class.__name__:
-            self.update_item_use_case = container.update_cart_item_use_case
-        elif 'RemoveFromCart' in view_class.__name__:
-            self.remove_item_use_case = container.remove_item_from_cart_use_case
-        elif 'Register' in view_class.__name__:
-            self.register_use_case = container.register_user_use_case
-        elif 'Login' in view_class.__name__:
-            self.login_use_case = container.login_user_use_case
-        elif 'Profile' in view_class.__name__:
-            self.get_profile_use_case = container.get_user_profile_use_case
-    
-    view_class.__init__ = new_init
-    return view_class
+        VIEW_DEPENDENCIES[view_class] = dict(bindings)
+        if lazy:
+            LAZY_VIEWS.add(view_class)
+        return view_class
+    
+    return decorator
+
+
+def resolve_view_dependencies(include_lazy: bool = False):
+    """
+    Bind every registered view to its dependencies (called once when URLs load)
+    
+    Misconfigured bindings fail here, at startup, instead of on a request.
+    """
+    for view_class, bindings in VIEW_DEPENDENCIES.items():
+        if view_class in LAZY_VIEWS and not include_lazy:
+            continue
+        for attribute in bindings:
+            getattr(view_class, attribute)
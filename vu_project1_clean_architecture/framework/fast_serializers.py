@@ -0,0 +1,70 @@
+"""
+Fast serializers for domain entities
+Framework layer - plain dict builders producing the same JSON as framework.serializers
+"""
+from decimal import Decimal
+from typing import Iterable, List
+from rest_framework import serializers
+
+TWO_PLACES = Decimal('0.01')
+
+# Reused for timezone handling / ISO formatting identical to the DRF serializers
+_datetime_field = serializers.DateTimeField()
+
+
+def _money(value: Decimal) -> str:
+    """Same output as DecimalField(max_digits=10, decimal_places=2)"""
+    return format(value.quantize(TWO_PLACES), 'f')
+
+
+def book_to_dict(book) -> dict:
+    """Same output as BookSerializer"""
+    return {
+        'id': book.id,
+        'title': book.title,
+        'author': book.author,
+        'stock': book.stock,
+        'note': book.note,
+        'slug': book.slug,
+        'is_available': book.is_available(),
+    }
+
+
+def cart_item_to_dict(item) -> dict:
+    """Same output as CartItemSerializer"""
+    return {
+        'id': item.id,
+        'book_id': item.book_id,
+        'book_title': item.book_title,
+        'quantity': item.quantity,
+        'price': _money(item.price),
+        'subtotal': item.get_subtotal(),
+    }
+
+
+def cart_to_dict(cart) -> dict:
+    """Same output as CartSerializer"""
+    return {
+        'id': cart.id,
+        'customer_id': cart.customer_id,
+        'items': [cart_item_to_dict(item) for item in cart.items],
+        'total': cart.get_total(),
+        'total_items': cart.get_total_items(),
+        'created_at': _datetime_field.to_representation(cart.created_at) if cart.created_at else None,
+    }
+
+
+class FastEntitySerializers:
+    """Serialization backend built on plain dict builders"""
+    
+    @staticmethod
+    def book(book) -> dict:
+        return book_to_dict(book)
+    
+    @staticmethod
+    def books(books: Iterable) -> List[dict]:
+        return [book_to_dict(book) for book in books]
+    
+    @staticmethod
+    def cart(cart) -> dict:
+        return cart_to_dict(cart)
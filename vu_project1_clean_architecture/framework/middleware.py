@@ -0,0 +1,19 @@
+"""
+Middleware
+Framework layer - opens the request-scoped identity map used by repositories
+"""
+from framework.dependencies import get_container
+
+
+class IdentityMapMiddleware:
+    """
+    Give every request its own identity map so each aggregate is loaded
+    at most once per request and nothing leaks between requests
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        with get_container().identity_map.scope():
+            return self.get_response(request)
@@ -52,6 +52,18 @@ class CartSerializer(serializers.Serializer):
         return obj.get_total_items()
 
 
+class CartOperationSerializer(serializers.Serializer):
+    """Input serializer for one bulk cart operation"""
+    op = serializers.ChoiceField(choices=['add', 'set', 'remove'])
+    book_id = serializers.IntegerField(min_value=1)
+    quantity = serializers.IntegerField(min_value=0, default=0)
+
+
+class BulkCartUpdateSerializer(serializers.Serializer):
+    """Input serializer for PATCH /api/cart/items"""
+    operations = CartOperationSerializer(many=True, allow_empty=False, max_length=100)
+
+
 class CustomerSerializer(serializers.Serializer):
     """Serializer for Customer entity"""
     id = serializers.IntegerField(read_only=True)
@@ -60,3 +72,51 @@ class CustomerSerializer(serializers.Serializer):
     address = serializers.CharField()
     phone = serializers.CharField()
     note = serializers.CharField(allow_blank=True, allow_null=True)
+
+
+class DRFEntitySerializers:
+    """Serialization backend built on the DRF serializers above (reference implementation)"""
+    
+    @staticmethod
+    def book(book) -> dict:
+        return BookSerializer(book).data
+    
+    @staticmethod
+    def books(books) -> list:
+        return BookSerializer(books, many=True).data
+    
+    @staticmethod
+    def cart(cart) -> dict:
+        return CartSerializer(cart).data
+
+
+def get_entity_serializers(name: str):
+    """
+    Get a serialization backend by name
+    
+    Args:
+        name: 'fast' (dict builders) or 'drf' (DRF serializers)
+        
+    Returns:
+        Backend with book / books / cart methods
+    """
+    from framework.fast_serializers import FastEntitySerializers
+    
+    backends = {
+        'fast': FastEntitySerializers,
+        'drf': DRFEntitySerializers,
+    }
+    return backends[name]
+
+
+class EntitySerializationMixin:
+    """
+    Lets each view pick its serialization backend
+    
+    Set `entity_serialization = 'drf'` on a view to fall back to the DRF serializers.
+    """
+    entity_serialization = 'fast'
+    
+    @property
+    def entity_serializers(self):
+        return get_entity_serializers(self.entity_serialization)
@@ -0,0 +1,37 @@
+"""
+Streaming helpers
+Framework layer - write large JSON arrays chunk by chunk
+"""
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+def stream_json_array(
+    items: Iterable,
+    serialize_chunk: Callable[[List], List[dict]],
+    chunk_size: int = 500
+) -> Iterator[str]:
+    """
+    Yield a JSON array one chunk of items at a time
+    
+    Args:
+        items: Entities to serialize (consumed lazily)
+        serialize_chunk: Converts a list of entities to a list of dicts
+        chunk_size: Entities serialized per chunk
+        
+    Returns:
+        Iterator of JSON text fragments forming one array
+    """
+    encoder = DjangoJSONEncoder(separators=(',', ':'))
+    iterator = iter(items)
+    yield '['
+    first = True
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        body = ','.join(encoder.encode(data) for data in serialize_chunk(chunk))
+        yield body if first else ',' + body
+        first = False
+    yield ']'
@@ -5,25 +5,33 @@ from django.urls import path
 from framework.views import (
     BookListView,
     BookDetailView,
+    BookBySlugView,
     CartView,
     AddToCartView,
     UpdateCartItemView,
     RemoveFromCartView,
+    BulkCartItemsView,
     RegisterView,
     LoginView,
     ProfileView,
 )
+from framework.dependencies import resolve_view_dependencies
+
+# Bind views to their use cases once, when the URLconf is loaded
+resolve_view_dependencies()
 
 urlpatterns = [
     # Book URLs
     path('books', BookListView.as_view(), name='book-list'),
     path('books/<int:book_id>', BookDetailView.as_view(), name='book-detail'),
+    path('books/by-slug/<slug:slug>', BookBySlugView.as_view(), name='book-by-slug'),
     
     # Cart URLs
     path('cart', CartView.as_view(), name='cart'),
     path('cart/add', AddToCartView.as_view(), name='cart-add'),
     path('cart/item/<int:book_id>', UpdateCartItemView.as_view(), name='cart-update'),
     path('cart/item/<int:book_id>', RemoveFromCartView.as_view(), name='cart-remove'),
+    path('cart/items', BulkCartItemsView.as_view(), name='cart-items-bulk'),
     
     # Auth URLs
     path('auth/register', RegisterView.as_view(), name='auth-register'),
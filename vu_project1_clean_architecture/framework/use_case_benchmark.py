@@ -0,0 +1,295 @@
+"""
+Use case benchmark harness
+Drives every use case against a set of repositories (in-memory or Django ORM)
+
+Running the same scenarios on both backends separates domain logic cost
+(in-memory timings) from ORM / database cost (the difference). This module
+does not import Django; the ORM backend is built by the
+benchmark_use_cases management command.
+"""
+import json
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from domain.entities import Book, Customer
+from domain.value_objects import CartOperation, UserCredentials
+from interfaces.repositories import IAuthRepository, IBookRepository, ICartRepository, ICustomerRepository
+
+# Books put in every customer's cart before the cart scenarios run
+CART_SIZE = 5
+# Stock high enough that repeated add_item_to_cart runs never run out
+SEED_STOCK = 10 ** 6
+LOGIN_USERNAME = 'benchmark_login'
+LOGIN_PASSWORD = 'benchmark-password'
+
+
+@dataclass
+class Backend:
+    """Repositories of one backend plus a hook to create a user with a customer profile"""
+    name: str
+    books: IBookRepository
+    customers: ICustomerRepository
+    carts: ICartRepository
+    auth: IAuthRepository
+    # (username, password or None) -> user ID
+    create_customer: Callable[[str, Optional[str]], int]
+
+
+@dataclass
+class Seed:
+    """IDs of the seeded data"""
+    book_ids: List[int]
+    user_ids: List[int]
+
+
+def build_memory_backend() -> Backend:
+    """Backend on the in-memory repositories"""
+    from infrastructure.memory import (
+        InMemoryBookRepository,
+        InMemoryCustomerRepository,
+        InMemoryCartRepository,
+        InMemoryAuthRepository,
+    )
+    books = InMemoryBookRepository()
+    customers = InMemoryCustomerRepository()
+    auth = InMemoryAuthRepository(customers)
+    next_user_id = iter(range(1_000_000, 10 ** 9))
+    
+    def create_customer(username, password=None):
+        if password is not None:
+            from domain.value_objects import UserRegistrationData
+            user_id, _ = auth.register(UserRegistrationData(
+                username=username, password=password, email=None, first_name=None,
+                last_name=None, fullname=username, address='Benchmark street', phone='0123456789'
+            ))
+            return user_id
+        user_id = next(next_user_id)
+        customers.save(Customer(
+            id=None, user_id=user_id, fullname=username, address='Benchmark street', phone='0123456789'
+        ))
+        return user_id
+    
+    return Backend(
+        name='memory',
+        books=books,
+        customers=customers,
+        carts=InMemoryCartRepository(books),
+        auth=auth,
+        create_customer=create_customer,
+    )
+
+
+def seed(backend: Backend, book_count: int, customer_count: int) -> Seed:
+    """Create books, customers and a CART_SIZE-item cart per customer through the repositories"""
+    from usecases.cart import AddItemToCartUseCase
+    
+    book_ids = [
+        backend.books.save(Book(
+            id=None,
+            title=f'Benchmark book {i}',
+            author=f'Author {i % 100}',
+            stock=SEED_STOCK,
+            slug=f'benchmark-book-{i}'
+        )).id
+        for i in range(max(book_count, CART_SIZE * 2))
+    ]
+    user_ids = [backend.create_customer(f'benchmark_{i}', None) for i in range(customer_count)]
+    
+    add_item = AddItemToCartUseCase(backend.books, backend.customers, backend.carts)
+    for user_id in user_ids:
+        for book_id in book_ids[:CART_SIZE]:
+            add_item.execute(user_id, book_id, 1)
+    
+    backend.create_customer(LOGIN_USERNAME, LOGIN_PASSWORD)
+    return Seed(book_ids=book_ids, user_ids=user_ids)
+
+
+# A scenario builds the calls to time: (prepare or None, [(function, args), ...]).
+# prepare runs untimed before each repeat, to restore the state the calls expect.
+Calls = Tuple[Optional[Callable[[], None]], List[Tuple[Callable, tuple]]]
+
+
+def _cycle(seed: Seed, steps: int, per_user: List[int]) -> List[Tuple[int, int]]:
+    """(user_id, book_id) pairs walking users first, then the given books"""
+    pairs = [(user_id, book_id) for book_id in per_user for user_id in seed.user_ids]
+    return [pairs[i % len(pairs)] for i in range(steps)]
+
+
+def list_books(backend, seed, steps) -> Calls:
+    from usecases.book import ListBooksUseCase
+    use_case = ListBooksUseCase(backend.books)
+    return None, [(use_case.execute, ())] * steps
+
+
+def search_books(backend, seed, steps) -> Calls:
+    from usecases.book import ListBooksUseCase
+    use_case = ListBooksUseCase(backend.books)
+    return None, [(use_case.execute, (f'Author {i % 100}',)) for i in range(steps)]
+
+
+def list_books_page(backend, seed, steps) -> Calls:
+    from usecases.book import ListBooksUseCase
+    use_case = ListBooksUseCase(backend.books)
+    cursors = [None] + seed.book_ids[49::50]
+    return None, [(use_case.execute_page, (None, False, cursors[i % len(cursors)], 50)) for i in range(steps)]
+
+
+def get_book_details(backend, seed, steps) -> Calls:
+    from usecases.book import GetBookDetailsUseCase
+    use_case = GetBookDetailsUseCase(backend.books)
+    return None, [(use_case.execute, (seed.book_ids[i % len(seed.book_ids)],)) for i in range(steps)]
+
+
+def get_user_profile(backend, seed, steps) -> Calls:
+    from usecases.auth import GetUserProfileUseCase
+    use_case = GetUserProfileUseCase(backend.customers)
+    return None, [(use_case.execute, (seed.user_ids[i % len(seed.user_ids)],)) for i in range(steps)]
+
+
+def view_cart(backend, seed, steps) -> Calls:
+    from usecases.cart import ViewCartUseCase
+    use_case = ViewCartUseCase(backend.customers, backend.carts)
+    return None, [(use_case.execute, (seed.user_ids[i % len(seed.user_ids)],)) for i in range(steps)]
+
+
+def add_item_to_cart(backend, seed, steps) -> Calls:
+    from usecases.cart import AddItemToCartUseCase
+    use_case = AddItemToCartUseCase(backend.books, backend.customers, backend.carts)
+    pairs = _cycle(seed, steps, seed.book_ids[:CART_SIZE])
+    return None, [(use_case.execute, (user_id, book_id, 1)) for user_id, book_id in pairs]
+
+
+def update_cart_item(backend, seed, steps) -> Calls:
+    from usecases.cart import UpdateCartItemUseCase
+    use_case = UpdateCartItemUseCase(backend.books, backend.customers, backend.carts)
+    pairs = _cycle(seed, steps, seed.book_ids[:CART_SIZE])
+    return None, [
+        (use_case.execute, (user_id, book_id, i % 3 + 1))
+        for i, (user_id, book_id) in enumerate(pairs)
+    ]
+
+
+def apply_cart_operations(backend, seed, steps) -> Calls:
+    from usecases.cart import ApplyCartOperationsUseCase
+    use_case = ApplyCartOperationsUseCase(backend.books, backend.customers, backend.carts)
+    operations = [CartOperation('set', book_id, 2) for book_id in seed.book_ids[:CART_SIZE]]
+    operations.append(CartOperation('add', seed.book_ids[CART_SIZE], 1))
+    operations.append(CartOperation('remove', seed.book_ids[CART_SIZE]))
+    return None, [(use_case.execute, (seed.user_ids[i % len(seed.user_ids)], operations)) for i in range(steps)]
+
+
+def remove_item_from_cart(backend, seed, steps) -> Calls:
+    from usecases.cart import AddItemToCartUseCase, RemoveItemFromCartUseCase
+    use_case = RemoveItemFromCartUseCase(backend.customers, backend.carts)
+    add_item = AddItemToCartUseCase(backend.books, backend.customers, backend.carts)
+    
+    # Each removal needs its own item: at most one call per (user, removable book)
+    removable = seed.book_ids[CART_SIZE:CART_SIZE * 2]
+    pairs = _cycle(seed, min(steps, len(seed.user_ids) * len(removable)), removable)
+    
+    def prepare():
+        for user_id, book_id in pairs:
+            add_item.execute(user_id, book_id, 1)
+    
+    return prepare, [(use_case.execute, pair) for pair in pairs]
+
+
+def login_user(backend, seed, steps) -> Calls:
+    from usecases.auth import LoginUserUseCase
+    use_case = LoginUserUseCase(backend.auth)
+    credentials = UserCredentials(username=LOGIN_USERNAME, password=LOGIN_PASSWORD)
+    return None, [(use_case.execute, (credentials,))] * steps
+
+
+# Order matters: cart scenarios expect the carts built by seed()
+SCENARIOS: Dict[str, Callable[[Backend, Seed, int], Calls]] = {
+    'list_books': list_books,
+    'search_books': search_books,
+    'list_books_page': list_books_page,
+    'get_book_details': get_book_details,
+    'get_user_profile': get_user_profile,
+    'view_cart': view_cart,
+    'add_item_to_cart': add_item_to_cart,
+    'update_cart_item': update_cart_item,
+    'apply_cart_operations': apply_cart_operations,
+    'remove_item_from_cart': remove_item_from_cart,
+    'login_user': login_user,
+}
+
+
+def run_scenario(
+    backend: Backend,
+    seed_data: Seed,
+    name: str,
+    steps: int,
+    repeat: int = 3,
+    around: Optional[Callable] = None
+) -> float:
+    """
+    Time one scenario
+    
+    Args:
+        around: Optional context manager factory wrapping each call (e.g. a
+            request-scoped identity map for the ORM backend)
+    
+    Returns:
+        Best time per call in microseconds
+    """
+    prepare, calls = SCENARIOS[name](backend, seed_data, steps)
+    best = float('inf')
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare()
+        if around is None:
+            start = time.perf_counter()
+            for function, args in calls:
+                function(*args)
+        else:
+            start = time.perf_counter()
+            for function, args in calls:
+                with around():
+                    function(*args)
+        best = min(best, (time.perf_counter() - start) / len(calls))
+    return best * 1e6
+
+
+def compare_to_baseline(results: Dict[str, Dict[str, float]], baseline_path: str, tolerance: float) -> List[str]:
+    """
+    Compare results ({backend: {scenario: µs per call}}) to a saved run
+    
+    Returns:
+        Descriptions of the scenarios slower than baseline * (1 + tolerance)
+    """
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    
+    regressions = []
+    for backend_name, timings in results.items():
+        for name, micros in timings.items():
+            previous = baseline.get(backend_name, {}).get(name)
+            if previous and micros > previous * (1 + tolerance):
+                regressions.append(f'{backend_name}/{name}: {previous:.1f} -> {micros:.1f} µs')
+    return regressions
+
+
+def main():
+    """Run the in-memory backend only (no Django / database needed)"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Benchmark use cases on the in-memory repositories')
+    parser.add_argument('--books', type=int, default=1000)
+    parser.add_argument('--customers', type=int, default=100)
+    parser.add_argument('--steps', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('scenarios', nargs='*', default=list(SCENARIOS))
+    options = parser.parse_args()
+    
+    backend = build_memory_backend()
+    seed_data = seed(backend, options.books, options.customers)
+    for name in options.scenarios:
+        micros = run_scenario(backend, seed_data, name, options.steps, options.repeat)
+        print(f'{name:<24}{micros:>12.1f} µs/call')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,19 @@
 """
 Views package
 """
-from .book_views import BookListView, BookDetailView
-from .cart_views import CartView, AddToCartView, UpdateCartItemView, RemoveFromCartView
+from .book_views import BookListView, BookDetailView, BookBySlugView
+from .cart_views import CartView, AddToCartView, UpdateCartItemView, RemoveFromCartView, BulkCartItemsView
 from .auth_views import RegisterView, LoginView, ProfileView
 
 __all__ = [
     'BookListView',
     'BookDetailView',
+    'BookBySlugView',
     'CartView',
     'AddToCartView',
     'UpdateCartItemView',
     'RemoveFromCartView',
+    'BulkCartItemsView',
     'RegisterView',
     'LoginView',
     'ProfileView',
@@ -9,6 +9,7 @@ from rest_framework.permissions import IsAuthenticated
 from domain.value_objects import UserCredentials, UserRegistrationData
 from domain.exceptions import (
     InvalidCredentialsException,
+    LoginUnavailableException,
     UserAlreadyExistsException,
     CustomerNotFoundException
 )
@@ -16,16 +17,12 @@ from usecases.auth import RegisterUserUseCase, LoginUserUseCase, GetUserProfileU
 from framework.dependencies import inject_dependencies
 
 
-@inject_dependencies
+@inject_dependencies(lazy=True, register_use_case='register_user_use_case')
 class RegisterView(APIView):
     """
     Controller for user registration
     """
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.register_use_case = None  # Will be injected
-    
     def post(self, request):
         """
         POST /api/auth/register/
@@ -72,16 +69,12 @@ class RegisterView(APIView):
             )
 
 
-@inject_dependencies
+@inject_dependencies(login_use_case='login_user_use_case')
 class LoginView(APIView):
     """
     Controller for user login
     """
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.login_use_case = None  # Will be injected
-    
     def post(self, request):
         """
         POST /api/auth/login/
@@ -108,6 +101,12 @@ class LoginView(APIView):
                 {'error': str(e)},
                 status=status.HTTP_401_UNAUTHORIZED
             )
+        except LoginUnavailableException as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+                headers={'Retry-After': str(e.retry_after)}
+            )
         except ValueError as e:
             return Response(
                 {'error': str(e)},
@@ -119,18 +118,13 @@ class LoginView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-@inject_dependencies
-
+@inject_dependencies(lazy=True, get_profile_use_case='get_user_profile_use_case')
 class ProfileView(APIView):
     """
     Controller for user profile
     """
     permission_classes = [IsAuthenticated]
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.get_profile_use_case = None  # Will be injected
-    
     def get(self, request):
         """GET /api/auth/profile/"""
         try:
@@ -6,43 +6,68 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from django.http import StreamingHttpResponse
 from domain.exceptions import BookNotFoundException
-from usecases.book import ListBooksUseCase, GetBookDetailsUseCase
+from domain.value_objects import PageRequest, SearchCriteria
 from framework.dependencies import inject_dependencies
+from framework.streaming import stream_json_array
+from framework.conditional import version_headers, not_modified, with_version
 
 
-@inject_dependencies
+@inject_dependencies(catalog_queries='catalog_queries')
 class BookListView(APIView):
     """
     Controller for listing books
-    Adapter between HTTP and use case
+    Query side - reads rows from the catalog read model
     """
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.list_books_use_case = None  # Will be injected
-    
     def get(self, request):
         """
         GET /api/books/
-        Query params: search, in_stock
+        Query params: search, in_stock, cursor, limit
+        
+        With cursor or limit a single page is returned as
+        {results, next_cursor}; otherwise the whole catalog is streamed
+        as a JSON array with constant memory. Returns 304 when the client
+        holds the current catalog version.
         """
         try:
+            updated_at, count = self.catalog_queries.get_catalog_version()
+            etag, last_modified = version_headers(f'books-{count}', updated_at)
+            response = not_modified(request, etag, last_modified)
+            if response is not None:
+                return response
+            
             search_query = request.query_params.get('search', None)
             in_stock = request.query_params.get('in_stock', 'false').lower() == 'true'
+            cursor = request.query_params.get('cursor')
+            limit = request.query_params.get('limit')
             
-            # Execute use case
-            books = self.list_books_use_case.execute(
-                search_query=search_query,
-                in_stock_only=in_stock
-            )
+            criteria = SearchCriteria(query=search_query, in_stock_only=in_stock)
             
-            # Convert entities to response format
-            from framework.serializers import BookSerializer
-            serializer = BookSerializer(books, many=True)
+            if cursor is not None or limit is not None:
+                # Query one page of ready-to-serialize rows
+                page = self.catalog_queries.get_page(criteria, PageRequest(
+                    cursor=int(cursor) if cursor else None,
+                    limit=int(limit) if limit else 50
+                ))
+                
+                return with_version(Response({
+                    'results': list(page.items),
+                    'next_cursor': page.next_cursor
+                }, status=status.HTTP_200_OK), etag, last_modified)
             
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # Stream rows as they are read
+            return with_version(StreamingHttpResponse(
+                stream_json_array(self.catalog_queries.iterate(criteria), list),
+                content_type='application/json'
+            ), etag, last_modified)
         
+        except ValueError as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return Response(
                 {'error': str(e)},
@@ -50,27 +75,34 @@ class BookListView(APIView):
             )
 
 
-@inject_dependencies
+@inject_dependencies(catalog_queries='catalog_queries')
 class BookDetailView(APIView):
     """
     Controller for getting book details
+    Query side - reads one row from the catalog read model
     """
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.get_book_details_use_case = None  # Will be injected
-    
     def get(self, request, book_id):
-        """GET /api/books/<id>/"""
+        """
+        GET /api/books/<id>/
+        
+        The row version is read first; a client holding it gets 304
+        before the row is read or serialized.
+        """
         try:
-            # Execute use case
-            book = self.get_book_details_use_case.execute(book_id)
+            updated_at = self.catalog_queries.get_book_version(book_id)
+            if updated_at is None:
+                raise BookNotFoundException(book_id)
+            etag, last_modified = version_headers(f'book-{book_id}', updated_at)
+            response = not_modified(request, etag, last_modified)
+            if response is not None:
+                return response
             
-            # Convert entity to response format
-            from framework.serializers import BookSerializer
-            serializer = BookSerializer(book)
+            book = self.catalog_queries.get_book(book_id)
+            if book is None:
+                raise BookNotFoundException(book_id)
             
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return with_version(Response(book, status=status.HTTP_200_OK), etag, last_modified)
         
         except BookNotFoundException as e:
             return Response(
@@ -82,3 +114,29 @@ class BookDetailView(APIView):
                 {'error': str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+@inject_dependencies(catalog_queries='catalog_queries')
+class BookBySlugView(APIView):
+    """
+    Controller for getting book details by slug
+    Query side - reads one row from the catalog read model (slug index)
+    """
+    
+    def get(self, request, slug):
+        """GET /api/books/by-slug/<slug>"""
+        try:
+            book = self.catalog_queries.get_book_by_slug(slug)
+            if book is None:
+                return Response(
+                    {'error': f'Book with slug {slug} not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            
+            return Response(book, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
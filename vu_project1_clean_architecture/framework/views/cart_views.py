@@ -6,6 +6,7 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from django.db import transaction
 from domain.exceptions import (
     BookNotFoundException, 
     CustomerNotFoundException, 
@@ -17,33 +18,33 @@ from usecases.cart import (
     UpdateCartItemUseCase,
     RemoveItemFromCartUseCase
 )
+from domain.value_objects import CartOperation
 from framework.dependencies import inject_dependencies
+from framework.serializers import EntitySerializationMixin, BulkCartUpdateSerializer
 
 
-@inject_dependencies
-class CartView(APIView):
+@inject_dependencies(cart_queries='cart_queries', view_cart_use_case='view_cart_use_case')
+class CartView(EntitySerializationMixin, APIView):
     """
     Controller for viewing cart
+    Query side - serves the cart read model, the use case only for carts not projected yet
     """
     permission_classes = [IsAuthenticated]
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.view_cart_use_case = None  # Will be injected
-    
     def get(self, request):
         """GET /api/cart/"""
         try:
             user_id = request.user.id
             
-            # Execute use case
+            cart_view = self.cart_queries.get_cart_view(user_id)
+            if cart_view is not None:
+                return Response(cart_view, status=status.HTTP_200_OK)
+            
+            # Execute use case (creates the cart on first visit)
             cart = self.view_cart_use_case.execute(user_id)
             
             # Convert entity to response format
-            from framework.serializers import CartSerializer
-            serializer = CartSerializer(cart)
-            
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(self.entity_serializers.cart(cart), status=status.HTTP_200_OK)
         
         except CustomerNotFoundException as e:
             return Response(
@@ -57,17 +58,13 @@ class CartView(APIView):
             )
 
 
-@inject_dependencies
-class AddToCartView(APIView):
+@inject_dependencies(add_item_use_case='add_item_to_cart_use_case')
+class AddToCartView(EntitySerializationMixin, APIView):
     """
     Controller for adding item to cart
     """
     permission_classes = [IsAuthenticated]
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.add_item_use_case = None  # Will be injected
-    
     def post(self, request):
         """
         POST /api/cart/add/
@@ -89,10 +86,7 @@ class AddToCartView(APIView):
             cart = self.add_item_use_case.execute(user_id, book_id, quantity)
             
             # Convert entity to response format
-            from framework.serializers import CartSerializer
-            serializer = CartSerializer(cart)
-            
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            return Response(self.entity_serializers.cart(cart), status=status.HTTP_201_CREATED)
         
         except (BookNotFoundException, CustomerNotFoundException) as e:
             return Response(
@@ -110,18 +104,13 @@ class AddToCartView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-@inject_dependencies
-
-class UpdateCartItemView(APIView):
+@inject_dependencies(update_item_use_case='update_cart_item_use_case')
+class UpdateCartItemView(EntitySerializationMixin, APIView):
     """
     Controller for updating cart item
     """
     permission_classes = [IsAuthenticated]
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.update_item_use_case = None  # Will be injected
-    
     def put(self, request, book_id):
         """
         PUT /api/cart/update/<book_id>/
@@ -142,10 +131,7 @@ class UpdateCartItemView(APIView):
             cart = self.update_item_use_case.execute(user_id, book_id, quantity)
             
             # Convert entity to response format
-            from framework.serializers import CartSerializer
-            serializer = CartSerializer(cart)
-            
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(self.entity_serializers.cart(cart), status=status.HTTP_200_OK)
         
         except (BookNotFoundException, CustomerNotFoundException) as e:
             return Response(
@@ -163,18 +149,13 @@ class UpdateCartItemView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-@inject_dependencies
-
-class RemoveFromCartView(APIView):
+@inject_dependencies(remove_item_use_case='remove_item_from_cart_use_case')
+class RemoveFromCartView(EntitySerializationMixin, APIView):
     """
     Controller for removing item from cart
     """
     permission_classes = [IsAuthenticated]
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.remove_item_use_case = None  # Will be injected
-    
     def delete(self, request, book_id):
         """DELETE /api/cart/remove/<book_id>/"""
         try:
@@ -184,16 +165,58 @@ class RemoveFromCartView(APIView):
             cart = self.remove_item_use_case.execute(user_id, book_id)
             
             # Convert entity to response format
-            from framework.serializers import CartSerializer
-            serializer = CartSerializer(cart)
+            return Response(self.entity_serializers.cart(cart), status=status.HTTP_200_OK)
+        
+        except (BookNotFoundException, CustomerNotFoundException) as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+@inject_dependencies(apply_operations_use_case='apply_cart_operations_use_case')
+class BulkCartItemsView(EntitySerializationMixin, APIView):
+    """
+    Controller for applying several cart changes in one request
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def patch(self, request):
+        """
+        PATCH /api/cart/items
+        Body: {operations: [{op: add|set|remove, book_id: int, quantity: int}, ...]}
+        """
+        input_serializer = BulkCartUpdateSerializer(data=request.data)
+        if not input_serializer.is_valid():
+            return Response(input_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            operations = [
+                CartOperation(**operation)
+                for operation in input_serializer.validated_data['operations']
+            ]
+            
+            # Execute use case - all operations commit or none do
+            with transaction.atomic():
+                cart = self.apply_operations_use_case.execute(request.user.id, operations)
             
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(self.entity_serializers.cart(cart), status=status.HTTP_200_OK)
         
         except (BookNotFoundException, CustomerNotFoundException) as e:
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_404_NOT_FOUND
             )
+        except (InsufficientStockException, ValueError) as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             return Response(
                 {'error': str(e)},
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class InfrastructureConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'infrastructure'
+
+    def ready(self):
+        # Connect the read model projections to the repository write events
+        from infrastructure.read_models import projections  # noqa: F401
@@ -0,0 +1,63 @@
+"""
+Identity Map
+Infrastructure layer - request-scoped cache of loaded aggregates shared by repositories
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Hashable, Tuple
+
+MISSING = object()
+
+
+class IdentityMap:
+    """
+    Keeps one instance per aggregate for the duration of a request
+
+    Repositories look entities up here before querying the database and register
+    what they load or save, so an aggregate is loaded at most once per request and
+    every use case in that request sees the same instance. Outside of a scope
+    (management commands, shell) the map is inactive and repositories always hit
+    the database.
+    """
+
+    def __init__(self):
+        self._entries: ContextVar[Dict[Tuple[str, Hashable], Any]] = ContextVar(
+            'identity_map_entries', default=None
+        )
+
+    @contextmanager
+    def scope(self):
+        """Open a fresh map for the current request"""
+        token = self._entries.set({})
+        try:
+            yield self
+        finally:
+            self._entries.reset(token)
+
+    def is_active(self) -> bool:
+        """Check if a scope is open"""
+        return self._entries.get() is not None
+
+    def get(self, kind: str, key: Hashable) -> Any:
+        """
+        Get a loaded entity
+
+        Returns:
+            The entity, None if it is known not to exist, or MISSING if not loaded yet
+        """
+        entries = self._entries.get()
+        if entries is None:
+            return MISSING
+        return entries.get((kind, key), MISSING)
+
+    def add(self, kind: str, key: Hashable, entity: Any):
+        """Register a loaded entity (or None for a known miss)"""
+        entries = self._entries.get()
+        if entries is not None:
+            entries[(kind, key)] = entity
+
+    def discard(self, kind: str, key: Hashable):
+        """Forget an entity so the next lookup reloads it"""
+        entries = self._entries.get()
+        if entries is not None:
+            entries.pop((kind, key), None)
@@ -0,0 +1,83 @@
+"""
+Book hydration benchmark
+Compares the per-row cost of building Book entities for large catalog reads
+"""
+import time
+from django.core.management.base import BaseCommand
+from domain.entities import Book
+from infrastructure.models import BookModel
+from infrastructure.repositories import DjangoBookRepository
+from infrastructure.repositories.book_repository_impl import BOOK_ENTITY_FIELDS
+
+
+def validated_entity(model):
+    """Previous repository mapping: model instance -> validated dataclass"""
+    return Book(
+        id=model.id,
+        title=model.title,
+        author=model.author,
+        stock=model.stock,
+        note=model.note,
+        slug=model.slug
+    )
+
+
+class Command(BaseCommand):
+    help = 'Measure per-row cost of Book hydration strategies (synthetic rows, optionally the real table)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=100000, help='Number of synthetic rows')
+        parser.add_argument('--repeat', type=int, default=3, help='Runs per strategy (best is reported)')
+        parser.add_argument('--db', action='store_true', help='Also time full reads of the books table')
+    
+    def handle(self, *args, **options):
+        count = options['count']
+        rows = [
+            (i, f'Book {i}', f'Author {i % 500}', i % 50, None, f'book-{i}')
+            for i in range(1, count + 1)
+        ]
+        field_names = [field.attname for field in BookModel._meta.concrete_fields]
+        
+        strategies = {
+            # ORM instantiation + validated dataclass (what get_all used to do)
+            'model + validated entity': lambda: [
+                validated_entity(BookModel.from_db('default', field_names, row)) for row in rows
+            ],
+            # values_list projection, still validating every row
+            'values_list + validated entity': lambda: [Book(*row) for row in rows],
+            # values_list projection + trusted construction (current bulk path)
+            'values_list + from_persisted': lambda: [Book.from_persisted(*row) for row in rows],
+        }
+        
+        self.stdout.write(f'Synthetic rows: {count}')
+        for name, run in strategies.items():
+            self._report(name, run, count, options['repeat'])
+        
+        if options['db']:
+            total = BookModel.objects.count()
+            self.stdout.write(f'\nbooks table: {total} rows')
+            if total:
+                repository = DjangoBookRepository()
+                self._report(
+                    'ORM models + validated entity',
+                    lambda: [validated_entity(model) for model in BookModel.objects.all()],
+                    total, options['repeat']
+                )
+                self._report('repository.get_all()', repository.get_all, total, options['repeat'])
+                self._report(
+                    'values_list only (no entities)',
+                    lambda: list(BookModel.objects.values_list(*BOOK_ENTITY_FIELDS)),
+                    total, options['repeat']
+                )
+    
+    def _report(self, name, run, count, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        
+        self.stdout.write(
+            f'{name:<34} {best * 1000:9.1f} ms total  {best / count * 1e6:7.2f} us/row'
+        )
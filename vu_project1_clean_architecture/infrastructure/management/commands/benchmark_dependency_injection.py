@@ -0,0 +1,106 @@
+"""
+Dependency injection benchmark
+Measures per-request view instantiation cost and startup time of the view registry
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+from django.core.management.base import BaseCommand
+from framework.dependencies import VIEW_DEPENDENCIES, LAZY_VIEWS, get_container
+
+# Startup probe run in a fresh interpreter: load the URLconf (which resolves the registry)
+STARTUP_PROBE = '''
+import time
+started = time.perf_counter()
+import django
+django.setup()
+import framework.urls
+from framework.dependencies import resolve_view_dependencies
+resolve_view_dependencies(include_lazy={include_lazy})
+print(time.perf_counter() - started)
+'''
+
+
+def legacy_inject(view_class):
+    """Previous decorator: wraps __init__ and matches the class name on every instantiation"""
+    original_init = view_class.__init__
+    
+    def new_init(self, **kwargs):
+        original_init(self, **kwargs)
+        container = get_container()
+        name = view_class.__name__
+        if 'BookList' in name:
+            self.list_books_use_case = container.list_books_use_case
+        elif 'BookDetail' in name:
+            self.get_book_details_use_case = container.get_book_details_use_case
+        elif 'CartView' in name and 'Add' not in name and 'Update' not in name and 'Remove' not in name:
+            self.view_cart_use_case = container.view_cart_use_case
+        elif 'AddToCart' in name:
+            self.add_item_use_case = container.add_item_to_cart_use_case
+        elif 'UpdateCartItem' in name:
+            self.update_item_use_case = container.update_cart_item_use_case
+        elif 'RemoveFromCart' in name:
+            self.remove_item_use_case = container.remove_item_from_cart_use_case
+        elif 'Register' in name:
+            self.register_use_case = container.register_user_use_case
+        elif 'Login' in name:
+            self.login_use_case = container.login_user_use_case
+        elif 'Profile' in name:
+            self.get_profile_use_case = container.get_user_profile_use_case
+    
+    view_class.__init__ = new_init
+    return view_class
+
+
+class Command(BaseCommand):
+    help = 'Compare registry-based injection with the previous per-instantiation injection'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=100000, help='View instantiations per view')
+        parser.add_argument('--startup-runs', type=int, default=5, help='Fresh interpreters per startup mode')
+    
+    def handle(self, *args, **options):
+        import framework.urls  # noqa: F401 - resolves the registry
+        
+        iterations = options['iterations']
+        self.stdout.write(f'Per-request view instantiation ({iterations} per view)')
+        for view_class in VIEW_DEPENDENCIES:
+            # Plain subclass so the legacy wrapper does not touch the real view
+            legacy_class = legacy_inject(type(view_class.__name__, (view_class,), {}))
+            registry_cost = self._time(view_class, iterations)
+            legacy_cost = self._time(legacy_class, iterations)
+            self.stdout.write(
+                f'{view_class.__name__:<22} registry {registry_cost:6.2f} us   legacy {legacy_cost:6.2f} us'
+            )
+        
+        lazy = ', '.join(sorted(view.__name__ for view in LAZY_VIEWS)) or '-'
+        self.stdout.write(f'\nResolved on first request: {lazy}')
+        
+        self.stdout.write('\nStartup (fresh interpreter, median)')
+        for label, include_lazy in (('startup views only', False), ('all views eagerly', True)):
+            timings = [self._startup(include_lazy) for _ in range(options['startup_runs'])]
+            self.stdout.write(f'{label:<22} {statistics.median(timings) * 1000:8.1f} ms')
+    
+    def _time(self, view_class, iterations):
+        """Average microseconds to instantiate the view and read its use case"""
+        attributes = list(VIEW_DEPENDENCIES.get(view_class, {})) or list(
+            VIEW_DEPENDENCIES[view_class.__mro__[1]]
+        )
+        started = time.perf_counter()
+        for _ in range(iterations):
+            view = view_class()
+            for attribute in attributes:
+                getattr(view, attribute)
+        return (time.perf_counter() - started) / iterations * 1e6
+    
+    def _startup(self, include_lazy):
+        result = subprocess.run(
+            [sys.executable, '-c', STARTUP_PROBE.format(include_lazy=include_lazy)],
+            capture_output=True, text=True, check=True,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get(
+                'DJANGO_SETTINGS_MODULE', 'vu_project1_clean_architecture.settings'
+            )}
+        )
+        return float(result.stdout.strip().splitlines()[-1])
@@ -0,0 +1,93 @@
+"""
+Serializer benchmark
+Compares DRF serializers with the fast dict builders for books and carts
+"""
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from domain.entities import Book, Cart, CartItem
+from framework.serializers import get_entity_serializers
+
+ITEMS_PER_CART = 10
+
+
+def make_books(count):
+    return [
+        Book.from_persisted(i, f'Book {i}', f'Author {i % 500}', i % 50, None, f'book-{i}')
+        for i in range(1, count + 1)
+    ]
+
+
+def make_carts(item_count):
+    """Carts of ITEMS_PER_CART items, item_count items in total"""
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    carts = []
+    for cart_id in range(1, item_count // ITEMS_PER_CART + 1):
+        items = [
+            CartItem(
+                id=cart_id * ITEMS_PER_CART + i,
+                book_id=i + 1,
+                book_title=f'Book {i + 1}',
+                quantity=i % 3 + 1,
+                price=Decimal(f'{i + 1}.50')
+            )
+            for i in range(ITEMS_PER_CART)
+        ]
+        carts.append(Cart(id=cart_id, customer_id=cart_id, items=items, created_at=created_at))
+    return carts
+
+
+class Command(BaseCommand):
+    help = 'Measure serialization throughput of books and carts for each serialization backend'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+            help='Number of books / cart items per run'
+        )
+        parser.add_argument('--repeat', type=int, default=3, help='Runs per case (best is reported)')
+    
+    def handle(self, *args, **options):
+        renderer = JSONRenderer()
+        backends = ['drf', 'fast']
+        
+        for size in options['sizes']:
+            books = make_books(size)
+            carts = make_carts(size)
+            
+            # Both backends must render identical JSON
+            for name, payload in (
+                ('books', lambda backend: backend.books(books[:100])),
+                ('carts', lambda backend: [backend.cart(cart) for cart in carts[:10]]),
+            ):
+                outputs = {renderer.render(payload(get_entity_serializers(b))) for b in backends}
+                if len(outputs) != 1:
+                    self.stdout.write(self.style.WARNING(f'{name}: backends produce different JSON'))
+            
+            self.stdout.write(f'\n{size} items')
+            for backend_name in backends:
+                backend = get_entity_serializers(backend_name)
+                self._report(
+                    f'books  {backend_name}',
+                    lambda: renderer.render(backend.books(books)),
+                    size, options['repeat']
+                )
+                self._report(
+                    f'carts  {backend_name}',
+                    lambda: renderer.render([backend.cart(cart) for cart in carts]),
+                    size, options['repeat']
+                )
+    
+    def _report(self, name, run, count, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        
+        self.stdout.write(
+            f'{name:<12} {best * 1000:9.1f} ms  {count / best:12,.0f} items/s'
+        )
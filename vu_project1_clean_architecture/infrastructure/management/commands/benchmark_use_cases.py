@@ -0,0 +1,131 @@
+"""
+Use case benchmark
+Runs every use case on the in-memory and Django ORM repositories
+"""
+import json
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from domain.entities import Customer
+from framework.use_case_benchmark import (
+    SCENARIOS,
+    Backend,
+    build_memory_backend,
+    compare_to_baseline,
+    run_scenario,
+    seed,
+)
+from infrastructure.identity_map import IdentityMap
+from infrastructure.repositories import (
+    DjangoAuthRepository,
+    DjangoBookRepository,
+    DjangoCartRepository,
+    DjangoCustomerRepository,
+)
+
+
+class _Rollback(Exception):
+    """Raised to discard the data created by the ORM run"""
+
+
+def build_orm_backend(identity_map: IdentityMap) -> Backend:
+    """Backend on the Django repositories, wired like DependencyContainer"""
+    books = DjangoBookRepository(identity_map)
+    customers = DjangoCustomerRepository(identity_map)
+    
+    def create_customer(username, password=None):
+        if password is not None:
+            user = User.objects.create_user(username=username, password=password)
+        else:
+            # No password hashing for the bulk of the seeded users
+            user = User.objects.create(username=username)
+        customers.save(Customer(
+            id=None, user_id=user.id, fullname=username, address='Benchmark street', phone='0123456789'
+        ))
+        return user.id
+    
+    return Backend(
+        name='orm',
+        books=books,
+        customers=customers,
+        carts=DjangoCartRepository(identity_map, books),
+        auth=DjangoAuthRepository(),
+        create_customer=create_customer,
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        'Time each use case on the in-memory and Django ORM repositories '
+        '(ORM data is created in a transaction that is rolled back)'
+    )
+    
+    def add_arguments(self, parser):
+        parser.add_argument('scenarios', nargs='*', help=f'Scenarios to run (default: all): {", ".join(SCENARIOS)}')
+        parser.add_argument('--books', type=int, default=1000, help='Number of seeded books')
+        parser.add_argument('--customers', type=int, default=100, help='Number of seeded customers')
+        parser.add_argument('--steps', type=int, default=200, help='Use case calls per run')
+        parser.add_argument('--repeat', type=int, default=3, help='Runs per scenario (best is reported)')
+        parser.add_argument('--backend', choices=['memory', 'orm'], help='Run a single backend')
+        parser.add_argument(
+            '--identity-map', action='store_true',
+            help='Open a request-scoped identity map around each ORM call, as IdentityMapMiddleware does'
+        )
+        parser.add_argument('--save-baseline', metavar='PATH', help='Write the timings to a JSON file')
+        parser.add_argument('--baseline', metavar='PATH', help='Fail if a scenario is slower than this saved run')
+        parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown vs --baseline (0.25 = 25%%)')
+    
+    def handle(self, *args, **options):
+        names = options['scenarios'] or list(SCENARIOS)
+        unknown = [name for name in names if name not in SCENARIOS]
+        if unknown:
+            raise CommandError(f'Unknown scenarios: {", ".join(unknown)}')
+        
+        backends = [options['backend']] if options['backend'] else ['memory', 'orm']
+        results = {}
+        if 'memory' in backends:
+            backend = build_memory_backend()
+            results['memory'] = self._run(backend, names, options)
+        if 'orm' in backends:
+            identity_map = IdentityMap()
+            around = identity_map.scope if options['identity_map'] else None
+            try:
+                with transaction.atomic():
+                    results['orm'] = self._run(build_orm_backend(identity_map), names, options, around)
+                    raise _Rollback()
+            except _Rollback:
+                pass
+        
+        self._report(names, results)
+        
+        if options['save_baseline']:
+            with open(options['save_baseline'], 'w') as baseline_file:
+                json.dump(results, baseline_file, indent=2)
+            self.stdout.write(f'Baseline written to {options["save_baseline"]}')
+        
+        if options['baseline']:
+            regressions = compare_to_baseline(results, options['baseline'], options['tolerance'])
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(f'SLOWER  {regression}'))
+            if regressions:
+                raise CommandError(f'{len(regressions)} scenarios regressed beyond {options["tolerance"]:.0%}')
+    
+    def _run(self, backend, names, options, around=None):
+        seed_data = seed(backend, options['books'], options['customers'])
+        return {
+            name: run_scenario(backend, seed_data, name, options['steps'], options['repeat'], around)
+            for name in names
+        }
+    
+    def _report(self, names, results):
+        self.stdout.write(f'{"scenario":<24}{"memory µs":>12}{"orm µs":>12}{"orm overhead":>14}')
+        for name in names:
+            memory = results.get('memory', {}).get(name)
+            orm = results.get('orm', {}).get(name)
+            overhead = f'{orm / memory:>13.1f}x' if memory and orm else f'{"-":>14}'
+            self.stdout.write(
+                f'{name:<24}'
+                f'{memory if memory is not None else float("nan"):>12.1f}'
+                f'{orm if orm is not None else float("nan"):>12.1f}'
+                f'{overhead}'
+            )
@@ -0,0 +1,28 @@
+"""
+Rebuild read models
+Recomputes the catalog and cart read models from the write tables
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from infrastructure.models import CatalogReadModel, CartReadModel
+from infrastructure.read_models.projections import rebuild_catalog, rebuild_carts
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the catalog / cart read models (after raw SQL edits or restoring a dump)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--only', choices=['catalog', 'carts'], help='Rebuild a single read model')
+    
+    def handle(self, *args, **options):
+        only = options['only']
+        with transaction.atomic():
+            if only in (None, 'catalog'):
+                rebuild_catalog()
+            if only in (None, 'carts'):
+                rebuild_carts()
+        
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt read models: {CatalogReadModel.objects.count()} books, '
+            f'{CartReadModel.objects.count()} carts'
+        ))
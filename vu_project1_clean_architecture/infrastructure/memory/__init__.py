@@ -0,0 +1,18 @@
+"""
+In-Memory Repository Implementations
+Dict / list backed implementations of the repository interfaces
+
+No Django imports: use cases can be driven (tests, benchmarks) without a
+database, which isolates domain logic cost from ORM / database cost.
+"""
+from .book_repository import InMemoryBookRepository
+from .customer_repository import InMemoryCustomerRepository
+from .cart_repository import InMemoryCartRepository
+from .auth_repository import InMemoryAuthRepository
+
+__all__ = [
+    'InMemoryBookRepository',
+    'InMemoryCustomerRepository',
+    'InMemoryCartRepository',
+    'InMemoryAuthRepository',
+]
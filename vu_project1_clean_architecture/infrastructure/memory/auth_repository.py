@@ -0,0 +1,75 @@
+"""
+In-Memory Auth Repository
+"""
+import hashlib
+import secrets
+from typing import Dict, Optional, Tuple
+from domain.entities import Customer
+from domain.value_objects import UserCredentials, UserRegistrationData
+from domain.exceptions import UserAlreadyExistsException
+from interfaces.repositories import IAuthRepository, ICustomerRepository
+
+
+class InMemoryAuthRepository(IAuthRepository):
+    """
+    In-memory implementation of Auth repository
+    
+    Passwords are stored as a single salted SHA-256, not a slow password hash:
+    this backend measures use case cost, it must never hold real credentials.
+    """
+    
+    def __init__(self, customer_repository: ICustomerRepository):
+        self.customer_repository = customer_repository
+        # username -> (user_id, salt, password digest)
+        self._users: Dict[str, Tuple[int, bytes, bytes]] = {}
+        self._tokens: Dict[int, str] = {}
+        self._next_user_id = 1
+    
+    @staticmethod
+    def _digest(salt: bytes, password: str) -> bytes:
+        return hashlib.sha256(salt + password.encode()).digest()
+    
+    def authenticate(self, credentials: UserCredentials) -> Optional[int]:
+        """Authenticate user"""
+        user = self._users.get(credentials.username)
+        if user is None:
+            return None
+        
+        user_id, salt, digest = user
+        if secrets.compare_digest(digest, self._digest(salt, credentials.password)):
+            return user_id
+        return None
+    
+    def register(self, registration_data: UserRegistrationData) -> Tuple[int, int]:
+        """Register new user with customer profile"""
+        if registration_data.username in self._users:
+            raise UserAlreadyExistsException(registration_data.username)
+        
+        user_id = self._next_user_id
+        self._next_user_id += 1
+        salt = secrets.token_bytes(16)
+        self._users[registration_data.username] = (
+            user_id, salt, self._digest(salt, registration_data.password)
+        )
+        
+        customer = self.customer_repository.save(Customer(
+            id=None,
+            user_id=user_id,
+            fullname=registration_data.fullname,
+            address=registration_data.address,
+            phone=registration_data.phone,
+            note=registration_data.note or ''
+        ))
+        
+        return user_id, customer.id
+    
+    def user_exists(self, username: str) -> bool:
+        """Check if user exists"""
+        return username in self._users
+    
+    def get_or_create_token(self, user_id: int) -> str:
+        """Get or create authentication token (40 hex chars, like DRF tokens)"""
+        token = self._tokens.get(user_id)
+        if token is None:
+            token = self._tokens[user_id] = secrets.token_hex(20)
+        return token
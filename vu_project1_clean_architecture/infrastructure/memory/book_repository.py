@@ -0,0 +1,114 @@
+"""
+In-Memory Book Repository
+"""
+from bisect import bisect_right, insort
+from typing import Dict, Iterable, Iterator, List, Optional
+from domain.entities import Book
+from domain.value_objects import Page, PageRequest, SearchCriteria
+from interfaces.repositories import IBookRepository
+
+
+class InMemoryBookRepository(IBookRepository):
+    """
+    In-memory implementation of Book repository
+    
+    Rows are stored as tuples in Book.from_persisted argument order and every
+    read builds fresh entities, like the ORM implementation does outside of an
+    identity map scope. IDs are kept in a sorted list for keyset pagination.
+    """
+    
+    def __init__(self, books: Iterable[Book] = ()):
+        self._rows: Dict[int, tuple] = {}
+        self._ids: List[int] = []
+        self._next_id = 1
+        for book in books:
+            self.save(book)
+    
+    def _matches(self, row: tuple, criteria: SearchCriteria) -> bool:
+        """Same semantics as the ORM filter (icontains on title / author, stock > 0)"""
+        if criteria.has_query():
+            query = criteria.query.lower()
+            if query not in row[1].lower() and query not in row[2].lower():
+                return False
+        if criteria.in_stock_only and row[3] <= 0:
+            return False
+        return True
+    
+    def _select(self, criteria: SearchCriteria, cursor: Optional[int] = None) -> Iterator[tuple]:
+        """Rows matching criteria with ID greater than cursor, ordered by ID"""
+        start = bisect_right(self._ids, cursor) if cursor is not None else 0
+        for book_id in self._ids[start:]:
+            row = self._rows[book_id]
+            if self._matches(row, criteria):
+                yield row
+    
+    def get_all(self) -> List[Book]:
+        """Get all books"""
+        return [Book.from_persisted(*self._rows[book_id]) for book_id in self._ids]
+    
+    def get_by_id(self, book_id: int) -> Optional[Book]:
+        """Get book by ID"""
+        row = self._rows.get(book_id)
+        return Book.from_persisted(*row) if row else None
+    
+    def get_by_ids(self, book_ids: Iterable[int]) -> Dict[int, Book]:
+        """Get several books by ID"""
+        return {
+            book_id: Book.from_persisted(*self._rows[book_id])
+            for book_id in book_ids
+            if book_id in self._rows
+        }
+    
+    def search(self, criteria: SearchCriteria) -> List[Book]:
+        """Search books based on criteria"""
+        return [Book.from_persisted(*row) for row in self._select(criteria)]
+    
+    def _fetch_after(self, criteria: SearchCriteria, cursor: Optional[int], limit: int) -> List[Book]:
+        books = []
+        for row in self._select(criteria, cursor):
+            if len(books) == limit:
+                break
+            books.append(Book.from_persisted(*row))
+        return books
+    
+    def get_page(self, criteria: SearchCriteria, page_request: PageRequest) -> Page:
+        """Get one page of books (keyset pagination on ID)"""
+        books = self._fetch_after(criteria, page_request.cursor, page_request.limit + 1)
+        
+        if len(books) > page_request.limit:
+            books = books[:page_request.limit]
+            return Page(items=tuple(books), next_cursor=books[-1].id)
+        return Page(items=tuple(books))
+    
+    def iterate(self, criteria: SearchCriteria, chunk_size: int = 500) -> Iterator[Book]:
+        """Iterate over books matching criteria, ordered by ID"""
+        for row in self._select(criteria):
+            yield Book.from_persisted(*row)
+    
+    def save(self, book: Book) -> Book:
+        """Save or update book"""
+        if book.id is None:
+            book_id = self._next_id
+        else:
+            book_id = book.id
+        self._next_id = max(self._next_id, book_id + 1)
+        
+        if book_id not in self._rows:
+            insort(self._ids, book_id)
+        self._rows[book_id] = (book_id, book.title, book.author, book.stock, book.note, book.slug)
+        return Book.from_persisted(*self._rows[book_id])
+    
+    def delete(self, book_id: int) -> bool:
+        """Delete book by ID (cart items are not cascaded, unlike the database)"""
+        if self._rows.pop(book_id, None) is None:
+            return False
+        self._ids.pop(bisect_right(self._ids, book_id) - 1)
+        return True
+    
+    def update_stock(self, book_id: int, quantity_change: int) -> bool:
+        """Update book stock"""
+        row = self._rows.get(book_id)
+        if row is None or row[3] + quantity_change < 0:
+            return False
+        self._rows[book_id] = row[:3] + (row[3] + quantity_change,) + row[4:]
+        return True
@@ -0,0 +1,103 @@
+"""
+In-Memory Cart Repository
+"""
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from domain.entities import Cart, CartItem
+from interfaces.repositories import ICartRepository
+
+
+class InMemoryCartRepository(ICartRepository):
+    """
+    In-memory implementation of Cart repository
+    
+    Carts are stored as rows (customer_id, created_at) and items as lists
+    [id, book_id, title, quantity, price] keyed by book ID. Reads build fresh
+    entities; save() flushes only the changes tracked by the entity.
+    """
+    
+    def __init__(self, book_repository=None):
+        self._carts: Dict[int, tuple] = {}
+        self._by_customer: Dict[int, int] = {}
+        self._items: Dict[int, Dict[int, list]] = {}
+        self._next_cart_id = 1
+        self._next_item_id = 1
+        # Current book titles are read from the book repository (the ORM joins the book)
+        self.book_repository = book_repository
+    
+    def _title(self, row: list) -> str:
+        if self.book_repository is not None:
+            book = self.book_repository.get_by_id(row[1])
+            if book is not None:
+                return book.title
+        return row[2]
+    
+    def _to_entity(self, cart_id: int) -> Cart:
+        customer_id, created_at = self._carts[cart_id]
+        items = [
+            CartItem(id=row[0], book_id=row[1], book_title=self._title(row), quantity=row[3], price=row[4])
+            for row in self._items[cart_id].values()
+        ]
+        return Cart(id=cart_id, customer_id=customer_id, items=items, created_at=created_at)
+    
+    def _new_item_id(self) -> int:
+        item_id = self._next_item_id
+        self._next_item_id += 1
+        return item_id
+    
+    def get_by_customer_id(self, customer_id: int) -> Optional[Cart]:
+        """Get cart by customer ID"""
+        cart_id = self._by_customer.get(customer_id)
+        return self._to_entity(cart_id) if cart_id is not None else None
+    
+    def get_by_id(self, cart_id: int) -> Optional[Cart]:
+        """Get cart by ID"""
+        return self._to_entity(cart_id) if cart_id in self._carts else None
+    
+    def save(self, cart: Cart) -> Cart:
+        """Save or update cart (returns the same entity, like the ORM implementation)"""
+        if cart.id is None:
+            cart.id = self._next_cart_id
+            cart.created_at = datetime.now(timezone.utc)
+        if cart.id not in self._carts:
+            self._carts[cart.id] = (cart.customer_id, cart.created_at)
+            self._by_customer[cart.customer_id] = cart.id
+            self._items[cart.id] = {}
+        self._next_cart_id = max(self._next_cart_id, cart.id + 1)
+        
+        items = self._items[cart.id]
+        for item in cart.get_removed_items():
+            items.pop(item.book_id, None)
+        for item in cart.get_changed_items():
+            row = items[item.book_id]
+            row[3] = item.quantity
+            row[4] = item.price
+        for item in cart.get_new_items():
+            item.id = self._new_item_id()
+            items[item.book_id] = [item.id, item.book_id, item.book_title, item.quantity, item.price]
+        
+        cart.mark_clean()
+        return cart
+    
+    def save_item(self, cart_id: int, item: CartItem) -> CartItem:
+        """Save or update cart item"""
+        items = self._items[cart_id]
+        row = items.get(item.book_id)
+        if row is None:
+            row = [self._new_item_id(), item.book_id, item.book_title, item.quantity, item.price]
+            items[item.book_id] = row
+        else:
+            row[3] = item.quantity
+            row[4] = item.price
+        return CartItem(id=row[0], book_id=row[1], book_title=self._title(row), quantity=row[3], price=row[4])
+    
+    def delete_item(self, cart_id: int, book_id: int) -> bool:
+        """Delete cart item"""
+        return self._items.get(cart_id, {}).pop(book_id, None) is not None
+    
+    def clear(self, cart_id: int) -> bool:
+        """Clear all items from cart"""
+        if cart_id not in self._carts:
+            return False
+        self._items[cart_id].clear()
+        return True
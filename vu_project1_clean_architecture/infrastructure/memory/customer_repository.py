@@ -0,0 +1,49 @@
+"""
+In-Memory Customer Repository
+"""
+from dataclasses import replace
+from typing import Dict, Optional
+from domain.entities import Customer
+from interfaces.repositories import ICustomerRepository
+
+
+class InMemoryCustomerRepository(ICustomerRepository):
+    """
+    In-memory implementation of Customer repository
+    
+    Stores copies of the entities so callers cannot change stored state
+    without calling save(), as with a database.
+    """
+    
+    def __init__(self):
+        self._customers: Dict[int, Customer] = {}
+        self._by_user: Dict[int, int] = {}
+        self._next_id = 1
+    
+    def get_by_id(self, customer_id: int) -> Optional[Customer]:
+        """Get customer by ID"""
+        customer = self._customers.get(customer_id)
+        return replace(customer) if customer else None
+    
+    def get_by_user_id(self, user_id: int) -> Optional[Customer]:
+        """Get customer by user ID"""
+        customer_id = self._by_user.get(user_id)
+        return self.get_by_id(customer_id) if customer_id is not None else None
+    
+    def save(self, customer: Customer) -> Customer:
+        """Save or update customer"""
+        customer_id = customer.id if customer.id is not None else self._next_id
+        self._next_id = max(self._next_id, customer_id + 1)
+        
+        stored = replace(customer, id=customer_id)
+        self._customers[customer_id] = stored
+        self._by_user[stored.user_id] = customer_id
+        return replace(stored)
+    
+    def delete(self, customer_id: int) -> bool:
+        """Delete customer by ID"""
+        customer = self._customers.pop(customer_id, None)
+        if customer is None:
+            return False
+        self._by_user.pop(customer.user_id, None)
+        return True
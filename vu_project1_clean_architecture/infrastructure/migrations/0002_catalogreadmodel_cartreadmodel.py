@@ -0,0 +1,40 @@
+# Generated by Django 5.1.1 on 2026-10-19 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("infrastructure", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CatalogReadModel",
+            fields=[
+                ("book_id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("title", models.CharField(max_length=255)),
+                ("author", models.CharField(max_length=255)),
+                ("stock", models.PositiveIntegerField()),
+                ("note", models.TextField(blank=True, null=True)),
+                ("slug", models.CharField(max_length=50)),
+                ("is_available", models.BooleanField(db_index=True)),
+            ],
+            options={
+                "db_table": "read_catalog",
+            },
+        ),
+        migrations.CreateModel(
+            name="CartReadModel",
+            fields=[
+                ("cart_id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("customer_id", models.BigIntegerField(unique=True)),
+                ("user_id", models.IntegerField(unique=True)),
+                ("data", models.JSONField()),
+            ],
+            options={
+                "db_table": "read_cart",
+            },
+        ),
+    ]
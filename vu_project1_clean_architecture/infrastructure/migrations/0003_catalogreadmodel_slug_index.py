@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-19 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("infrastructure", "0002_catalogreadmodel_cartreadmodel"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="catalogreadmodel",
+            name="slug",
+            field=models.CharField(db_index=True, max_length=50),
+        ),
+    ]
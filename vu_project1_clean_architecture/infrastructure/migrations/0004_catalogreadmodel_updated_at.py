@@ -0,0 +1,22 @@
+# Generated by Django 5.1.1 on 2026-10-19 19:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("infrastructure", "0003_catalogreadmodel_slug_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="catalogreadmodel",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, db_index=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
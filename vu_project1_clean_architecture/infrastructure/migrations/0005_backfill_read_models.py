@@ -0,0 +1,57 @@
+# Generated by Django 5.1.1 on 2026-10-19 20:20
+
+from django.db import migrations
+
+from infrastructure.read_models.projections import cart_payload, catalog_fields
+
+CHUNK_SIZE = 2000
+
+
+def backfill_read_models(apps, schema_editor):
+    """Project the books and carts written before the read models existed"""
+    BookModel = apps.get_model("infrastructure", "BookModel")
+    CartModel = apps.get_model("infrastructure", "CartModel")
+    CatalogReadModel = apps.get_model("infrastructure", "CatalogReadModel")
+    CartReadModel = apps.get_model("infrastructure", "CartReadModel")
+
+    projected = set(CatalogReadModel.objects.values_list("book_id", flat=True))
+    batch = []
+    for book_id, *row in BookModel.objects.order_by("id").values_list(
+        "id", "title", "author", "stock", "note", "slug"
+    ).iterator(chunk_size=CHUNK_SIZE):
+        if book_id in projected:
+            continue
+        batch.append(CatalogReadModel(book_id=book_id, **catalog_fields(*row)))
+        if len(batch) >= CHUNK_SIZE:
+            CatalogReadModel.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        CatalogReadModel.objects.bulk_create(batch)
+
+    projected = set(CartReadModel.objects.values_list("cart_id", flat=True))
+    carts = []
+    for cart in CartModel.objects.exclude(id__in=projected).select_related(
+        "customer"
+    ).prefetch_related("items__book"):
+        data = cart_payload(
+            cart.id, cart.customer_id, cart.created_at,
+            (
+                (item.id, item.book_id, item.book.title, item.quantity, item.price)
+                for item in cart.items.all()
+            ),
+        )
+        carts.append(CartReadModel(
+            cart_id=cart.id, customer_id=cart.customer_id, user_id=cart.customer.user_id, data=data
+        ))
+    CartReadModel.objects.bulk_create(carts, batch_size=CHUNK_SIZE, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("infrastructure", "0004_catalogreadmodel_updated_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_read_models, migrations.RunPython.noop),
+    ]
@@ -73,3 +73,42 @@ class CartItemModel(models.Model):
         
     def __str__(self):
         return f"{self.quantity} of {self.book.title}"
+
+
+class CatalogReadModel(models.Model):
+    """
+    Read model for catalog queries - one denormalized row per book
+    Query side - maintained by infrastructure.read_models.projections
+    """
+    book_id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=255)
+    author = models.CharField(max_length=255)
+    stock = models.PositiveIntegerField()
+    note = models.TextField(blank=True, null=True)
+    slug = models.CharField(max_length=50, db_index=True)
+    is_available = models.BooleanField(db_index=True)
+    # Set on every projection write - version of the row for ETag / Last-Modified
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        db_table = 'read_catalog'
+
+    def __str__(self):
+        return self.title
+
+
+class CartReadModel(models.Model):
+    """
+    Read model for cart queries - the cart response (titles, subtotals, totals) precomputed
+    Query side - maintained by infrastructure.read_models.projections
+    """
+    cart_id = models.BigIntegerField(primary_key=True)
+    customer_id = models.BigIntegerField(unique=True)
+    user_id = models.IntegerField(unique=True)
+    data = models.JSONField()
+
+    class Meta:
+        db_table = 'read_cart'
+
+    def __str__(self):
+        return f"Cart view {self.cart_id}"
@@ -0,0 +1,166 @@
+"""
+Password Pool
+Infrastructure layer - login password hashing in a dedicated process pool with a bounded queue
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Tuple
+from django.conf import settings
+
+
+class LoginQueueFull(Exception):
+    """Too many logins are waiting for a hashing worker - the client should retry later"""
+
+    def __init__(self, retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__('Too many login attempts in progress, retry later')
+
+
+def _init_worker():
+    import django
+    django.setup()
+
+
+def _verify(password: str, encoded: str) -> Tuple[bool, Optional[str]]:
+    """
+    Check a password in a worker process
+
+    Returns:
+        tuple: (valid, re-hashed password or None) - the new hash is produced when
+        the stored one uses an older hasher or a lower work factor
+    """
+    from django.contrib.auth.hashers import check_password, make_password
+
+    upgraded = []
+    valid = check_password(password, encoded, setter=lambda raw: upgraded.append(make_password(raw)))
+    return valid, upgraded[0] if upgraded else None
+
+
+def _hash(password: str) -> str:
+    """Hash a password in a worker process (also used to equalize timing for unknown users)"""
+    from django.contrib.auth.hashers import make_password
+    return make_password(password)
+
+
+class PasswordPool:
+    """
+    Process pool for password hashing with backpressure
+
+    At most `max_pending` checks are queued or running; beyond that submit()
+    raises LoginQueueFull immediately instead of queueing, so a login storm
+    cannot occupy the request workers that serve catalog and cart traffic.
+    """
+
+    def __init__(self, workers: int, max_pending: int, timeout: float):
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn: never fork a process that is running request threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker
+                )
+            return self._executor
+
+    def _reset(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, function, *args):
+        """
+        Run function(*args) in the pool and wait for the result
+
+        Raises:
+            LoginQueueFull: If the queue is full or the result takes longer than the timeout
+        """
+        if not self._slots.acquire(blocking=False):
+            raise LoginQueueFull()
+
+        executor = self._get_executor()
+        try:
+            future = executor.submit(function, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot is freed when the worker is done, even if the caller stopped waiting
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise LoginQueueFull()
+        except BrokenProcessPool:
+            # A worker died: start a fresh pool for the next request
+            self._reset(executor)
+            raise
+
+
+password_pool = PasswordPool(
+    workers=getattr(settings, 'LOGIN_HASH_WORKERS', 2),
+    max_pending=getattr(settings, 'LOGIN_HASH_MAX_PENDING', 32),
+    timeout=getattr(settings, 'LOGIN_HASH_TIMEOUT', 5)
+)
+
+
+def _login_failed(username: str, request) -> None:
+    """Send user_login_failed with the password masked, as django.contrib.auth.authenticate does"""
+    from django.contrib.auth import user_login_failed
+
+    credentials = {'username': username, 'password': '*' * 20}
+    user_login_failed.send(sender=__name__, credentials=credentials, request=request)
+
+
+def authenticate_offloaded(username: str, password: str, request=None):
+    """
+    Same result as django.contrib.auth.authenticate with ModelBackend, with the
+    password hashing done in the pool
+
+    Stored hashes made with an older hasher are replaced by the preferred one
+    (first entry of PASSWORD_HASHERS) after a successful check. Every rejection,
+    including a saturated pool, sends user_login_failed like authenticate() does.
+
+    Returns:
+        User if the credentials are valid and the account is active, None otherwise
+
+    Raises:
+        LoginQueueFull: If the hashing pool is saturated
+    """
+    from django.contrib.auth import get_user_model
+
+    UserModel = get_user_model()
+    try:
+        user = UserModel._default_manager.get_by_natural_key(username)
+    except UserModel.DoesNotExist:
+        user = None
+
+    try:
+        if user is None:
+            # Hash anyway so unknown usernames take as long as wrong passwords
+            password_pool.run(_hash, password)
+            valid, upgraded = False, None
+        else:
+            valid, upgraded = password_pool.run(_verify, password, user.password)
+    except LoginQueueFull:
+        _login_failed(username, request)
+        raise
+
+    if valid and upgraded:
+        user.password = upgraded
+        user.save(update_fields=['password'])
+
+    if not valid or not user.is_active:
+        _login_failed(username, request)
+        return None
+
+    return user
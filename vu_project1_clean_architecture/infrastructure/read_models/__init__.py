@@ -0,0 +1,10 @@
+"""
+Read Models (query side)
+Denormalized tables kept up to date from repository write events
+"""
+from .queries import DjangoCatalogQueries, DjangoCartQueries
+
+__all__ = [
+    'DjangoCatalogQueries',
+    'DjangoCartQueries',
+]
@@ -0,0 +1,39 @@
+"""
+Repository write events
+Sent by repositories after a write; projections keep the read models in sync
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.dispatch import Signal
+
+# kwargs: cart (entity, as saved) or cart_id (reload from the database)
+cart_changed = Signal()
+
+# kwargs: book (entity, as saved) or book_id (reload from the database)
+book_changed = Signal()
+
+# kwargs: book_id, cart_ids (carts that contained the book before the delete)
+book_deleted = Signal()
+
+# Set while a repository writes: it sends the events above itself, so the
+# model save/delete signals are left to writes that bypass the repositories
+_repository_write = ContextVar('repository_write', default=False)
+
+
+@contextmanager
+def repository_write():
+    """
+    Mark the model writes of a repository method (its events are sent explicitly)
+
+    Usable as a context manager or as a method decorator: @repository_write()
+    """
+    token = _repository_write.set(True)
+    try:
+        yield
+    finally:
+        _repository_write.reset(token)
+
+
+def in_repository_write() -> bool:
+    """True inside repository_write()"""
+    return _repository_write.get()
@@ -0,0 +1,211 @@
+"""
+Projections
+Write events -> read model rows (runs in the transaction of the write)
+
+Repositories send the events in events.py. Writes that bypass them (admin,
+shell, cascades of a customer delete) are projected from the model
+post_save / post_delete signals instead.
+"""
+from decimal import Decimal
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.fields import DateTimeField
+from infrastructure.models import (
+    BookModel,
+    CartModel,
+    CartItemModel,
+    CustomerModel,
+    CatalogReadModel,
+    CartReadModel,
+)
+from .events import cart_changed, book_changed, book_deleted, in_repository_write
+
+TWO_PLACES = Decimal('0.01')
+
+# Same timestamp format as the API serializers
+_datetime_field = DateTimeField()
+
+
+def catalog_fields(title, author, stock, note, slug) -> dict:
+    """Columns of a catalog row (shape of the book API response)"""
+    return {
+        'title': title,
+        'author': author,
+        'stock': stock,
+        'note': note,
+        'slug': slug,
+        'is_available': stock > 0,
+    }
+
+
+def cart_payload(cart_id, customer_id, created_at, items) -> dict:
+    """
+    Build the cart API response
+    
+    Args:
+        items: Iterable of (id, book_id, book_title, quantity, price)
+    """
+    rows = []
+    total = Decimal('0')
+    total_items = 0
+    for item_id, book_id, book_title, quantity, price in items:
+        subtotal = price * quantity
+        total += subtotal
+        total_items += quantity
+        rows.append({
+            'id': item_id,
+            'book_id': book_id,
+            'book_title': book_title,
+            'quantity': quantity,
+            'price': format(price.quantize(TWO_PLACES), 'f'),
+            'subtotal': float(subtotal),
+        })
+    
+    return {
+        'id': cart_id,
+        'customer_id': customer_id,
+        'items': rows,
+        'total': float(total) if rows else 0,
+        'total_items': total_items,
+        'created_at': _datetime_field.to_representation(created_at) if created_at else None,
+    }
+
+
+def _store_cart(cart_id, customer_id, data):
+    user_id = CustomerModel.objects.filter(id=customer_id).values_list('user_id', flat=True).first()
+    if user_id is None:
+        return
+    CartReadModel.objects.update_or_create(
+        cart_id=cart_id,
+        defaults={'customer_id': customer_id, 'user_id': user_id, 'data': data}
+    )
+
+
+def project_cart_entity(cart):
+    """Project a cart entity that was just saved (no reload)"""
+    data = cart_payload(
+        cart.id, cart.customer_id, cart.created_at,
+        ((item.id, item.book_id, item.book_title, item.quantity, item.price) for item in cart.items)
+    )
+    _store_cart(cart.id, cart.customer_id, data)
+
+
+def project_carts(cart_ids):
+    """Re-project carts from the write tables"""
+    found = set()
+    for cart in CartModel.objects.filter(id__in=list(cart_ids)).prefetch_related('items__book'):
+        found.add(cart.id)
+        data = cart_payload(
+            cart.id, cart.customer_id, cart.created_at,
+            ((item.id, item.book_id, item.book.title, item.quantity, item.price) for item in cart.items.all())
+        )
+        _store_cart(cart.id, cart.customer_id, data)
+    
+    missing = set(cart_ids) - found
+    if missing:
+        CartReadModel.objects.filter(cart_id__in=missing).delete()
+
+
+def project_book(book_id, fields=None):
+    """
+    Project one book into the catalog read model
+    
+    Returns:
+        Previous title, or None if the book was not projected before
+    """
+    if fields is None:
+        row = BookModel.objects.filter(id=book_id).values_list(
+            'title', 'author', 'stock', 'note', 'slug'
+        ).first()
+        if row is None:
+            CatalogReadModel.objects.filter(book_id=book_id).delete()
+            return None
+        fields = catalog_fields(*row)
+    
+    previous_title = CatalogReadModel.objects.filter(book_id=book_id).values_list('title', flat=True).first()
+    CatalogReadModel.objects.update_or_create(book_id=book_id, defaults=fields)
+    return previous_title
+
+
+def rebuild_catalog(chunk_size=2000):
+    """Rebuild the whole catalog read model from the books table"""
+    CatalogReadModel.objects.all().delete()
+    batch = []
+    for book_id, *row in BookModel.objects.values_list(
+        'id', 'title', 'author', 'stock', 'note', 'slug'
+    ).iterator(chunk_size=chunk_size):
+        batch.append(CatalogReadModel(book_id=book_id, **catalog_fields(*row)))
+        if len(batch) >= chunk_size:
+            CatalogReadModel.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        CatalogReadModel.objects.bulk_create(batch)
+
+
+def rebuild_carts():
+    """Rebuild every cart read model from the cart tables"""
+    CartReadModel.objects.all().delete()
+    project_carts(list(CartModel.objects.values_list('id', flat=True)))
+
+
+@receiver(cart_changed)
+def on_cart_changed(sender, cart=None, cart_id=None, **kwargs):
+    if cart is not None:
+        project_cart_entity(cart)
+    else:
+        project_carts([cart_id])
+
+
+@receiver(book_changed)
+def on_book_changed(sender, book=None, book_id=None, **kwargs):
+    if book is not None:
+        book_id = book.id
+        fields = catalog_fields(book.title, book.author, book.stock, book.note, book.slug)
+        previous_title = project_book(book_id, fields)
+        title = book.title
+    else:
+        previous_title = project_book(book_id)
+        title = CatalogReadModel.objects.filter(book_id=book_id).values_list('title', flat=True).first()
+    
+    # Carts show book titles - refresh them only when the title changed
+    if previous_title is not None and previous_title != title:
+        project_carts(set(CartItemModel.objects.filter(book_id=book_id).values_list('cart_id', flat=True)))
+
+
+@receiver(book_deleted)
+def on_book_deleted(sender, book_id, cart_ids=(), **kwargs):
+    CatalogReadModel.objects.filter(book_id=book_id).delete()
+    if cart_ids:
+        project_carts(cart_ids)
+
+
+@receiver(post_save, sender=BookModel)
+def on_book_model_saved(sender, instance, **kwargs):
+    if not in_repository_write():
+        on_book_changed(sender, book_id=instance.pk)
+
+
+@receiver(post_delete, sender=BookModel)
+def on_book_model_deleted(sender, instance, **kwargs):
+    # Carts of the book are refreshed by the cascaded cart item deletes
+    if not in_repository_write():
+        CatalogReadModel.objects.filter(book_id=instance.pk).delete()
+
+
+@receiver(post_save, sender=CartModel)
+def on_cart_model_saved(sender, instance, **kwargs):
+    if not in_repository_write():
+        project_carts([instance.pk])
+
+
+@receiver(post_delete, sender=CartModel)
+def on_cart_model_deleted(sender, instance, **kwargs):
+    if not in_repository_write():
+        CartReadModel.objects.filter(cart_id=instance.pk).delete()
+
+
+@receiver(post_save, sender=CartItemModel)
+@receiver(post_delete, sender=CartItemModel)
+def on_cart_item_model_changed(sender, instance, **kwargs):
+    if not in_repository_write():
+        project_carts([instance.cart_id])
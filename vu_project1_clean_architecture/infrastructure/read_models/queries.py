@@ -0,0 +1,99 @@
+"""
+Query handlers
+Read ready-to-serialize rows from the read models, without building entities
+"""
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+from django.db.models import Count, Max, Q
+from domain.value_objects import Page, PageRequest, SearchCriteria
+from interfaces.queries import ICatalogQueries, ICartQueries
+from infrastructure.models import CatalogReadModel, CartReadModel
+
+CATALOG_FIELDS = ('book_id', 'title', 'author', 'stock', 'note', 'slug', 'is_available')
+
+
+def _catalog_row(row) -> dict:
+    """Read model row -> book API response"""
+    book_id, title, author, stock, note, slug, is_available = row
+    return {
+        'id': book_id,
+        'title': title,
+        'author': author,
+        'stock': stock,
+        'note': note,
+        'slug': slug,
+        'is_available': is_available,
+    }
+
+
+class DjangoCatalogQueries(ICatalogQueries):
+    """
+    Catalog queries over the read_catalog table
+    """
+    
+    def _filter(self, criteria: SearchCriteria):
+        queryset = CatalogReadModel.objects.all()
+        if criteria.has_query():
+            queryset = queryset.filter(
+                Q(title__icontains=criteria.query) |
+                Q(author__icontains=criteria.query)
+            )
+        if criteria.in_stock_only:
+            queryset = queryset.filter(is_available=True)
+        return queryset
+    
+    def _fetch_after(self, queryset, cursor: Optional[int], limit: int):
+        if cursor is not None:
+            queryset = queryset.filter(book_id__gt=cursor)
+        return [
+            _catalog_row(row)
+            for row in queryset.order_by('book_id').values_list(*CATALOG_FIELDS)[:limit]
+        ]
+    
+    def get_book(self, book_id: int) -> Optional[dict]:
+        """Get one book row"""
+        row = CatalogReadModel.objects.filter(book_id=book_id).values_list(*CATALOG_FIELDS).first()
+        return _catalog_row(row) if row else None
+    
+    def get_book_version(self, book_id: int) -> Optional[datetime]:
+        """Get the updated_at of one book row (single column read)"""
+        return CatalogReadModel.objects.filter(book_id=book_id).values_list('updated_at', flat=True).first()
+    
+    def get_catalog_version(self) -> Tuple[Optional[datetime], int]:
+        """Get the latest updated_at and row count (aggregate over the updated_at index)"""
+        version = CatalogReadModel.objects.aggregate(updated_at=Max('updated_at'), count=Count('book_id'))
+        return version['updated_at'], version['count']
+    
+    def get_book_by_slug(self, slug: str) -> Optional[dict]:
+        """Get one book row by slug (indexed column)"""
+        row = CatalogReadModel.objects.filter(slug=slug).values_list(*CATALOG_FIELDS).first()
+        return _catalog_row(row) if row else None
+    
+    def get_page(self, criteria: SearchCriteria, page_request: PageRequest) -> Page:
+        """Get one page of book rows (keyset pagination on ID)"""
+        rows = self._fetch_after(self._filter(criteria), page_request.cursor, page_request.limit + 1)
+        if len(rows) > page_request.limit:
+            rows = rows[:page_request.limit]
+            return Page(items=tuple(rows), next_cursor=rows[-1]['id'])
+        return Page(items=tuple(rows))
+    
+    def iterate(self, criteria: SearchCriteria, chunk_size: int = 500) -> Iterator[dict]:
+        """Iterate over book rows in keyset chunks"""
+        queryset = self._filter(criteria)
+        cursor = None
+        while True:
+            rows = self._fetch_after(queryset, cursor, chunk_size)
+            yield from rows
+            if len(rows) < chunk_size:
+                return
+            cursor = rows[-1]['id']
+
+
+class DjangoCartQueries(ICartQueries):
+    """
+    Cart queries over the read_cart table
+    """
+    
+    def get_cart_view(self, user_id: int) -> Optional[dict]:
+        """Get the precomputed cart response of a user"""
+        return CartReadModel.objects.filter(user_id=user_id).values_list('data', flat=True).first()
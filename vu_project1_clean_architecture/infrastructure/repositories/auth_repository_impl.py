@@ -4,12 +4,12 @@ Infrastructure layer - implements repository interface using Django Auth
 """
 from typing import Optional, Tuple
 from django.contrib.auth.models import User
-from django.contrib.auth import authenticate
 from rest_framework.authtoken.models import Token
 from domain.value_objects import UserCredentials, UserRegistrationData
-from domain.exceptions import UserAlreadyExistsException
+from domain.exceptions import LoginUnavailableException, UserAlreadyExistsException
 from interfaces.repositories import IAuthRepository
 from infrastructure.models import CustomerModel
+from infrastructure.password_pool import LoginQueueFull, authenticate_offloaded
 
 
 class DjangoAuthRepository(IAuthRepository):
@@ -18,11 +18,11 @@ class DjangoAuthRepository(IAuthRepository):
     """
     
     def authenticate(self, credentials: UserCredentials) -> Optional[int]:
-        """Authenticate user"""
-        user = authenticate(
-            username=credentials.username,
-            password=credentials.password
-        )
+        """Authenticate user (password hashing runs in the login process pool)"""
+        try:
+            user = authenticate_offloaded(credentials.username, credentials.password)
+        except LoginQueueFull as e:
+            raise LoginUnavailableException(e.retry_after)
         
         if user is not None:
             return user.id
@@ -2,12 +2,17 @@
 Book Repository Implementation
 Infrastructure layer - implements repository interface using Django ORM
 """
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from django.db.models import Q
 from domain.entities import Book
-from domain.value_objects import SearchCriteria
+from domain.value_objects import Page, PageRequest, SearchCriteria
 from interfaces.repositories import IBookRepository
-from infrastructure.models import BookModel
+from infrastructure.models import BookModel, CartItemModel
+from infrastructure.identity_map import IdentityMap, MISSING
+from infrastructure.read_models.events import book_changed, book_deleted, repository_write
+
+# Columns needed to build a Book entity, in Book.from_persisted argument order
+BOOK_ENTITY_FIELDS = ('id', 'title', 'author', 'stock', 'note', 'slug')
 
 
 class DjangoBookRepository(IBookRepository):
@@ -15,9 +20,20 @@ class DjangoBookRepository(IBookRepository):
     Django ORM implementation of Book repository
     """
     
+    def __init__(self, identity_map: Optional[IdentityMap] = None):
+        self.identity_map = identity_map or IdentityMap()
+    
+    def from_model(self, model: BookModel) -> Book:
+        """Convert model to entity, reusing the instance already loaded in this request"""
+        book = self.identity_map.get('book', model.id)
+        if book is MISSING or book is None:
+            book = self._to_entity(model)
+            self.identity_map.add('book', model.id, book)
+        return book
+    
     def _to_entity(self, model: BookModel) -> Book:
-        """Convert Django model to domain entity"""
-        return Book(
+        """Convert Django model to domain entity (persisted row - validation skipped)"""
+        return Book.from_persisted(
             id=model.id,
             title=model.title,
             author=model.author,
@@ -26,6 +42,28 @@ class DjangoBookRepository(IBookRepository):
             slug=model.slug
         )
     
+    def hydrate(self, queryset) -> List[Book]:
+        """
+        Trusted bulk path for catalog reads
+        
+        Projects only the entity columns with values_list and builds entities
+        without re-running validation on rows that came from the database.
+        """
+        rows = queryset.values_list(*BOOK_ENTITY_FIELDS).iterator(chunk_size=2000)
+        from_persisted = Book.from_persisted
+        
+        if not self.identity_map.is_active():
+            return [from_persisted(*row) for row in rows]
+        
+        books = []
+        for row in rows:
+            book = self.identity_map.get('book', row[0])
+            if book is MISSING or book is None:
+                book = from_persisted(*row)
+                self.identity_map.add('book', row[0], book)
+            books.append(book)
+        return books
+    
     def _to_model(self, entity: Book, model: BookModel = None) -> BookModel:
         """Convert domain entity to Django model"""
         if model is None:
@@ -41,19 +79,39 @@ class DjangoBookRepository(IBookRepository):
     
     def get_all(self) -> List[Book]:
         """Get all books"""
-        models = BookModel.objects.all()
-        return [self._to_entity(model) for model in models]
+        return self.hydrate(BookModel.objects.all())
     
     def get_by_id(self, book_id: int) -> Optional[Book]:
         """Get book by ID"""
+        book = self.identity_map.get('book', book_id)
+        if book is not MISSING:
+            return book
+        
         try:
             model = BookModel.objects.get(id=book_id)
-            return self._to_entity(model)
+            return self.from_model(model)
         except BookModel.DoesNotExist:
+            self.identity_map.add('book', book_id, None)
             return None
     
-    def search(self, criteria: SearchCriteria) -> List[Book]:
-        """Search books based on criteria"""
+    def get_by_ids(self, book_ids: Iterable[int]) -> Dict[int, Book]:
+        """Get several books in one query (books already loaded in this request are reused)"""
+        books = {}
+        missing = []
+        for book_id in book_ids:
+            book = self.identity_map.get('book', book_id)
+            if book is MISSING:
+                missing.append(book_id)
+            elif book is not None:
+                books[book_id] = book
+        
+        if missing:
+            for model in BookModel.objects.filter(id__in=missing):
+                books[model.id] = self.from_model(model)
+        return books
+    
+    def _filter(self, criteria: SearchCriteria):
+        """Build the queryset for search criteria"""
         queryset = BookModel.objects.all()
         
         # Apply search query
@@ -67,8 +125,46 @@ class DjangoBookRepository(IBookRepository):
         if criteria.in_stock_only:
             queryset = queryset.filter(stock__gt=0)
         
-        return [self._to_entity(model) for model in queryset]
+        return queryset
+    
+    def search(self, criteria: SearchCriteria) -> List[Book]:
+        """Search books based on criteria"""
+        return self.hydrate(self._filter(criteria))
+    
+    def _fetch_after(self, queryset, cursor: Optional[int], limit: int) -> List[Book]:
+        """Keyset query: at most `limit` books with ID greater than cursor"""
+        if cursor is not None:
+            queryset = queryset.filter(id__gt=cursor)
+        rows = queryset.order_by('id').values_list(*BOOK_ENTITY_FIELDS)[:limit]
+        return [Book.from_persisted(*row) for row in rows]
+    
+    def get_page(self, criteria: SearchCriteria, page_request: PageRequest) -> Page:
+        """Get one page of books (keyset pagination on ID)"""
+        # Fetch one extra row to know if another page exists
+        books = self._fetch_after(self._filter(criteria), page_request.cursor, page_request.limit + 1)
+        
+        if len(books) > page_request.limit:
+            books = books[:page_request.limit]
+            return Page(items=tuple(books), next_cursor=books[-1].id)
+        return Page(items=tuple(books))
+    
+    def iterate(self, criteria: SearchCriteria, chunk_size: int = 500) -> Iterator[Book]:
+        """
+        Iterate over books in keyset chunks
+        
+        Only one chunk is held at a time and entities are not registered in the
+        identity map, so memory stays constant whatever the catalog size.
+        """
+        queryset = self._filter(criteria)
+        cursor = None
+        while True:
+            books = self._fetch_after(queryset, cursor, chunk_size)
+            yield from books
+            if len(books) < chunk_size:
+                return
+            cursor = books[-1].id
     
+    @repository_write()
     def save(self, book: Book) -> Book:
         """Save or update book"""
         if book.id:
@@ -83,17 +179,26 @@ class DjangoBookRepository(IBookRepository):
             model = self._to_model(book)
         
         model.save()
-        return self._to_entity(model)
+        saved = self._to_entity(model)
+        self.identity_map.add('book', saved.id, saved)
+        book_changed.send(sender=self.__class__, book=saved)
+        return saved
     
+    @repository_write()
     def delete(self, book_id: int) -> bool:
         """Delete book by ID"""
         try:
             model = BookModel.objects.get(id=book_id)
+            # Cart items of the book are deleted with it (CASCADE)
+            cart_ids = set(CartItemModel.objects.filter(book_id=book_id).values_list('cart_id', flat=True))
             model.delete()
+            self.identity_map.discard('book', book_id)
+            book_deleted.send(sender=self.__class__, book_id=book_id, cart_ids=cart_ids)
             return True
         except BookModel.DoesNotExist:
             return False
     
+    @repository_write()
     def update_stock(self, book_id: int, quantity_change: int) -> bool:
         """Update book stock"""
         try:
@@ -102,6 +207,8 @@ class DjangoBookRepository(IBookRepository):
             if model.stock < 0:
                 return False
             model.save()
+            self.identity_map.discard('book', book_id)
+            book_changed.send(sender=self.__class__, book_id=book_id)
             return True
         except BookModel.DoesNotExist:
             return False
@@ -4,9 +4,12 @@ Infrastructure layer - implements repository interface using Django ORM
 """
 from typing import Optional
 from decimal import Decimal
+from django.db import connection, transaction
 from domain.entities import Cart, CartItem
 from interfaces.repositories import ICartRepository
 from infrastructure.models import CartModel, CartItemModel, BookModel
+from infrastructure.identity_map import IdentityMap, MISSING
+from infrastructure.read_models.events import cart_changed, repository_write
 
 
 class DjangoCartRepository(ICartRepository):
@@ -14,11 +17,31 @@ class DjangoCartRepository(ICartRepository):
     Django ORM implementation of Cart repository
     """
     
+    def __init__(self, identity_map: Optional[IdentityMap] = None, book_repository=None):
+        self.identity_map = identity_map or IdentityMap()
+        # Books prefetched with the cart items are shared through the book repository
+        self.book_repository = book_repository
+    
+    def _register(self, cart: Cart) -> Cart:
+        """Register cart in the identity map under both lookup keys"""
+        self.identity_map.add('cart', cart.id, cart)
+        self.identity_map.add('cart_by_customer', cart.customer_id, cart)
+        return cart
+    
+    def _forget(self, cart_id: int):
+        """Drop a cart from the identity map after a write that bypasses the entity"""
+        cart = self.identity_map.get('cart', cart_id)
+        if cart is not MISSING and cart is not None:
+            self.identity_map.discard('cart_by_customer', cart.customer_id)
+        self.identity_map.discard('cart', cart_id)
+    
     def _cart_item_to_entity(self, model: CartItemModel) -> CartItem:
         """Convert Django cart item model to domain entity"""
+        if self.book_repository is not None:
+            self.book_repository.from_model(model.book)
         return CartItem(
             id=model.id,
-            book_id=model.book.id,
+            book_id=model.book_id,
             book_title=model.book.title,
             quantity=model.quantity,
             price=Decimal(str(model.price))
@@ -33,82 +56,102 @@ class DjangoCartRepository(ICartRepository):
         
         return Cart(
             id=model.id,
-            customer_id=model.customer.id,
+            customer_id=model.customer_id,
             items=items,
             created_at=model.created_at
         )
     
     def get_by_customer_id(self, customer_id: int) -> Optional[Cart]:
         """Get cart by customer ID"""
+        cart = self.identity_map.get('cart_by_customer', customer_id)
+        if cart is not MISSING:
+            return cart
+        
         try:
             model = CartModel.objects.prefetch_related('items__book').get(
-                customer__id=customer_id
+                customer_id=customer_id
             )
-            return self._to_entity(model)
+            return self._register(self._to_entity(model))
         except CartModel.DoesNotExist:
+            self.identity_map.add('cart_by_customer', customer_id, None)
             return None
     
     def get_by_id(self, cart_id: int) -> Optional[Cart]:
         """Get cart by ID"""
+        cart = self.identity_map.get('cart', cart_id)
+        if cart is not MISSING:
+            return cart
+        
         try:
             model = CartModel.objects.prefetch_related('items__book').get(id=cart_id)
-            return self._to_entity(model)
+            return self._register(self._to_entity(model))
         except CartModel.DoesNotExist:
+            self.identity_map.add('cart', cart_id, None)
             return None
     
+    @transaction.atomic
+    @repository_write()
     def save(self, cart: Cart) -> Cart:
-        """Save or update cart"""
-        from infrastructure.models import CustomerModel
+        """
+        Save or update cart
         
-        if cart.id:
-            # Update existing cart
-            try:
-                cart_model = CartModel.objects.get(id=cart.id)
-            except CartModel.DoesNotExist:
-                # Create new if doesn't exist
-                customer = CustomerModel.objects.get(id=cart.customer_id)
-                cart_model = CartModel.objects.create(customer=customer)
-        else:
-            # Create new cart
-            customer = CustomerModel.objects.get(id=cart.customer_id)
-            cart_model = CartModel.objects.create(customer=customer)
+        Only the changes tracked by the entity are flushed, in this order:
+        removed items with a single DELETE ... IN, changed items with one
+        bulk_update, new items with one bulk_create. The same entity is
+        returned, without a reload.
+        """
+        if cart.id is None:
+            cart_model = CartModel.objects.create(customer_id=cart.customer_id)
+            cart.id = cart_model.id
+            cart.created_at = cart_model.created_at
         
-        # Sync cart items
-        # Get existing items
-        existing_items = {item.book.id: item for item in cart_model.items.all()}
+        # Deletes first: a book removed and added again in the same unit of work
+        # must free its (cart, book) row before the new item is inserted
+        removed_items = cart.get_removed_items()
+        if removed_items:
+            CartItemModel.objects.filter(id__in=[item.id for item in removed_items]).delete()
         
-        # Update or create items
-        for item in cart.items:
-            if item.book_id in existing_items:
-                # Update existing item
-                item_model = existing_items[item.book_id]
-                item_model.quantity = item.quantity
-                item_model.price = item.price
-                item_model.save()
-                del existing_items[item.book_id]
-            else:
-                # Create new item
-                book = BookModel.objects.get(id=item.book_id)
-                CartItemModel.objects.create(
-                    cart=cart_model,
-                    book=book,
+        changed_items = cart.get_changed_items()
+        if changed_items:
+            CartItemModel.objects.bulk_update([
+                CartItemModel(id=item.id, quantity=item.quantity, price=item.price)
+                for item in changed_items
+            ], ['quantity', 'price'])
+        
+        new_items = cart.get_new_items()
+        if new_items:
+            item_models = CartItemModel.objects.bulk_create([
+                CartItemModel(
+                    cart_id=cart.id,
+                    book_id=item.book_id,
                     quantity=item.quantity,
                     price=item.price
                 )
+                for item in new_items
+            ])
+            if connection.features.can_return_rows_from_bulk_insert:
+                for item, item_model in zip(new_items, item_models):
+                    item.id = item_model.id
+            else:
+                # MySQL does not return primary keys from bulk inserts
+                ids = dict(CartItemModel.objects.filter(
+                    cart_id=cart.id,
+                    book_id__in=[item.book_id for item in new_items]
+                ).values_list('book_id', 'id'))
+                for item in new_items:
+                    item.id = ids[item.book_id]
         
-        # Delete items not in cart anymore
-        for book_id, item_model in existing_items.items():
-            item_model.delete()
-        
-        # Reload and return
-        cart_model.refresh_from_db()
-        return self._to_entity(cart_model)
+        cart.mark_clean()
+        cart_changed.send(sender=self.__class__, cart=cart)
+        return self._register(cart)
     
+    @repository_write()
     def save_item(self, cart_id: int, item: CartItem) -> CartItem:
         """Save or update cart item"""
         cart_model = CartModel.objects.get(id=cart_id)
         book = BookModel.objects.get(id=item.book_id)
         
+        self._forget(cart_id)
         item_model, created = CartItemModel.objects.update_or_create(
             cart=cart_model,
             book=book,
@@ -117,23 +160,30 @@ class DjangoCartRepository(ICartRepository):
                 'price': item.price
             }
         )
+        cart_changed.send(sender=self.__class__, cart_id=cart_id)
         
         return self._cart_item_to_entity(item_model)
     
+    @repository_write()
     def delete_item(self, cart_id: int, book_id: int) -> bool:
         """Delete cart item"""
         try:
-            item = CartItemModel.objects.get(cart__id=cart_id, book__id=book_id)
+            item = CartItemModel.objects.get(cart_id=cart_id, book_id=book_id)
             item.delete()
+            self._forget(cart_id)
+            cart_changed.send(sender=self.__class__, cart_id=cart_id)
             return True
         except CartItemModel.DoesNotExist:
             return False
     
+    @repository_write()
     def clear(self, cart_id: int) -> bool:
         """Clear all items from cart"""
         try:
             cart = CartModel.objects.get(id=cart_id)
             cart.items.all().delete()
+            self._forget(cart_id)
+            cart_changed.send(sender=self.__class__, cart_id=cart_id)
             return True
         except CartModel.DoesNotExist:
             return False
@@ -6,6 +6,7 @@ from typing import Optional
 from domain.entities import Customer
 from interfaces.repositories import ICustomerRepository
 from infrastructure.models import CustomerModel
+from infrastructure.identity_map import IdentityMap, MISSING
 
 
 class DjangoCustomerRepository(ICustomerRepository):
@@ -13,11 +14,27 @@ class DjangoCustomerRepository(ICustomerRepository):
     Django ORM implementation of Customer repository
     """
     
+    def __init__(self, identity_map: Optional[IdentityMap] = None):
+        self.identity_map = identity_map or IdentityMap()
+    
+    def _register(self, customer: Customer) -> Customer:
+        """Register customer in the identity map under both lookup keys"""
+        self.identity_map.add('customer', customer.id, customer)
+        self.identity_map.add('customer_by_user', customer.user_id, customer)
+        return customer
+    
+    def from_model(self, model: CustomerModel) -> Customer:
+        """Convert model to entity, reusing the instance already loaded in this request"""
+        customer = self.identity_map.get('customer', model.id)
+        if customer is MISSING or customer is None:
+            customer = self._register(self._to_entity(model))
+        return customer
+    
     def _to_entity(self, model: CustomerModel) -> Customer:
         """Convert Django model to domain entity"""
         return Customer(
             id=model.id,
-            user_id=model.user.id,
+            user_id=model.user_id,
             fullname=model.fullname,
             address=model.address,
             phone=model.phone,
@@ -41,18 +58,28 @@ class DjangoCustomerRepository(ICustomerRepository):
     
     def get_by_id(self, customer_id: int) -> Optional[Customer]:
         """Get customer by ID"""
+        customer = self.identity_map.get('customer', customer_id)
+        if customer is not MISSING:
+            return customer
+        
         try:
             model = CustomerModel.objects.get(id=customer_id)
-            return self._to_entity(model)
+            return self._register(self._to_entity(model))
         except CustomerModel.DoesNotExist:
+            self.identity_map.add('customer', customer_id, None)
             return None
     
     def get_by_user_id(self, user_id: int) -> Optional[Customer]:
         """Get customer by user ID"""
+        customer = self.identity_map.get('customer_by_user', user_id)
+        if customer is not MISSING:
+            return customer
+        
         try:
-            model = CustomerModel.objects.get(user__id=user_id)
-            return self._to_entity(model)
+            model = CustomerModel.objects.get(user_id=user_id)
+            return self._register(self._to_entity(model))
         except CustomerModel.DoesNotExist:
+            self.identity_map.add('customer_by_user', user_id, None)
             return None
     
     def save(self, customer: Customer) -> Customer:
@@ -69,13 +96,15 @@ class DjangoCustomerRepository(ICustomerRepository):
             model = self._to_model(customer)
         
         model.save()
-        return self._to_entity(model)
+        return self._register(self._to_entity(model))
     
     def delete(self, customer_id: int) -> bool:
         """Delete customer by ID"""
         try:
             model = CustomerModel.objects.get(id=customer_id)
             model.delete()
+            self.identity_map.discard('customer', customer_id)
+            self.identity_map.discard('customer_by_user', model.user_id)
             return True
         except CustomerModel.DoesNotExist:
             return False
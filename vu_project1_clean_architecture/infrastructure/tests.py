@@ -0,0 +1,93 @@
+"""
+Identity map tests
+Repeated repository loads inside one request scope hit the database once
+"""
+from django.contrib.auth.models import User
+from django.test import RequestFactory, TestCase
+from framework.dependencies import get_container
+from framework.middleware import IdentityMapMiddleware
+from infrastructure.identity_map import IdentityMap
+from infrastructure.models import BookModel, CartItemModel, CartModel, CustomerModel
+from infrastructure.repositories import (
+    DjangoBookRepository,
+    DjangoCartRepository,
+    DjangoCustomerRepository,
+)
+
+
+class IdentityMapQueryTests(TestCase):
+    """Query counts of repository loads with and without a request scope"""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username='reader', password='secret')
+        cls.customer = CustomerModel.objects.create(user=user, fullname='Reader', address='Hanoi', phone='0900000000')
+        cls.book = BookModel.objects.create(title='Dune', author='Frank Herbert', stock=3, slug='dune')
+        cls.other_book = BookModel.objects.create(title='Emma', author='Jane Austen', stock=0, slug='emma')
+        cart = CartModel.objects.create(customer=cls.customer)
+        CartItemModel.objects.create(cart=cart, book=cls.book, quantity=1, price='10.00')
+
+    def setUp(self):
+        self.identity_map = IdentityMap()
+        self.books = DjangoBookRepository(self.identity_map)
+        self.customers = DjangoCustomerRepository(self.identity_map)
+        self.carts = DjangoCartRepository(self.identity_map, self.books)
+
+    def test_book_loaded_once_per_scope(self):
+        with self.identity_map.scope():
+            with self.assertNumQueries(1):
+                first = self.books.get_by_id(self.book.id)
+                second = self.books.get_by_id(self.book.id)
+        self.assertIs(first, second)
+
+    def test_missing_book_is_remembered(self):
+        with self.identity_map.scope():
+            with self.assertNumQueries(1):
+                self.assertIsNone(self.books.get_by_id(0))
+                self.assertIsNone(self.books.get_by_id(0))
+
+    def test_get_by_ids_queries_only_books_not_loaded(self):
+        with self.identity_map.scope():
+            self.books.get_by_id(self.book.id)
+            with self.assertNumQueries(1):
+                books = self.books.get_by_ids([self.book.id, self.other_book.id])
+            with self.assertNumQueries(0):
+                self.assertIs(self.books.get_by_id(self.other_book.id), books[self.other_book.id])
+
+    def test_customer_lookups_share_one_load(self):
+        with self.identity_map.scope():
+            with self.assertNumQueries(1):
+                by_user = self.customers.get_by_user_id(self.customer.user_id)
+                by_id = self.customers.get_by_id(self.customer.id)
+        self.assertIs(by_user, by_id)
+
+    def test_cart_load_registers_its_books(self):
+        with self.identity_map.scope():
+            # Cart, its items and their books (prefetch)
+            with self.assertNumQueries(3):
+                cart = self.carts.get_by_customer_id(self.customer.id)
+            with self.assertNumQueries(0):
+                self.assertIs(self.carts.get_by_id(cart.id), cart)
+                self.assertEqual(self.books.get_by_id(self.book.id).title, 'Dune')
+
+    def test_every_load_queries_without_scope(self):
+        with self.assertNumQueries(2):
+            first = self.books.get_by_id(self.book.id)
+            second = self.books.get_by_id(self.book.id)
+        self.assertIsNot(first, second)
+
+    def test_middleware_opens_a_fresh_scope_per_request(self):
+        book_repository = get_container().book_repository
+
+        def view(request):
+            book_repository.get_by_id(self.book.id)
+            book_repository.get_by_id(self.book.id)
+            return None
+
+        middleware = IdentityMapMiddleware(view)
+        request = RequestFactory().get('/')
+        with self.assertNumQueries(1):
+            middleware(request)
+        # Nothing is kept between requests
+        with self.assertNumQueries(1):
+            middleware(request)
@@ -0,0 +1,11 @@
+"""
+Query Interfaces
+Define contracts for the read side
+"""
+from .catalog_queries import ICatalogQueries
+from .cart_queries import ICartQueries
+
+__all__ = [
+    'ICatalogQueries',
+    'ICartQueries',
+]
@@ -0,0 +1,22 @@
+"""
+Cart Query Interface
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ICartQueries(ABC):
+    """Interface for cart read queries"""
+    
+    @abstractmethod
+    def get_cart_view(self, user_id: int) -> Optional[dict]:
+        """
+        Get the cart of a user as a ready-to-serialize dict
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Cart row or None if the user has no projected cart
+        """
+        pass
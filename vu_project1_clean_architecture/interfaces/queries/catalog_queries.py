@@ -0,0 +1,88 @@
+"""
+Catalog Query Interface
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+from domain.value_objects import Page, PageRequest, SearchCriteria
+
+
+class ICatalogQueries(ABC):
+    """Interface for catalog read queries (rows are ready-to-serialize dicts)"""
+    
+    @abstractmethod
+    def get_book(self, book_id: int) -> Optional[dict]:
+        """
+        Get book row by ID
+        
+        Args:
+            book_id: Book ID
+            
+        Returns:
+            Book row or None if not found
+        """
+        pass
+    
+    @abstractmethod
+    def get_book_version(self, book_id: int) -> Optional[datetime]:
+        """
+        Get the version of a book row without reading the row
+        
+        Args:
+            book_id: Book ID
+            
+        Returns:
+            Last update time or None if not found
+        """
+        pass
+    
+    @abstractmethod
+    def get_catalog_version(self) -> Tuple[Optional[datetime], int]:
+        """
+        Get the version of the whole catalog
+        
+        Returns:
+            (last update time or None, number of books) - the count changes on deletes
+        """
+        pass
+    
+    @abstractmethod
+    def get_book_by_slug(self, slug: str) -> Optional[dict]:
+        """
+        Get book row by slug
+        
+        Args:
+            slug: Book slug
+            
+        Returns:
+            Book row or None if not found
+        """
+        pass
+    
+    @abstractmethod
+    def get_page(self, criteria: SearchCriteria, page_request: PageRequest) -> Page:
+        """
+        Get one page of book rows matching criteria, ordered by ID
+        
+        Args:
+            criteria: Search criteria
+            page_request: Cursor and page size
+            
+        Returns:
+            Page of book rows with the cursor of the next page
+        """
+        pass
+    
+    @abstractmethod
+    def iterate(self, criteria: SearchCriteria, chunk_size: int = 500) -> Iterator[dict]:
+        """
+        Iterate over all book rows matching criteria with bounded memory
+        
+        Args:
+            criteria: Search criteria
+            chunk_size: Number of rows fetched per query
+            
+        Returns:
+            Iterator of book rows, ordered by ID
+        """
+        pass
@@ -19,6 +19,9 @@ class IAuthRepository(ABC):
             
         Returns:
             User ID if authentication successful, None otherwise
+            
+        Raises:
+            LoginUnavailableException: If credentials cannot be checked right now
         """
         pass
     
@@ -3,9 +3,9 @@ Repository Interfaces
 Define contracts for data access
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 from domain.entities import Book
-from domain.value_objects import SearchCriteria
+from domain.value_objects import Page, PageRequest, SearchCriteria
 
 
 class IBookRepository(ABC):
@@ -29,6 +29,19 @@ class IBookRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_by_ids(self, book_ids: Iterable[int]) -> Dict[int, Book]:
+        """
+        Get several books with a single lookup
+        
+        Args:
+            book_ids: Book IDs
+            
+        Returns:
+            Mapping of book ID to book (missing IDs are absent)
+        """
+        pass
+    
     @abstractmethod
     def search(self, criteria: SearchCriteria) -> List[Book]:
         """
@@ -42,6 +55,34 @@ class IBookRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_page(self, criteria: SearchCriteria, page_request: PageRequest) -> Page:
+        """
+        Get one page of books matching criteria, ordered by ID
+        
+        Args:
+            criteria: Search criteria
+            page_request: Cursor and page size
+            
+        Returns:
+            Page of books with the cursor of the next page
+        """
+        pass
+    
+    @abstractmethod
+    def iterate(self, criteria: SearchCriteria, chunk_size: int = 500) -> Iterator[Book]:
+        """
+        Iterate over all books matching criteria with bounded memory
+        
+        Args:
+            criteria: Search criteria
+            chunk_size: Number of rows fetched per query
+            
+        Returns:
+            Iterator of books, ordered by ID
+        """
+        pass
+    
     @abstractmethod
     def save(self, book: Book) -> Book:
         """
@@ -29,6 +29,7 @@ class LoginUserUseCase:
             
         Raises:
             InvalidCredentialsException: If credentials are invalid
+            LoginUnavailableException: If the login service is overloaded
         """
         # Authenticate user
         user_id = self.auth_repository.authenticate(credentials)
@@ -2,9 +2,9 @@
 List Books Use Case
 Business action: Get all books from catalog
 """
-from typing import List
+from typing import Iterator, List, Optional
 from domain.entities import Book
-from domain.value_objects import SearchCriteria
+from domain.value_objects import Page, PageRequest, SearchCriteria
 from domain.exceptions import BookNotFoundException
 from interfaces.repositories import IBookRepository
 
@@ -35,3 +35,39 @@ class ListBooksUseCase:
             return self.book_repository.search(criteria)
         
         return self.book_repository.get_all()
+    
+    def execute_page(
+        self,
+        search_query: str = None,
+        in_stock_only: bool = False,
+        cursor: Optional[int] = None,
+        limit: int = 50
+    ) -> Page:
+        """
+        Execute use case for one page of books
+        
+        Args:
+            search_query: Optional search term
+            in_stock_only: Filter only in-stock books
+            cursor: ID of the last book of the previous page
+            limit: Page size
+            
+        Returns:
+            Page of books with the next cursor
+        """
+        criteria = SearchCriteria(query=search_query, in_stock_only=in_stock_only)
+        return self.book_repository.get_page(criteria, PageRequest(cursor=cursor, limit=limit))
+    
+    def iterate(self, search_query: str = None, in_stock_only: bool = False) -> Iterator[Book]:
+        """
+        Execute use case lazily - books are produced chunk by chunk
+        
+        Args:
+            search_query: Optional search term
+            in_stock_only: Filter only in-stock books
+            
+        Returns:
+            Iterator of books
+        """
+        criteria = SearchCriteria(query=search_query, in_stock_only=in_stock_only)
+        return self.book_repository.iterate(criteria)
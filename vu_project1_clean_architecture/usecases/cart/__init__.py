@@ -5,10 +5,12 @@ from .add_item_to_cart import AddItemToCartUseCase
 from .view_cart import ViewCartUseCase
 from .update_cart_item import UpdateCartItemUseCase
 from .remove_item_from_cart import RemoveItemFromCartUseCase
+from .apply_cart_operations import ApplyCartOperationsUseCase
 
 __all__ = [
     'AddItemToCartUseCase',
     'ViewCartUseCase',
     'UpdateCartItemUseCase',
     'RemoveItemFromCartUseCase',
+    'ApplyCartOperationsUseCase',
 ]
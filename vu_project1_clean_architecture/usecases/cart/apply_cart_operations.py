@@ -0,0 +1,103 @@
+"""
+Apply Cart Operations Use Case
+Business action: Apply a batch of add/set/remove changes to the shopping cart
+"""
+from decimal import Decimal
+from typing import List
+from domain.entities import Cart
+from domain.exceptions import BookNotFoundException, CustomerNotFoundException, InsufficientStockException
+from domain.value_objects import CartOperation
+from interfaces.repositories import IBookRepository, ICustomerRepository, ICartRepository
+
+
+class ApplyCartOperationsUseCase:
+    """
+    Use case for bulk cart updates
+    Pure business logic
+    """
+    
+    def __init__(
+        self,
+        book_repository: IBookRepository,
+        customer_repository: ICustomerRepository,
+        cart_repository: ICartRepository
+    ):
+        self.book_repository = book_repository
+        self.customer_repository = customer_repository
+        self.cart_repository = cart_repository
+    
+    def execute(self, user_id: int, operations: List[CartOperation]) -> Cart:
+        """
+        Execute use case to apply operations in order
+        
+        Operations are folded into one final quantity per book, stock is checked
+        with a single book lookup, and the cart is saved once. Any failure leaves
+        the cart untouched.
+        
+        Args:
+            user_id: User ID
+            operations: Operations to apply, in order
+            
+        Returns:
+            Updated cart
+            
+        Raises:
+            CustomerNotFoundException: If customer not found
+            BookNotFoundException: If a book to add or set does not exist
+            InsufficientStockException: If not enough stock for a final quantity
+        """
+        # Get customer
+        customer = self.customer_repository.get_by_user_id(user_id)
+        if customer is None:
+            raise CustomerNotFoundException(user_id)
+        
+        # Get or create cart
+        cart = self.cart_repository.get_by_customer_id(customer.id)
+        if cart is None:
+            cart = Cart(id=None, customer_id=customer.id, items=[])
+        
+        # Fold operations into the final quantity of each book
+        current = {item.book_id: item.quantity for item in cart.items}
+        quantities = dict(current)
+        for operation in operations:
+            if operation.op == 'add':
+                quantities[operation.book_id] = quantities.get(operation.book_id, 0) + operation.quantity
+            elif operation.op == 'set':
+                quantities[operation.book_id] = operation.quantity
+            else:
+                quantities[operation.book_id] = 0
+        
+        changed = {
+            book_id: quantity for book_id, quantity in quantities.items()
+            if quantity != current.get(book_id, 0)
+        }
+        if not changed:
+            return cart
+        
+        # Business rule: every final quantity must be in stock (one lookup for all books)
+        books = self.book_repository.get_by_ids(
+            book_id for book_id, quantity in changed.items() if quantity > 0
+        )
+        
+        for book_id, quantity in changed.items():
+            if quantity == 0:
+                continue
+            book = books.get(book_id)
+            if book is None:
+                raise BookNotFoundException(book_id)
+            if not book.has_sufficient_stock(quantity):
+                raise InsufficientStockException(book.title, book.stock, quantity)
+        
+        # Apply to the entity only once every operation is valid
+        for book_id, quantity in changed.items():
+            if quantity == 0:
+                cart.remove_item(book_id)
+            elif cart.get_item(book_id):
+                cart.update_item_quantity(book_id, quantity)
+            else:
+                book = books[book_id]
+                # Using stock value as price for simplicity (as per original code)
+                cart.add_item(book_id, book.title, quantity, Decimal(str(book.stock)))
+        
+        # Save cart
+        return self.cart_repository.save(cart)
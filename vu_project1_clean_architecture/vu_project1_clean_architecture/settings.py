@@ -40,6 +40,7 @@ INSTALLED_APPS = [
     "rest_framework",
     "rest_framework.authtoken",
     "infrastructure",
+    "framework",
 ]
 
 # Add project root to Python path for imports
@@ -52,10 +53,28 @@ APPEND_SLASH = False
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'framework.authentication.CachedTokenAuthentication',
     ],
 }
 
+# Password hashing: scrypt (memory-hard) for new hashes, older hashes are upgraded on login
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
+
+# Login password checks run in a process pool (infrastructure.password_pool)
+LOGIN_HASH_WORKERS = 2
+LOGIN_HASH_MAX_PENDING = 32
+LOGIN_HASH_TIMEOUT = 5
+
+# Token authentication cache (per worker process)
+TOKEN_AUTH_CACHE_TTL = 60
+TOKEN_AUTH_CACHE_MAX_SIZE = 10000
+
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -64,6 +83,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "framework.middleware.IdentityMapMiddleware",
 ]
 
 ROOT_URLCONF = "vu_project1_clean_architecture.urls"
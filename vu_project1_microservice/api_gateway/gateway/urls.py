@@ -17,11 +17,13 @@ urlpatterns = [
     # Book Service routes
     path('books/', BookServiceProxy.as_view(), name='book-list'),
     path('books/<int:book_id>/', BookServiceProxy.as_view(), name='book-detail'),
+    path('books/by-slug/<slug:slug>/', BookServiceProxy.as_view(), name='book-by-slug'),
     
     # Cart Service routes
     path('cart/', CartServiceProxy.as_view(), name='cart-view'),
     path('cart/add/', CartServiceProxy.as_view(), name='cart-add'),
     path('cart/update/', CartServiceProxy.as_view(), name='cart-update'),
     path('cart/remove/<int:book_id>/', CartServiceProxy.as_view(), name='cart-remove'),
+    path('cart/items/', CartServiceProxy.as_view(), name='cart-items-bulk'),
     path('cart/checkout/', CartServiceProxy.as_view(), name='cart-checkout'),
 ]
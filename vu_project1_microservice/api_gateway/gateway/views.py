@@ -5,11 +5,16 @@ import requests
 import jwt
 from datetime import datetime
 from django.conf import settings
+from django.http import HttpResponseNotModified
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from rest_framework import status
 
+# Conditional GET headers relayed in both directions (ETag / 304 support of the services)
+CONDITIONAL_REQUEST_HEADERS = ('If-None-Match', 'If-Modified-Since')
+VERSION_RESPONSE_HEADERS = ('ETag', 'Last-Modified')
+
 
 @api_view(['GET'])
 def health_check(request):
@@ -65,6 +70,9 @@ class ServiceProxy(APIView):
             return Response(auth_payload, status=status.HTTP_401_UNAUTHORIZED)
         
         headers.update(auth_header)
+        for name in CONDITIONAL_REQUEST_HEADERS:
+            if name in request.headers:
+                headers[name] = request.headers[name]
         
         # Add user_id to params if authenticated
         params = kwargs.get('params', {})
@@ -94,6 +102,14 @@ class ServiceProxy(APIView):
                     json=kwargs.get('data'),
                     timeout=settings.SERVICE_REQUEST_TIMEOUT
                 )
+            elif method == 'PATCH':
+                response = requests.patch(
+                    url,
+                    headers=headers,
+                    params=kwargs.get('params'),
+                    json=kwargs.get('data'),
+                    timeout=settings.SERVICE_REQUEST_TIMEOUT
+                )
             elif method == 'DELETE':
                 response = requests.delete(
                     url,
@@ -107,10 +123,17 @@ class ServiceProxy(APIView):
                 )
             
             # Return response from microservice
-            return Response(
-                response.json() if response.content else {},
-                status=response.status_code
-            )
+            if response.status_code == status.HTTP_304_NOT_MODIFIED:
+                proxied = HttpResponseNotModified()
+            else:
+                proxied = Response(
+                    response.json() if response.content else {},
+                    status=response.status_code
+                )
+            for name in VERSION_RESPONSE_HEADERS:
+                if name in response.headers:
+                    proxied[name] = response.headers[name]
+            return proxied
             
         except requests.Timeout:
             return Response(
@@ -179,9 +202,15 @@ class BookServiceProxy(ServiceProxy):
     """Proxy for Book Service"""
     service_url = settings.BOOK_SERVICE_URL
     
-    def get(self, request, book_id=None):
-        """Handle GET requests (list books, get book detail)"""
-        if book_id:
+    def get(self, request, book_id=None, slug=None):
+        """Handle GET requests (list books, get book detail by ID or slug)"""
+        if slug:
+            return self.forward_request(
+                request,
+                f'/api/books/by-slug/{slug}/',
+                method='GET'
+            )
+        elif book_id:
             return self.forward_request(
                 request,
                 f'/api/books/{book_id}/',
@@ -267,6 +296,15 @@ class CartServiceProxy(ServiceProxy):
             data=request.data
         )
     
+    def patch(self, request):
+        """Handle PATCH requests (bulk cart update)"""
+        return self.forward_request(
+            request,
+            '/api/cart/items/',
+            method='PATCH',
+            data=request.data
+        )
+    
     def delete(self, request, book_id):
         """Handle DELETE requests (remove from cart)"""
         return self.forward_request(
@@ -0,0 +1,164 @@
+"""
+Catalog import / export
+Streams CSV or JSON Lines book feeds in chunks with bulk writes
+"""
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .feeds import FEED_FORMATS, add_error, chunked, format_rows
+from .models import Book
+from .serializers import BookImportSerializer
+from .slugs import assign_slugs
+
+CATALOG_FORMATS = FEED_FORMATS
+CATALOG_CHUNK_SIZE = 500
+# Columns of a catalog file, shared by import and export
+CATALOG_COLUMNS = ('id', 'title', 'author', 'stock', 'price', 'note', 'slug')
+UPDATE_FIELDS = ['title', 'author', 'stock', 'price', 'note', 'slug', 'updated_at']
+# Same message as POST /api/books/ for a taken slug
+SLUG_TAKEN = f"slug: {Book._meta.get_field('slug').error_messages['unique']}"
+
+
+def _validate(record):
+    """
+    Validate a row with the BookSerializer rules (no database access)
+
+    Returns:
+        tuple (book_id or None, validated fields), or an error message
+    """
+    if record is None:
+        return 'Invalid JSON object'
+
+    data = {
+        column: record[column]
+        for column in CATALOG_COLUMNS[1:]
+        if record.get(column) not in (None, '')
+    }
+    try:
+        book_id = int(record['id']) if record.get('id') not in (None, '') else None
+    except (TypeError, ValueError):
+        return 'id must be an integer'
+
+    serializer = BookImportSerializer(data=data, partial=book_id is not None)
+    if not serializer.is_valid():
+        return '; '.join(
+            f'{field}: {" ".join(str(message) for message in messages)}'
+            for field, messages in serializer.errors.items()
+        )
+    return book_id, serializer.validated_data
+
+
+def _check_slugs(rows, summary):
+    """
+    Reject rows asking for a slug that is taken, as POST /api/books/ does (one query per chunk)
+
+    A slug is taken when another book has it, or an earlier row of the chunk claimed it.
+
+    Args:
+        rows: (line number, book id or None, validated fields), in file order
+
+    Returns:
+        tuple: (rows that passed, set of slugs they claim)
+    """
+    requested = {fields['slug'] for _, _, fields in rows if fields.get('slug')}
+    owners = dict(Book.objects.filter(slug__in=requested).values_list('slug', 'id')) if requested else {}
+
+    accepted = []
+    claimed = set()
+    for line_number, book_id, fields in rows:
+        slug = fields.get('slug')
+        if slug:
+            owner = owners.get(slug)
+            if slug in claimed or (owner is not None and owner != book_id):
+                add_error(summary, line_number, SLUG_TAKEN)
+                continue
+            claimed.add(slug)
+        accepted.append((line_number, book_id, fields))
+    return accepted, claimed
+
+
+def _import_chunk(chunk, summary, dry_run):
+    """Validate a chunk, read the books and slugs it touches in one query each, then bulk write"""
+    rows = []
+    updates = {}
+    for line_number, record in chunk:
+        result = _validate(record)
+        if isinstance(result, str):
+            add_error(summary, line_number, result)
+        elif result[0] is None:
+            rows.append((line_number, None, result[1]))
+        else:
+            # Same id twice in a chunk: the later line wins
+            updates[result[0]] = (line_number, result[1])
+
+    books = Book.objects.in_bulk(list(updates))
+    for book_id, (line_number, fields) in updates.items():
+        if book_id not in books:
+            add_error(summary, line_number, f'Book {book_id} not found')
+        else:
+            rows.append((line_number, book_id, fields))
+    rows.sort(key=lambda row: row[0])
+    rows, claimed = _check_slugs(rows, summary)
+
+    now = timezone.now()
+    to_create = []
+    to_update = []
+    for line_number, book_id, fields in rows:
+        if book_id is None:
+            to_create.append(Book(**fields))
+            continue
+        book = books[book_id]
+        for field, value in fields.items():
+            setattr(book, field, value)
+        book.updated_at = now
+        to_update.append(book)
+
+    summary['chunks'] += 1
+    if not dry_run:
+        # Books without a requested slug get a free one from one prefix query, not insert-and-retry
+        assign_slugs(to_create, reserved=claimed)
+        try:
+            with transaction.atomic():
+                Book.objects.bulk_create(to_create)
+                Book.objects.bulk_update(to_update, UPDATE_FIELDS)
+        except IntegrityError:
+            # A concurrent import or POST took one of the slugs after the check
+            for line_number, _, _ in rows:
+                add_error(summary, line_number, 'Not saved: a slug of this chunk was taken by a concurrent write')
+            return
+
+    summary['created'] += len(to_create)
+    summary['updated'] += len(to_update)
+
+
+def import_catalog(rows, chunk_size=CATALOG_CHUNK_SIZE, dry_run=False, progress=None):
+    """
+    Import books chunk by chunk: rows with an id update that book, rows without one create a book
+
+    Each chunk is committed on its own; invalid rows are skipped and reported.
+
+    Args:
+        rows: (line number, record) pairs from feeds.parse_lines
+        chunk_size: Rows per chunk
+        dry_run: Validate only, write nothing
+        progress: Optional callback progress(summary) after each chunk
+
+    Returns:
+        dict: processed, chunks, created, updated, error_count, errors, dry_run
+    """
+    summary = {
+        'processed': 0, 'chunks': 0, 'created': 0, 'updated': 0,
+        'error_count': 0, 'errors': [], 'dry_run': dry_run
+    }
+    for chunk in chunked(rows, chunk_size):
+        summary['processed'] += len(chunk)
+        _import_chunk(chunk, summary, dry_run)
+        if progress:
+            progress(summary)
+    return summary
+
+
+def export_catalog(fmt, chunk_size=CATALOG_CHUNK_SIZE):
+    """Yield the whole catalog as CSV (with header) or JSON Lines, reading the table in chunks"""
+    rows = Book.objects.order_by('id').values_list(*CATALOG_COLUMNS).iterator(chunk_size=chunk_size)
+    return format_rows(CATALOG_COLUMNS, rows, fmt)
@@ -0,0 +1,32 @@
+"""
+Export the whole catalog as CSV or JSON Lines
+"""
+import sys
+from django.core.management.base import BaseCommand
+
+from books import catalog, feeds
+
+
+class Command(BaseCommand):
+    help = 'Write every book to a CSV or JSON Lines file, one row at a time'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', help='Output file (default: stdout)')
+        parser.add_argument('--format', choices=catalog.CATALOG_FORMATS, help='Default: guessed from the file extension')
+        parser.add_argument('--chunk-size', type=int, default=catalog.CATALOG_CHUNK_SIZE, help='Rows per database fetch')
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or feeds.detect_format(options['path'] or '')
+        lines = catalog.export_catalog(fmt, chunk_size=max(options['chunk_size'], 1))
+
+        if not options['path']:
+            sys.stdout.writelines(lines)
+            return
+
+        count = 0
+        with open(options['path'], 'w', encoding='utf-8', newline='') as output:
+            for line in lines:
+                output.write(line)
+                count += 1
+        rows = count - 1 if fmt == 'csv' else count
+        self.stdout.write(self.style.SUCCESS(f'Exported {rows} books to {options["path"]}'))
@@ -0,0 +1,44 @@
+"""
+Import a catalog feed (CSV or JSON Lines) into the book table
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from books import catalog, feeds
+
+
+class Command(BaseCommand):
+    help = 'Create / update books from a CSV or JSON Lines file (id,title,author,stock,price,note,slug)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Feed file')
+        parser.add_argument('--format', choices=catalog.CATALOG_FORMATS, help='Default: guessed from the file extension')
+        parser.add_argument('--chunk-size', type=int, default=catalog.CATALOG_CHUNK_SIZE, help='Rows per bulk write')
+        parser.add_argument('--dry-run', action='store_true', help='Validate without writing')
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or feeds.detect_format(options['path'])
+
+        def progress(summary):
+            self.stdout.write(
+                f"{summary['processed']} rows: {summary['created']} created, "
+                f"{summary['updated']} updated, {summary['error_count']} errors"
+            )
+
+        try:
+            with open(options['path'], 'rb') as lines:
+                summary = catalog.import_catalog(
+                    feeds.parse_lines(lines, fmt),
+                    chunk_size=max(options['chunk_size'], 1),
+                    dry_run=options['dry_run'],
+                    progress=progress
+                )
+        except OSError as e:
+            raise CommandError(str(e))
+
+        for error in summary['errors']:
+            self.stderr.write(f"line {error['line']}: {error['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Validated' if options['dry_run'] else 'Imported'} {summary['processed']} rows in "
+            f"{summary['chunks']} chunks: {summary['created']} created, {summary['updated']} updated, "
+            f"{summary['error_count']} errors"
+        ))
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.7 on 2026-10-19 22:10
+
+from django.db import migrations, models
+from django.db.models import Count
+
+# Room kept at the end of a slug for a "-<n>" suffix (same as books.slugs)
+SUFFIX_RESERVE = 8
+
+
+def dedupe_slugs(apps, schema_editor):
+    """
+    Make slugs unique before the constraint is added
+
+    Empty slugs become NULL. For each duplicated slug the lowest id keeps it,
+    the other books get the first free -2, -3, ... suffix.
+    """
+    Book = apps.get_model("books", "Book")
+    Book.objects.filter(slug="").update(slug=None)
+
+    duplicated = list(
+        Book.objects.exclude(slug=None).values("slug")
+        .annotate(total=Count("id")).filter(total__gt=1)
+        .values_list("slug", flat=True)
+    )
+    if not duplicated:
+        return
+
+    taken = set(Book.objects.exclude(slug=None).values_list("slug", flat=True))
+    max_length = Book._meta.get_field("slug").max_length
+    renamed = []
+    previous = None
+    for book in Book.objects.filter(slug__in=duplicated).order_by("slug", "id"):
+        if book.slug != previous:
+            previous = book.slug
+            continue
+        base = book.slug[:max_length - SUFFIX_RESERVE].strip("-")
+        suffix = 2
+        while f"{base}-{suffix}" in taken:
+            suffix += 1
+        book.slug = f"{base}-{suffix}"
+        taken.add(book.slug)
+        renamed.append(book)
+    Book.objects.bulk_update(renamed, ["slug"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("books", "0002_book_updated_at_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="book",
+            name="slug",
+            field=models.SlugField(
+                blank=True,
+                error_messages={"unique": "A book with this slug already exists."},
+                max_length=255,
+                null=True,
+                unique=True,
+            ),
+        ),
+    ]
@@ -23,9 +23,15 @@ class Book(models.Model):
         validators=[MinValueValidator(Decimal('0.00'))]
     )
     note = models.TextField(blank=True, null=True)
-    slug = models.SlugField(max_length=255, blank=True, null=True)
+    slug = models.SlugField(
+        max_length=255,
+        unique=True,
+        blank=True,
+        null=True,
+        error_messages={'unique': 'A book with this slug already exists.'}
+    )
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     
     class Meta:
         db_table = 'books'
@@ -41,6 +41,18 @@ class BookSerializer(serializers.ModelSerializer):
         return value
 
 
+class BookImportSerializer(BookSerializer):
+    """
+    BookSerializer for catalog import rows
+
+    Drops the per-row slug uniqueness query; the import checks the slugs of
+    a whole chunk with one query instead (catalog._check_slugs).
+    """
+    
+    class Meta(BookSerializer.Meta):
+        extra_kwargs = {'slug': {'validators': []}}
+
+
 class BookListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for book list"""
     
@@ -0,0 +1,87 @@
+"""
+Slug allocation
+Computes unique slugs for a whole batch of books with one lookup query
+"""
+from functools import reduce
+from operator import or_
+from django.db.models import Q
+from django.utils.text import slugify
+
+from .models import Book
+
+SLUG_MAX_LENGTH = Book._meta.get_field('slug').max_length
+# Room kept at the end of a base slug for a "-<n>" suffix
+SUFFIX_RESERVE = 8
+# Distinct base slugs per prefix query (keeps the OR of LIKE clauses small)
+PREFIX_QUERY_BATCH = 300
+
+
+def base_slug(value):
+    """Slugify a title (or requested slug), leaving room for a suffix"""
+    base = slugify(value or '')[:SLUG_MAX_LENGTH - SUFFIX_RESERVE].strip('-')
+    return base or 'book'
+
+
+def assign_suffixes(bases, taken):
+    """
+    Turn base slugs into unique slugs, in memory
+
+    The first book of a base keeps it when it is free, the next ones get
+    -2, -3, ... skipping every slug already in taken.
+
+    Args:
+        bases: Base slugs, one per book (duplicates allowed)
+        taken: Set of slugs already in use (updated in place)
+
+    Returns:
+        list: Unique slugs in the order of bases
+    """
+    next_suffix = {}
+    slugs = []
+    for base in bases:
+        slug = base
+        if slug in taken:
+            suffix = next_suffix.get(base, 2)
+            while f'{base}-{suffix}' in taken:
+                suffix += 1
+            slug = f'{base}-{suffix}'
+            next_suffix[base] = suffix + 1
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def taken_slugs(bases):
+    """Slugs in the table that start with any of the bases (one query per PREFIX_QUERY_BATCH bases)"""
+    bases = sorted(set(bases))
+    taken = set()
+    for start in range(0, len(bases), PREFIX_QUERY_BATCH):
+        prefixes = reduce(or_, (Q(slug__startswith=base) for base in bases[start:start + PREFIX_QUERY_BATCH]))
+        taken.update(Book.objects.filter(prefixes).values_list('slug', flat=True))
+    return taken
+
+
+def allocate_slugs(values, reserved=()):
+    """
+    Unique slugs for a batch of new books, without insert-and-retry
+
+    Args:
+        values: Title of each book
+        reserved: Slugs already claimed by the same batch (not yet in the table)
+
+    Returns:
+        list: One free slug per value
+    """
+    bases = [base_slug(value) for value in values]
+    if not bases:
+        return []
+    return assign_suffixes(bases, taken_slugs(bases) | set(reserved))
+
+
+def assign_slugs(books, reserved=()):
+    """Fill the slug of unsaved Book instances that have none, from their title"""
+    books = [book for book in books if not book.slug]
+    slugs = allocate_slugs([book.title for book in books], reserved)
+    for book, slug in zip(books, slugs):
+        book.slug = slug
+    return books
@@ -5,16 +5,24 @@ from django.urls import path
 from .views import (
     BookListView,
     BookDetailView,
+    BookBySlugView,
     BookStockView,
     CheckStockView,
+    BulkCheckStockView,
+    BookImportView,
+    BookExportView,
 )
 
 urlpatterns = [
     # Book CRUD
     path('books/', BookListView.as_view(), name='book-list'),
+    path('books/import/', BookImportView.as_view(), name='book-import'),
+    path('books/export/', BookExportView.as_view(), name='book-export'),
     path('books/<int:book_id>/', BookDetailView.as_view(), name='book-detail'),
+    path('books/by-slug/<slug:slug>/', BookBySlugView.as_view(), name='book-by-slug'),
     
     # Stock management
     path('books/<int:book_id>/stock/', BookStockView.as_view(), name='book-stock'),
     path('books/check-stock/', CheckStockView.as_view(), name='check-stock'),
+    path('books/check-stock/bulk/', BulkCheckStockView.as_view(), name='check-stock-bulk'),
 ]
@@ -6,11 +6,25 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
+import csv
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, Q
 
+from . import catalog, feeds
+from .conditional import version_headers, not_modified, with_version
 from .models import Book
 from .serializers import BookSerializer, BookListSerializer, StockUpdateSerializer
+from .slugs import allocate_slugs
+
+
+def _slug_taken():
+    """400 response for a slug that is already in use, same shape as the serializer error"""
+    return Response(
+        {'slug': [Book._meta.get_field('slug').error_messages['unique']]},
+        status=status.HTTP_400_BAD_REQUEST
+    )
 
 
 @api_view(['GET'])
@@ -31,7 +45,18 @@ class BookListView(APIView):
     """
     
     def get(self, request):
-        """List all books with optional search filter"""
+        """
+        List all books with optional search filter
+        
+        Returns 304 when If-None-Match / If-Modified-Since match the catalog
+        version (latest updated_at and book count, one aggregate query).
+        """
+        version = Book.objects.aggregate(updated_at=Max('updated_at'), count=Count('id'))
+        etag, last_modified = version_headers(f"books-{version['count']}", version['updated_at'])
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        
         search = request.query_params.get('search', None)
         
         books = Book.objects.all()
@@ -42,17 +67,28 @@ class BookListView(APIView):
             )
         
         serializer = BookListSerializer(books, many=True)
-        return Response({
+        return with_version(Response({
             'count': books.count(),
             'books': serializer.data
-        })
+        }), etag, last_modified)
     
     def post(self, request):
-        """Create a new book"""
+        """
+        Create a new book
+        
+        A slug sent by the client is kept as is (400 if it is taken);
+        without one a free slug is allocated from the title.
+        """
         serializer = BookSerializer(data=request.data)
         
         if serializer.is_valid():
-            book = serializer.save()
+            slug = serializer.validated_data.get('slug') or allocate_slugs([serializer.validated_data['title']])[0]
+            try:
+                with transaction.atomic():
+                    book = serializer.save(slug=slug)
+            except IntegrityError:
+                # Taken by a concurrent request after validation (unique slug column)
+                return _slug_taken()
             return Response(
                 BookSerializer(book).data,
                 status=status.HTTP_201_CREATED
@@ -73,10 +109,23 @@ class BookDetailView(APIView):
     """
     
     def get(self, request, book_id):
-        """Get book details by ID"""
+        """
+        Get book details by ID
+        
+        Only updated_at is read first; a client holding the current version
+        gets 304 before the row is loaded or serialized.
+        """
+        updated_at = Book.objects.filter(id=book_id).values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            raise Http404
+        etag, last_modified = version_headers(f'book-{book_id}', updated_at)
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+        
         book = get_object_or_404(Book, id=book_id)
         serializer = BookSerializer(book)
-        return Response(serializer.data)
+        return with_version(Response(serializer.data), *version_headers(f'book-{book_id}', book.updated_at))
     
     def put(self, request, book_id):
         """Update book"""
@@ -84,7 +133,11 @@ class BookDetailView(APIView):
         serializer = BookSerializer(book, data=request.data, partial=True)
         
         if serializer.is_valid():
-            book = serializer.save()
+            try:
+                with transaction.atomic():
+                    book = serializer.save()
+            except IntegrityError:
+                return _slug_taken()
             return Response(BookSerializer(book).data)
         
         return Response(
@@ -102,6 +155,23 @@ class BookDetailView(APIView):
         )
 
 
+class BookBySlugView(APIView):
+    """
+    Retrieve a book by slug
+    GET /api/books/by-slug/{slug}/ - Get book details
+    """
+    
+    def get(self, request, slug):
+        """Get book details by slug (indexed lookup)"""
+        book = Book.objects.filter(slug=slug).order_by('id').first()
+        if book is None:
+            return Response(
+                {'error': 'Book not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(BookSerializer(book).data)
+
+
 class BookStockView(APIView):
     """
     Manage book stock
@@ -186,3 +256,114 @@ class CheckStockView(APIView):
             'requested_quantity': quantity,
             'available': has_stock
         })
+
+
+class BulkCheckStockView(APIView):
+    """
+    Check stock for several books with a single query
+    POST /api/books/check-stock/bulk/ - Check stock availability
+    Body: {items: [{book_id: int, quantity: int}, ...]}
+    """
+    
+    def post(self, request):
+        """Check stock for a list of books"""
+        items = request.data.get('items')
+        
+        if not isinstance(items, list) or not items:
+            return Response(
+                {'error': 'items must be a non-empty list'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            requested = {int(item['book_id']): int(item['quantity']) for item in items}
+        except (TypeError, KeyError, ValueError):
+            return Response(
+                {'error': 'Each item needs book_id and quantity'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        books = Book.objects.filter(id__in=requested).only('id', 'title', 'price', 'stock')
+        
+        results = [{
+            'book_id': book.id,
+            'title': book.title,
+            'price': str(book.price),
+            'current_stock': book.stock,
+            'requested_quantity': requested[book.id],
+            'available': book.has_sufficient_stock(requested[book.id])
+        } for book in books]
+        
+        found = {result['book_id'] for result in results}
+        
+        return Response({
+            'results': results,
+            'missing': [book_id for book_id in requested if book_id not in found]
+        })
+
+
+class BookImportView(APIView):
+    """
+    Bulk catalog import
+    POST /api/books/import/ - Create / update books from a CSV or JSON Lines feed
+    Body: multipart upload (field "file") or the raw file content
+    Query: file_format=csv|ndjson (default: guessed), dry_run=1 to validate only
+    Columns: id (update when present), title, author, stock, price, note, slug
+    """
+    
+    def post(self, request):
+        """Import a catalog feed chunk by chunk"""
+        if request.content_type.startswith('multipart/form-data'):
+            upload = request.FILES.get('file')
+            if upload is None:
+                return Response(
+                    {'error': 'No file uploaded'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            lines, name = upload, upload.name
+        else:
+            # Raw body, read line by line from the request stream
+            lines, name = request.stream or [], ''
+        
+        fmt = request.query_params.get('file_format') or feeds.detect_format(name, request.content_type)
+        if fmt not in catalog.CATALOG_FORMATS:
+            return Response(
+                {'error': f'Unsupported format: {fmt}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            summary = catalog.import_catalog(
+                feeds.parse_lines(lines, fmt),
+                dry_run=request.query_params.get('dry_run') in ('1', 'true')
+            )
+        except (ValueError, csv.Error) as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        return Response(summary)
+
+
+class BookExportView(APIView):
+    """
+    Bulk catalog export
+    GET /api/books/export/?file_format=csv|ndjson - Stream the whole catalog
+    """
+    
+    def get(self, request):
+        """Stream the catalog without building the file in memory"""
+        fmt = request.query_params.get('file_format', 'csv')
+        if fmt not in catalog.CATALOG_FORMATS:
+            return Response(
+                {'error': f'Unsupported format: {fmt}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        response = StreamingHttpResponse(
+            catalog.export_catalog(fmt),
+            content_type='text/csv; charset=utf-8' if fmt == 'csv' else 'application/x-ndjson; charset=utf-8'
+        )
+        response['Content-Disposition'] = f'attachment; filename="catalog.{fmt}"'
+        return response
@@ -52,6 +52,23 @@ class UpdateCartItemSerializer(serializers.Serializer):
     quantity = serializers.IntegerField(min_value=1)
 
 
+class CartOperationSerializer(serializers.Serializer):
+    """Serializer for a single operation of a bulk cart update"""
+    op = serializers.ChoiceField(choices=['add', 'set', 'remove'])
+    book_id = serializers.IntegerField(min_value=1)
+    quantity = serializers.IntegerField(min_value=0, required=False)
+    
+    def validate(self, data):
+        if data['op'] == 'add' and data.get('quantity', 1) < 1:
+            raise serializers.ValidationError({'quantity': 'Must be at least 1 for add'})
+        return data
+
+
+class BulkCartUpdateSerializer(serializers.Serializer):
+    """Serializer for PATCH /api/cart/items/"""
+    operations = CartOperationSerializer(many=True, allow_empty=False, max_length=100)
+
+
 class OrderItemSerializer(serializers.ModelSerializer):
     """Serializer for OrderItem model"""
     
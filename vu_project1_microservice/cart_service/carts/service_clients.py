@@ -58,6 +58,32 @@ class BookServiceClient:
         except requests.RequestException:
             return None
     
+    @staticmethod
+    def check_stock_bulk(items):
+        """
+        Check stock for several books in one request
+        
+        Args:
+            items: List of {'book_id': int, 'quantity': int}
+        
+        Returns:
+            dict: {'results': [...], 'missing': [...]} or None if error
+        """
+        try:
+            url = f"{settings.BOOK_SERVICE_URL}/api/books/check-stock/bulk/"
+            response = requests.post(
+                url,
+                json={'items': items},
+                timeout=settings.SERVICE_REQUEST_TIMEOUT
+            )
+            
+            if response.status_code == 200:
+                return response.json()
+            return None
+            
+        except requests.RequestException:
+            return None
+    
     @staticmethod
     def update_stock(book_id, quantity, operation='decrease'):
         """
@@ -7,6 +7,7 @@ from .views import (
     AddToCartView,
     UpdateCartView,
     RemoveFromCartView,
+    BulkCartItemsView,
     CheckoutView,
     OrderListView,
 )
@@ -17,6 +18,7 @@ urlpatterns = [
     path('cart/add/', AddToCartView.as_view(), name='cart-add'),
     path('cart/update/', UpdateCartView.as_view(), name='cart-update'),
     path('cart/remove/<int:book_id>/', RemoveFromCartView.as_view(), name='cart-remove'),
+    path('cart/items/', BulkCartItemsView.as_view(), name='cart-items-bulk'),
     path('cart/checkout/', CheckoutView.as_view(), name='cart-checkout'),
     
     # Orders
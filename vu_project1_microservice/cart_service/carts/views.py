@@ -9,12 +9,14 @@ from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from django.shortcuts import get_object_or_404
 from django.db import transaction
+from django.utils import timezone
 
 from .models import Cart, CartItem, Order, OrderItem
 from .serializers import (
     CartSerializer,
     AddToCartSerializer,
     UpdateCartItemSerializer,
+    BulkCartUpdateSerializer,
     OrderSerializer
 )
 from .service_clients import BookServiceClient, UserServiceClient
@@ -230,6 +232,124 @@ class RemoveFromCartView(APIView):
             )
 
 
+class BulkCartItemsView(APIView):
+    """
+    Apply several cart changes in one request
+    PATCH /api/cart/items/
+    Body: {operations: [{op: add|set|remove, book_id, quantity}, ...]}
+    """
+    
+    def patch(self, request):
+        """Apply add/set/remove operations atomically"""
+        user_id = get_user_id_from_request(request)
+        
+        if not user_id:
+            return Response(
+                {'error': 'User ID required'},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+        
+        serializer = BulkCartUpdateSerializer(data=request.data)
+        
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        operations = serializer.validated_data['operations']
+        
+        with transaction.atomic():
+            # Lock the cart row so concurrent batches for the same user apply in order
+            cart, created = Cart.objects.select_for_update().get_or_create(user_id=user_id)
+            items = {item.book_id: item for item in CartItem.objects.filter(cart=cart)}
+            
+            # Fold operations into the final quantity of each book
+            quantities = {book_id: item.quantity for book_id, item in items.items()}
+            for operation in operations:
+                book_id = operation['book_id']
+                if operation['op'] == 'add':
+                    quantities[book_id] = quantities.get(book_id, 0) + operation.get('quantity', 1)
+                elif operation['op'] == 'set':
+                    quantities[book_id] = operation.get('quantity', 0)
+                else:
+                    quantities[book_id] = 0
+            
+            changed = {
+                book_id: quantity for book_id, quantity in quantities.items()
+                if quantity != (items[book_id].quantity if book_id in items else 0)
+            }
+            
+            # One Book Service call validates stock for every book that changes
+            to_check = [
+                {'book_id': book_id, 'quantity': quantity}
+                for book_id, quantity in changed.items() if quantity > 0
+            ]
+            stock_by_book = {}
+            if to_check:
+                stock_info = BookServiceClient.check_stock_bulk(to_check)
+                
+                if not stock_info:
+                    return Response(
+                        {'error': 'Unable to verify book availability'},
+                        status=status.HTTP_503_SERVICE_UNAVAILABLE
+                    )
+                
+                stock_by_book = {result['book_id']: result for result in stock_info['results']}
+                errors = [
+                    {'book_id': book_id, 'error': 'Book not found'}
+                    for book_id in stock_info['missing']
+                ] + [
+                    {
+                        'book_id': result['book_id'],
+                        'error': f"Insufficient stock. Available: {result['current_stock']}"
+                    }
+                    for result in stock_info['results'] if not result['available']
+                ]
+                
+                if errors:
+                    transaction.set_rollback(True)
+                    return Response(
+                        {'error': 'Invalid cart operations', 'details': errors},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+            
+            now = timezone.now()
+            new_items, updated_items, removed_ids = [], [], []
+            for book_id, quantity in changed.items():
+                if quantity == 0:
+                    if book_id in items:
+                        removed_ids.append(items[book_id].id)
+                elif book_id in items:
+                    item = items[book_id]
+                    item.quantity = quantity
+                    item.updated_at = now
+                    updated_items.append(item)
+                else:
+                    info = stock_by_book[book_id]
+                    new_items.append(CartItem(
+                        cart=cart,
+                        book_id=book_id,
+                        book_title=info['title'],
+                        quantity=quantity,
+                        price=Decimal(info['price'])
+                    ))
+            
+            if new_items:
+                CartItem.objects.bulk_create(new_items)
+            if updated_items:
+                CartItem.objects.bulk_update(updated_items, ['quantity', 'updated_at'])
+            if removed_ids:
+                CartItem.objects.filter(id__in=removed_ids).delete()
+        
+        cart = Cart.objects.prefetch_related('items').get(id=cart.id)
+        
+        return Response({
+            'message': 'Cart updated',
+            'cart': CartSerializer(cart).data
+        })
+
+
 class CheckoutView(APIView):
     """
     Checkout - Create order from cart
@@ -87,6 +87,20 @@ AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
+# Password hashing: scrypt (memory-hard) for new hashes, older hashes are upgraded on login
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
+
+# Login password checks run in a process pool (users.password_pool)
+LOGIN_HASH_WORKERS = int(os.getenv('LOGIN_HASH_WORKERS', '2'))
+LOGIN_HASH_MAX_PENDING = int(os.getenv('LOGIN_HASH_MAX_PENDING', '32'))
+LOGIN_HASH_TIMEOUT = float(os.getenv('LOGIN_HASH_TIMEOUT', '5'))
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'Asia/Ho_Chi_Minh'
@@ -2,8 +2,9 @@
 User Serializers
 """
 from rest_framework import serializers
-from django.contrib.auth import authenticate
+from rest_framework.exceptions import Throttled
 from .models import User, Customer
+from .password_pool import LoginQueueFull, authenticate_offloaded
 
 
 class CustomerSerializer(serializers.ModelSerializer):
@@ -93,7 +94,11 @@ class LoginSerializer(serializers.Serializer):
         password = data.get('password')
         
         if username and password:
-            user = authenticate(username=username, password=password)
+            try:
+                # Password hashing runs in the login process pool
+                user = authenticate_offloaded(username, password, request=self.context.get('request'))
+            except LoginQueueFull as e:
+                raise Throttled(wait=e.retry_after, detail=str(e))
             if not user:
                 raise serializers.ValidationError("Invalid credentials")
             if not user.is_active:
@@ -70,7 +70,7 @@ class LoginView(APIView):
     
     def post(self, request):
         """Authenticate user and return JWT token"""
-        serializer = LoginSerializer(data=request.data)
+        serializer = LoginSerializer(data=request.data, context={'request': request})
         
         if serializer.is_valid():
             user = serializer.validated_data['user']
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 class BookstoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "bookstore"
+
+    def ready(self):
+        # Connect the token cache invalidation receivers at startup, not on the first authenticated request
+        from . import authentication  # noqa: F401
@@ -0,0 +1,150 @@
+"""
+Cached Token Authentication
+Keeps token -> (token, user, customer) in a bounded in-process TTL cache
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from .models import Customer
+
+
+class TokenCache:
+    """
+    Bounded LRU cache with a time-to-live per entry (thread-safe)
+
+    Entries are indexed by user ID as well, so every token of a user can be
+    dropped when the user or their customer profile changes.
+    """
+
+    def __init__(self, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._keys_by_user = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Get a live entry, or None if missing / expired"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, user_id, value = item
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, user_id, value):
+        """Store an entry, evicting the least recently used one when full"""
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, user_id, value)
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, key):
+        """Drop one token"""
+        with self._lock:
+            self._remove(key)
+
+    def invalidate_user(self, user_id):
+        """Drop every token of a user"""
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def _remove(self, key):
+        item = self._entries.pop(key, None)
+        if item is not None:
+            keys = self._keys_by_user.get(item[1])
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_user[item[1]]
+
+
+token_cache = TokenCache(
+    ttl=getattr(settings, 'TOKEN_AUTH_CACHE_TTL', 60),
+    max_size=getattr(settings, 'TOKEN_AUTH_CACHE_MAX_SIZE', 10000)
+)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication without database queries for recently seen tokens
+
+    A cache miss loads token, user and customer profile in one query
+    (instead of the token + user join and a later request.user.customer
+    query). Each request gets its own copies of the cached instances, with
+    request.user.customer and request.user.auth_token already attached.
+
+    Logout, token rotation and user / customer changes invalidate the cache
+    through model signals. The cache lives in each worker process, so other
+    workers may accept a revoked token until TOKEN_AUTH_CACHE_TTL expires.
+    """
+
+    def authenticate_credentials(self, key):
+        entry = token_cache.get(key)
+        if entry is None:
+            try:
+                token = Token.objects.select_related('user', 'user__customer').get(key=key)
+            except Token.DoesNotExist:
+                raise exceptions.AuthenticationFailed('Invalid token.')
+
+            if not token.user.is_active:
+                raise exceptions.AuthenticationFailed('User inactive or deleted.')
+
+            try:
+                customer = token.user.customer
+            except Customer.DoesNotExist:
+                customer = None
+
+            # Cache detached copies so cached instances never reference each other
+            entry = (copy.copy(token), copy.copy(token.user), copy.copy(customer) if customer else None)
+            for instance in entry:
+                if instance is not None:
+                    instance._state.fields_cache.clear()
+            token_cache.set(key, token.user_id, entry)
+
+        cached_token, cached_user, cached_customer = entry
+        token = copy.copy(cached_token)
+        user = copy.copy(cached_user)
+        user.auth_token = token
+        if cached_customer is not None:
+            user.customer = copy.copy(cached_customer)
+        return user, token
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """Logout / token rotation"""
+    token_cache.invalidate(instance.key)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_tokens(sender, instance, **kwargs):
+    """Deactivation, permission or profile changes"""
+    token_cache.invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=Customer)
+@receiver(post_delete, sender=Customer)
+def invalidate_customer_tokens(sender, instance, **kwargs):
+    token_cache.invalidate_user(instance.user_id)
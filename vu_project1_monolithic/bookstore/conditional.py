@@ -0,0 +1,33 @@
+"""
+Conditional GET helpers
+ETag / Last-Modified from a version timestamp, shared by the views
+"""
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def version_headers(key, updated_at):
+    """
+    Build the validators of a resource version
+
+    Args:
+        key: Resource key, part of the ETag
+        updated_at: Version timestamp (None for an empty collection)
+
+    Returns:
+        tuple: (quoted ETag, Last-Modified as epoch seconds)
+    """
+    timestamp = updated_at.timestamp() if updated_at else 0
+    return quote_etag(f'{key}-{int(timestamp * 1000000)}'), int(timestamp)
+
+
+def not_modified(request, etag, last_modified):
+    """304 response when If-None-Match / If-Modified-Since match the version, otherwise None"""
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def with_version(response, etag, last_modified):
+    """Set ETag and Last-Modified on a response"""
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return response
@@ -0,0 +1,93 @@
+"""
+Query plan audit for hot lookups
+Runs EXPLAIN over every registered hot query and fails on full table scans
+"""
+import json
+import re
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Avg, Count
+from ...models import Cart, Rating, Order, OrderItem
+
+# Registered hot queries: name -> callable returning a QuerySet.
+# Sample parameter values do not change the chosen access path.
+HOT_QUERIES = {
+    'active_cart': lambda: Cart.objects.filter(customer_id=1, is_active=True),
+    'book_ratings': lambda: Rating.objects.filter(book_id=1).order_by().values('book_id').annotate(
+        avg_rating=Avg('score'), rating_count=Count('id')
+    ),
+    'customer_liked_ratings': lambda: Rating.objects.filter(customer_id=1, score__gte=4).order_by(),
+    'order_item_lookup': lambda: OrderItem.objects.filter(order_id=1, book_id=1),
+    'customer_orders': lambda: Order.objects.filter(customer_id=1).order_by('-created_at'),
+    'orders_by_status': lambda: Order.objects.filter(status='pending').order_by('-created_at'),
+}
+
+
+def find_full_scans(plan, vendor):
+    """
+    Extract the tables read with a full scan from an EXPLAIN plan
+    
+    Args:
+        plan: EXPLAIN output (JSON for MySQL, text otherwise)
+        vendor: Database vendor name
+        
+    Returns:
+        list: Names of fully scanned tables
+    """
+    if vendor == 'mysql':
+        tables = []
+        
+        def walk(node):
+            if isinstance(node, dict):
+                if node.get('access_type') == 'ALL':
+                    tables.append(node.get('table_name', '?'))
+                for value in node.values():
+                    walk(value)
+            elif isinstance(node, list):
+                for value in node:
+                    walk(value)
+        
+        walk(json.loads(plan))
+        return tables
+    if vendor == 'postgresql':
+        return re.findall(r'Seq Scan on (\S+)', plan)
+    # SQLite reports "SCAN <table>" without "USING ... INDEX" for table scans
+    return [
+        match.group(1)
+        for match in re.finditer(r'SCAN (?:TABLE )?(\S+)(.*)', plan)
+        if 'INDEX' not in match.group(2)
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Run EXPLAIN over registered hot queries and fail if any uses a full table scan'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'queries', nargs='*',
+            help='Names of hot queries to audit (default: all)'
+        )
+    
+    def handle(self, *args, **options):
+        names = options['queries'] or list(HOT_QUERIES)
+        unknown = [name for name in names if name not in HOT_QUERIES]
+        if unknown:
+            raise CommandError(f'Unknown queries: {", ".join(unknown)}')
+        
+        vendor = connection.vendor
+        failures = []
+        for name in names:
+            queryset = HOT_QUERIES[name]()
+            plan = queryset.explain(format='JSON') if vendor == 'mysql' else queryset.explain()
+            if options['verbosity'] > 1:
+                self.stdout.write(f'--- {name}\n{plan}')
+            
+            full_scans = find_full_scans(plan, vendor)
+            if full_scans:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f'FULL SCAN  {name}: {", ".join(full_scans)}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'OK         {name}'))
+        
+        if failures:
+            raise CommandError(f'{len(failures)} hot queries regressed to a full scan: {", ".join(failures)}')
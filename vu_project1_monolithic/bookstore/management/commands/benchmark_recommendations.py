@@ -0,0 +1,102 @@
+"""
+Recommendation benchmark
+Compares the scored single-query recommender with the previous three-queryset version
+"""
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Avg, Count
+from django.test.utils import CaptureQueriesContext
+from ...models import Book, Customer, OrderItem, CustomerRecommendation
+from ...services.recommendation_service import RecommendationService
+
+
+def legacy_recommendations(customer, limit=10):
+    """Previous implementation: same-author, high-rated and popular querysets merged in Python"""
+    purchased_books = OrderItem.objects.filter(
+        order__customer=customer
+    ).values_list('book_id', flat=True).distinct()
+    purchased_authors = Book.objects.filter(
+        id__in=purchased_books
+    ).values_list('author', flat=True).distinct()
+
+    same_author_books = Book.objects.filter(
+        author__in=purchased_authors
+    ).exclude(
+        id__in=purchased_books
+    ).annotate(avg_rating=Avg('ratings__score'))
+    high_rated_books = Book.objects.exclude(
+        id__in=purchased_books
+    ).annotate(
+        avg_rating=Avg('ratings__score'),
+        rating_count=Count('ratings')
+    ).filter(rating_count__gte=3).order_by('-avg_rating')
+    popular_books = Book.objects.exclude(
+        id__in=purchased_books
+    ).annotate(
+        order_count=Count('orderitem')
+    ).filter(order_count__gte=1).order_by('-order_count')
+
+    recommended_ids = []
+    for book in same_author_books[:limit // 2]:
+        if book.id not in recommended_ids:
+            recommended_ids.append(book.id)
+    for book in high_rated_books[:limit]:
+        if book.id not in recommended_ids and len(recommended_ids) < limit:
+            recommended_ids.append(book.id)
+    for book in popular_books[:limit]:
+        if book.id not in recommended_ids and len(recommended_ids) < limit:
+            recommended_ids.append(book.id)
+
+    id_to_book = {book.id: book for book in Book.objects.filter(id__in=recommended_ids)}
+    return [id_to_book[book_id] for book_id in recommended_ids if book_id in id_to_book]
+
+
+class Command(BaseCommand):
+    help = 'Measure time and queries per customer of the legacy and scored recommenders'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--customers', type=int, default=50, help='Number of customers with orders to sample')
+        parser.add_argument('--limit', type=int, default=10, help='Recommendations per customer')
+        parser.add_argument('--repeat', type=int, default=3, help='Runs per implementation (best is reported)')
+
+    def handle(self, *args, **options):
+        customers = list(
+            Customer.objects.filter(orders__isnull=False).distinct().order_by('id')[:options['customers']]
+        )
+        if not customers:
+            raise CommandError('No customer with orders - create some orders first')
+
+        implementations = {
+            'legacy': legacy_recommendations,
+            'scored': lambda customer, limit: RecommendationService.get_recommendations_for_customer(
+                customer, limit=limit, use_precomputed=False
+            ),
+        }
+        if CustomerRecommendation.objects.exists():
+            implementations['precomputed'] = RecommendationService.get_recommendations_for_customer
+        results = {}
+        for name, recommend in implementations.items():
+            best = float('inf')
+            for _ in range(options['repeat']):
+                with CaptureQueriesContext(connection) as queries:
+                    start = time.perf_counter()
+                    picks = [
+                        [book.id for book in recommend(customer, limit=options['limit'])]
+                        for customer in customers
+                    ]
+                    best = min(best, time.perf_counter() - start)
+            results[name] = picks
+            self.stdout.write(
+                f'{name:<12}{best / len(customers) * 1000:>10.2f} ms/customer'
+                f'{len(queries) / len(customers):>8.1f} queries/customer'
+            )
+
+        # How many of the legacy picks the scored recommender keeps
+        overlaps = [
+            len(set(legacy) & set(scored)) / len(legacy)
+            for legacy, scored in zip(results['legacy'], results['scored'])
+            if legacy
+        ]
+        if overlaps:
+            self.stdout.write(f'overlap with legacy picks: {sum(overlaps) / len(overlaps):.0%}')
@@ -0,0 +1,45 @@
+"""
+Import ratings
+Streams a partner rating feed (CSV or NDJSON) into the Rating table in chunks
+"""
+from django.core.management.base import BaseCommand, CommandError
+from ...services.feed_parser import detect_format, parse_feed_lines
+from ...services.rating_import_service import (
+    RatingImportService, RATING_IMPORT_FORMATS, RATING_IMPORT_CHUNK_SIZE
+)
+
+
+class Command(BaseCommand):
+    help = 'Import ratings from a CSV (customer_id,book_id,score[,review]) or NDJSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Feed file')
+        parser.add_argument('--format', choices=RATING_IMPORT_FORMATS, help='Default: guessed from the file extension')
+        parser.add_argument('--chunk-size', type=int, default=RATING_IMPORT_CHUNK_SIZE, help='Lines per upsert')
+        parser.add_argument('--dry-run', action='store_true', help='Validate without writing')
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or detect_format(options['path'])
+
+        def progress(summary):
+            self.stdout.write(
+                f"{summary['processed']} lines, {summary['imported']} imported, {summary['error_count']} errors"
+            )
+
+        try:
+            with open(options['path'], 'rb') as lines:
+                summary = RatingImportService.import_ratings(
+                    parse_feed_lines(lines, fmt),
+                    chunk_size=max(options['chunk_size'], 1),
+                    dry_run=options['dry_run'],
+                    progress=progress if options['verbosity'] > 1 else None
+                )
+        except OSError as e:
+            raise CommandError(str(e))
+
+        for error in summary['errors']:
+            self.stderr.write(f"line {error['line']}: {error['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Validated' if options['dry_run'] else 'Imported'} {summary['imported']} of "
+            f"{summary['processed']} lines in {summary['chunks']} chunks, {summary['error_count']} errors"
+        ))
@@ -0,0 +1,18 @@
+"""
+Rebuild trending scores
+Recomputes the decayed order and rating counters of every trending window
+"""
+from django.core.management.base import BaseCommand
+from ...models import TrendingWindow
+from ...services.trending_service import TrendingService
+
+
+class Command(BaseCommand):
+    help = 'Recompute trending scores from orders and ratings (after a half-life change or data import)'
+
+    def handle(self, *args, **options):
+        TrendingService.rebuild()
+        for window in TrendingWindow.objects.order_by('half_life'):
+            self.stdout.write(
+                f'{window.name:<10} half-life {window.half_life}s  {window.book_scores.count()} books'
+            )
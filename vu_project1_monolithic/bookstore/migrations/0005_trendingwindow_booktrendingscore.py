@@ -0,0 +1,89 @@
+# Generated by Django 5.1.1 on 2026-10-19 15:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookstore", "0004_hot_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TrendingWindow",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=20, unique=True)),
+                (
+                    "half_life",
+                    models.PositiveIntegerField(help_text="Half-life in seconds"),
+                ),
+                ("epoch", models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="BookTrendingScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "orders",
+                    models.FloatField(default=0, help_text="Decayed units ordered"),
+                ),
+                (
+                    "ratings",
+                    models.FloatField(
+                        default=0, help_text="Decayed ratings, weighted by score / 5"
+                    ),
+                ),
+                (
+                    "score",
+                    models.FloatField(
+                        default=0,
+                        help_text="orders + TRENDING_RATING_WEIGHT * ratings",
+                    ),
+                ),
+                (
+                    "book",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="trending_scores",
+                        to="bookstore.book",
+                    ),
+                ),
+                (
+                    "window",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="book_scores",
+                        to="bookstore.trendingwindow",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["window", "-score"], name="trending_window_score_idx"
+                    )
+                ],
+                "unique_together": {("window", "book")},
+            },
+        ),
+    ]
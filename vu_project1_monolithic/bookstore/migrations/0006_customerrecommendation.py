@@ -0,0 +1,44 @@
+# Generated by Django 5.1.1 on 2026-10-19 16:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookstore", "0005_trendingwindow_booktrendingscore"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CustomerRecommendation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "book_ids",
+                    models.JSONField(
+                        default=list, help_text="Recommended book IDs, best first"
+                    ),
+                ),
+                ("scores", models.JSONField(default=list)),
+                ("computed_at", models.DateTimeField(db_index=True)),
+                (
+                    "customer",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="recommendation",
+                        to="bookstore.customer",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.1.1 on 2026-10-19 20:35
+
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_trending(apps, schema_editor):
+    """
+    Fill the trending windows from the orders and ratings written before trending existed
+
+    Same computation as TrendingService.rebuild() on historical models; windows
+    that already hold scores are left alone.
+    """
+    from bookstore.services.trending_service import (
+        REBUILD_HALF_LIVES, get_rating_weight, get_trending_windows
+    )
+
+    TrendingWindow = apps.get_model("bookstore", "TrendingWindow")
+    BookTrendingScore = apps.get_model("bookstore", "BookTrendingScore")
+    OrderItem = apps.get_model("bookstore", "OrderItem")
+    Rating = apps.get_model("bookstore", "Rating")
+
+    now = timezone.now()
+    rating_weight = get_rating_weight()
+    for name, half_life in get_trending_windows().items():
+        window, _ = TrendingWindow.objects.get_or_create(
+            name=name, defaults={"half_life": half_life, "epoch": now, "rating_weight": rating_weight}
+        )
+        if BookTrendingScore.objects.filter(window=window).exists():
+            continue
+
+        def growth(at):
+            return 2.0 ** ((at - window.epoch).total_seconds() / window.half_life)
+
+        since = now - timedelta(seconds=window.half_life * REBUILD_HALF_LIVES)
+        totals = defaultdict(lambda: [0.0, 0.0])
+        for book_id, quantity, created_at in OrderItem.objects.filter(
+            order__created_at__gte=since
+        ).exclude(
+            order__status="cancelled"
+        ).values_list("book_id", "quantity", "order__created_at").iterator():
+            totals[book_id][0] += quantity * growth(created_at)
+        for book_id, score, updated_at in Rating.objects.filter(
+            updated_at__gte=since
+        ).order_by().values_list("book_id", "score", "updated_at").iterator():
+            totals[book_id][1] += score / 5.0 * growth(updated_at)
+
+        BookTrendingScore.objects.bulk_create([
+            BookTrendingScore(
+                window=window, book_id=book_id,
+                orders=orders, ratings=ratings,
+                score=orders + window.rating_weight * ratings
+            )
+            for book_id, (orders, ratings) in totals.items()
+        ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bookstore", "0008_customerrecommendation_limit"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="trendingwindow",
+            name="rating_weight",
+            field=models.FloatField(
+                default=0.5,
+                help_text="TRENDING_RATING_WEIGHT the scores were computed with",
+            ),
+        ),
+        migrations.RunPython(backfill_trending, migrations.RunPython.noop),
+    ]
@@ -2,11 +2,15 @@
 from .models_module import (
     Customer, Book, Cart, CartItem,
     Rating, Staff, Shipping, Payment,
-    Order, OrderItem
+    Order, OrderItem,
+    TrendingWindow, BookTrendingScore,
+    CustomerRecommendation
 )
 
 __all__ = [
     'Customer', 'Book', 'Cart', 'CartItem',
     'Rating', 'Staff', 'Shipping', 'Payment',
-    'Order', 'OrderItem'
+    'Order', 'OrderItem',
+    'TrendingWindow', 'BookTrendingScore',
+    'CustomerRecommendation'
 ]
@@ -6,9 +6,13 @@ from .staff import Staff
 from .shipping import Shipping
 from .payment import Payment
 from .order import Order, OrderItem
+from .trending import TrendingWindow, BookTrendingScore
+from .recommendation import CustomerRecommendation
 
 __all__ = [
     'Customer', 'Book', 'Cart', 'CartItem', 
     'Rating', 'Staff', 'Shipping', 'Payment', 
-    'Order', 'OrderItem'
+    'Order', 'OrderItem',
+    'TrendingWindow', 'BookTrendingScore',
+    'CustomerRecommendation'
 ]
@@ -10,6 +10,8 @@ class Book(models.Model):
     stock = models.PositiveIntegerField()
     note = models.TextField(blank=True, null=True)
     slug = models.SlugField(unique=True)
+    # Version of the row for ETag / Last-Modified on the book endpoints
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.title
@@ -11,6 +11,11 @@ class Cart(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['customer', 'is_active'], name='cart_customer_active_idx'),
+        ]
+
     def __str__(self):
         return f"Cart {self.id} for {self.customer.fullname}"
 
@@ -30,6 +30,10 @@ class Order(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['customer', 'created_at'], name='order_customer_created_idx'),
+            models.Index(fields=['status', 'created_at'], name='order_status_created_idx'),
+        ]
 
     def __str__(self):
         return f"Order #{self.id} - {self.customer.fullname} - ${self.total_price}"
@@ -45,6 +49,11 @@ class OrderItem(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     subtotal = models.DecimalField(max_digits=10, decimal_places=2)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['order', 'book'], name='orderitem_order_book_idx'),
+        ]
+
     def __str__(self):
         return f"{self.quantity}x {self.book.title} in Order #{self.order.id}"
 
@@ -21,6 +21,11 @@ class Rating(models.Model):
     class Meta:
         unique_together = ['customer', 'book']
         ordering = ['-created_at']
+        indexes = [
+            # Covering index for per-book Avg/Count(score) aggregates
+            models.Index(fields=['book', 'score'], name='rating_book_score_idx'),
+            models.Index(fields=['customer', 'score'], name='rating_customer_score_idx'),
+        ]
 
     def __str__(self):
         return f"{self.customer.fullname} rated {self.book.title}: {self.score}/5"
@@ -0,0 +1,19 @@
+from django.db import models
+from .customer import Customer
+
+
+class CustomerRecommendation(models.Model):
+    """
+    Precomputed top-N recommendations of a customer
+    
+    Written by the precompute_recommendations command; the request path reads
+    this row and only scores live for customers without one (cold users).
+    """
+    customer = models.OneToOneField(Customer, on_delete=models.CASCADE, related_name='recommendation')
+    book_ids = models.JSONField(default=list, help_text="Recommended book IDs, best first")
+    scores = models.JSONField(default=list)
+    computed_at = models.DateTimeField(db_index=True)
+    limit = models.PositiveIntegerField(default=0, help_text="List length the batch ran with")
+
+    def __str__(self):
+        return f"{len(self.book_ids)} recommendations for {self.customer.fullname}"
@@ -0,0 +1,40 @@
+from django.db import models
+from .book import Book
+
+
+class TrendingWindow(models.Model):
+    """
+    Decayed-popularity window (one per configured half-life)
+    
+    Book scores of the window are stored relative to `epoch`: an event at time t
+    adds weight * 2 ** ((t - epoch) / half_life), so every score decays at the same
+    rate and the ranking is a plain ORDER BY score.
+    """
+    name = models.CharField(max_length=20, unique=True)
+    half_life = models.PositiveIntegerField(help_text="Half-life in seconds")
+    epoch = models.DateTimeField()
+    rating_weight = models.FloatField(default=0.5, help_text="TRENDING_RATING_WEIGHT the scores were computed with")
+
+    def __str__(self):
+        return f"{self.name} (half-life {self.half_life}s)"
+
+
+class BookTrendingScore(models.Model):
+    """
+    Time-decayed order and rating counters of a book in one window
+    """
+    window = models.ForeignKey(TrendingWindow, on_delete=models.CASCADE, related_name='book_scores')
+    book = models.ForeignKey(Book, on_delete=models.CASCADE, related_name='trending_scores')
+    orders = models.FloatField(default=0, help_text="Decayed units ordered")
+    ratings = models.FloatField(default=0, help_text="Decayed ratings, weighted by score / 5")
+    score = models.FloatField(default=0, help_text="orders + TRENDING_RATING_WEIGHT * ratings")
+
+    class Meta:
+        unique_together = ['window', 'book']
+        indexes = [
+            # Top-K read: WHERE window_id = ? ORDER BY score DESC LIMIT K
+            models.Index(fields=['window', '-score'], name='trending_window_score_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.book.title} in {self.window.name}: {self.score:.3f}"
@@ -3,9 +3,9 @@ Authentication Service - Business Logic Layer
 Handles user registration, login, and profile management
 """
 from django.contrib.auth.models import User
-from django.contrib.auth import authenticate
 from rest_framework.authtoken.models import Token
 from ..models import Customer
+from .password_pool import authenticate_offloaded
 
 
 class AuthService:
@@ -56,18 +56,22 @@ class AuthService:
         return user, token, customer
     
     @staticmethod
-    def authenticate_user(username, password):
+    def authenticate_user(username, password, request=None):
         """
         Authenticate user credentials
         
         Args:
             username: User's username
             password: User's password
+            request: Current request, passed to the user_login_failed signal
             
         Returns:
             User object if authentication successful, None otherwise
+            
+        Raises:
+            LoginQueueFull: If too many logins are waiting for password hashing
         """
-        return authenticate(username=username, password=password)
+        return authenticate_offloaded(username, password, request=request)
     
     @staticmethod
     def get_or_create_token(user):
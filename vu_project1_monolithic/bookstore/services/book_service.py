@@ -2,7 +2,7 @@
 Book Service - Business Logic Layer
 Handles book catalog operations
 """
-from django.db.models import Q
+from django.db.models import Count, Max, Q
 from ..models import Book
 
 
@@ -87,6 +87,46 @@ class BookService:
         """
         return Book.objects.get(id=book_id)
     
+    @staticmethod
+    def get_book_version(book_id):
+        """
+        Get the version of a book without loading the row
+        
+        Args:
+            book_id: Book ID
+            
+        Returns:
+            datetime: updated_at, or None if book not found
+        """
+        return Book.objects.filter(id=book_id).values_list('updated_at', flat=True).first()
+    
+    @staticmethod
+    def get_catalog_version():
+        """
+        Get the version of the whole catalog (one aggregate over the updated_at index)
+        
+        Returns:
+            tuple: (latest updated_at or None, number of books) - the count changes on deletes
+        """
+        version = Book.objects.aggregate(updated_at=Max('updated_at'), count=Count('id'))
+        return version['updated_at'], version['count']
+    
+    @staticmethod
+    def get_book_by_slug(slug):
+        """
+        Get a book by slug (unique index lookup)
+        
+        Args:
+            slug: Book slug
+            
+        Returns:
+            Book object
+            
+        Raises:
+            Book.DoesNotExist: If book not found
+        """
+        return Book.objects.get(slug=slug)
+    
     @staticmethod
     def check_book_availability(book, quantity):
         """
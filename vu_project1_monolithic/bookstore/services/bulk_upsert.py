@@ -0,0 +1,32 @@
+"""
+Bulk upsert helper
+Portable INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE through bulk_create
+"""
+from django.db import connections, router
+
+
+def bulk_upsert(model, objs, unique_fields, update_fields, batch_size=None):
+    """
+    Insert rows, updating update_fields of rows that hit a unique key
+
+    PostgreSQL / SQLite take the conflict target (ON CONFLICT (unique_fields)).
+    MySQL only has ON DUPLICATE KEY UPDATE, which applies to every unique
+    index and rejects a column list, so unique_fields is passed only when the
+    backend supports it - the table must have a unique constraint on exactly
+    unique_fields. MySQL does not return primary keys: re-read rows by
+    unique_fields when their IDs are needed.
+
+    Returns:
+        list: The model instances passed in
+    """
+    connection = connections[router.db_for_write(model)]
+    conflict_target = {}
+    if connection.features.supports_update_conflicts_with_target:
+        conflict_target['unique_fields'] = unique_fields
+    return model.objects.bulk_create(
+        objs,
+        batch_size=batch_size,
+        update_conflicts=True,
+        update_fields=update_fields,
+        **conflict_target
+    )
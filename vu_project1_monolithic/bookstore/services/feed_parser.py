@@ -0,0 +1,66 @@
+"""
+Feed Parser
+Line-by-line reading of bulk CSV / NDJSON feeds shared by the importers
+"""
+import csv
+import json
+
+FEED_FORMATS = ('csv', 'ndjson')
+# Only the first errors are reported in detail (all of them are counted)
+MAX_REPORTED_ERRORS = 100
+
+
+def detect_format(name='', content_type=''):
+    """Guess the feed format from a file name or content type (csv by default)"""
+    name = (name or '').lower()
+    content_type = (content_type or '').lower()
+    if name.endswith(('.ndjson', '.jsonl')) or 'ndjson' in content_type or 'jsonl' in content_type:
+        return 'ndjson'
+    return 'csv'
+
+
+def parse_feed_lines(lines, fmt):
+    """
+    Parse a feed line by line (bytes or str lines), never loading the whole file
+
+    CSV needs a header line; NDJSON has one JSON object per line.
+
+    Yields:
+        tuple: (line number, dict), or (line number, None) for a malformed JSON line
+    """
+    text_lines = (line.decode('utf-8-sig') if isinstance(line, bytes) else line for line in lines)
+
+    if fmt == 'csv':
+        reader = csv.DictReader(text_lines)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_number, line in enumerate(text_lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        yield line_number, record if isinstance(record, dict) else None
+
+
+def add_error(summary, line_number, error):
+    """Count a rejected line, keeping the details of the first MAX_REPORTED_ERRORS"""
+    summary['error_count'] += 1
+    if len(summary['errors']) < MAX_REPORTED_ERRORS:
+        summary['errors'].append({'line': line_number, 'error': error})
+
+
+def chunked(rows, chunk_size):
+    """Group rows into lists of chunk_size items"""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
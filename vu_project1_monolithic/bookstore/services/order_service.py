@@ -1,6 +1,7 @@
 from django.db import transaction
 from django.db.models import Avg
 from ..models import Order, OrderItem, Book, Shipping, Payment, Cart
+from .trending_service import TrendingService
 
 
 class OrderService:
@@ -86,6 +87,11 @@ class OrderService:
             book.stock -= item_data['quantity']
             book.save()
         
+        # Count the sold units in the trending windows once the order is committed
+        TrendingService.record_order(
+            order, [(item['book'].id, item['quantity']) for item in order_items_data]
+        )
+        
         # Mark cart as inactive
         cart.is_active = False
         cart.save()
@@ -136,11 +142,17 @@ class OrderService:
                 raise ValueError("Cannot cancel order in current status")
             
             # Restore stock
-            for order_item in order.items.all():
+            order_items = list(order.items.all())
+            for order_item in order_items:
                 book = order_item.book
                 book.stock += order_item.quantity
                 book.save()
             
+            # Remove the order from the trending windows
+            TrendingService.record_order_cancelled(
+                order, [(item.book_id, item.quantity) for item in order_items]
+            )
+            
             # Update order status
             order.status = 'cancelled'
             order.save()
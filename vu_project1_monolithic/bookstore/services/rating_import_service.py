@@ -0,0 +1,136 @@
+"""
+Rating Import Service - Business Logic Layer
+Streams partner rating feeds (CSV / NDJSON) into the Rating table in chunks
+"""
+from django.db import transaction
+from django.utils import timezone
+from ..models import Book, Customer, Rating
+from .bulk_upsert import bulk_upsert
+from .feed_parser import FEED_FORMATS, add_error, chunked
+from .trending_service import TrendingService
+
+RATING_IMPORT_FORMATS = FEED_FORMATS
+RATING_IMPORT_CHUNK_SIZE = 1000
+
+
+def validate_rating(record):
+    """
+    Returns:
+        tuple (customer_id, book_id, score, review or None), or an error message
+    """
+    if record is None:
+        return 'Invalid JSON object'
+    try:
+        customer_id = int(record['customer_id'])
+        book_id = int(record['book_id'])
+        score = int(record['score'])
+    except KeyError as e:
+        return f'Missing field {e.args[0]}'
+    except (TypeError, ValueError):
+        return 'customer_id, book_id and score must be integers'
+    if score < 1 or score > 5:
+        return 'Score must be between 1 and 5'
+    review = record.get('review')
+    return customer_id, book_id, score, review if review not in (None, '') else None
+
+
+class RatingImportService:
+    """
+    Service class for bulk rating ingestion
+
+    Every chunk costs a fixed number of statements whatever its size: two
+    existence checks, one read of the ratings being replaced and at most two
+    upserts on the (customer, book) unique key. Trending counters are
+    updated once per chunk.
+    """
+
+    @staticmethod
+    def _upsert(ratings, update_fields):
+        bulk_upsert(Rating, ratings, unique_fields=['customer', 'book'], update_fields=update_fields)
+
+    @staticmethod
+    def import_chunk(chunk, summary, dry_run=False):
+        """Validate and upsert one chunk of (line number, record) pairs"""
+        valid = {}
+        for line_number, record in chunk:
+            result = validate_rating(record)
+            if isinstance(result, str):
+                add_error(summary, line_number, result)
+            else:
+                # Same (customer, book) twice in a chunk: the later line wins
+                valid[result[:2]] = (line_number,) + result[2:]
+
+        customer_ids = set(Customer.objects.filter(
+            id__in={customer_id for customer_id, _ in valid}
+        ).values_list('id', flat=True))
+        book_ids = set(Book.objects.filter(
+            id__in={book_id for _, book_id in valid}
+        ).values_list('id', flat=True))
+
+        accepted = {}
+        for key, (line_number, score, review) in valid.items():
+            if key[0] not in customer_ids:
+                add_error(summary, line_number, f'Customer {key[0]} not found')
+            elif key[1] not in book_ids:
+                add_error(summary, line_number, f'Book {key[1]} not found')
+            else:
+                accepted[key] = (score, review)
+
+        summary['imported'] += len(accepted)
+        summary['chunks'] += 1
+        if not accepted or dry_run:
+            return
+
+        now = timezone.now()
+        with transaction.atomic():
+            previous = {
+                (customer_id, book_id): (score, updated_at)
+                for customer_id, book_id, score, updated_at in Rating.objects.filter(
+                    customer_id__in={customer_id for customer_id, _ in accepted},
+                    book_id__in={book_id for _, book_id in accepted}
+                ).values_list('customer_id', 'book_id', 'score', 'updated_at')
+                if (customer_id, book_id) in accepted
+            }
+
+            # Rows without a review keep the stored one
+            with_review, without_review = [], []
+            for (customer_id, book_id), (score, review) in accepted.items():
+                rating = Rating(customer_id=customer_id, book_id=book_id, score=score, review=review or '')
+                (with_review if review is not None else without_review).append(rating)
+            if with_review:
+                RatingImportService._upsert(with_review, ['score', 'review', 'updated_at'])
+            if without_review:
+                RatingImportService._upsert(without_review, ['score', 'updated_at'])
+
+            # One trending update for the whole chunk
+            events = []
+            for key, (score, _) in accepted.items():
+                if key in previous:
+                    old_score, old_updated_at = previous[key]
+                    events.append((key[1], old_updated_at, 0.0, -old_score / 5.0))
+                events.append((key[1], now, 0.0, score / 5.0))
+            TrendingService.record(events)
+
+    @staticmethod
+    def import_ratings(rows, chunk_size=RATING_IMPORT_CHUNK_SIZE, dry_run=False, progress=None):
+        """
+        Import ratings chunk by chunk
+
+        Each chunk is committed on its own; invalid lines are skipped and reported.
+
+        Args:
+            rows: (line number, record) pairs from parse_feed_lines
+            chunk_size: Lines per chunk
+            dry_run: Validate only, write nothing
+            progress: Optional callback progress(summary) after each chunk
+
+        Returns:
+            dict: processed, imported, chunks, error_count, errors, dry_run
+        """
+        summary = {'processed': 0, 'imported': 0, 'chunks': 0, 'error_count': 0, 'errors': [], 'dry_run': dry_run}
+        for chunk in chunked(rows, chunk_size):
+            summary['processed'] += len(chunk)
+            RatingImportService.import_chunk(chunk, summary, dry_run)
+            if progress:
+                progress(summary)
+        return summary
@@ -1,4 +1,5 @@
 from ..models import Rating
+from .trending_service import TrendingService
 
 
 class RatingService:
@@ -20,6 +21,9 @@ class RatingService:
         Returns:
             Rating instance
         """
+        previous = Rating.objects.filter(
+            customer=customer, book=book
+        ).values_list('score', 'updated_at').first()
         rating, created = Rating.objects.update_or_create(
             customer=customer,
             book=book,
@@ -28,6 +32,8 @@ class RatingService:
                 'review': review
             }
         )
+        # Replace the previous score in the trending windows
+        TrendingService.record_rating(book.id, rating.score, rating.updated_at, previous=previous)
         return rating
     
     @staticmethod
@@ -55,6 +61,9 @@ class RatingService:
             else:
                 rating = Rating.objects.get(id=rating_id)
             rating.delete()
+            TrendingService.record_rating(
+                rating.book_id, None, None, previous=(rating.score, rating.updated_at)
+            )
             return True
         except Rating.DoesNotExist:
             return False
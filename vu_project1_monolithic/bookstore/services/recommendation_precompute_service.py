@@ -0,0 +1,169 @@
+"""
+Recommendation Precompute Service - Business Logic Layer
+Batch scoring of every customer into per-customer top-N lists
+"""
+import multiprocessing
+from collections import defaultdict
+import numpy as np
+from django.db import connections
+from django.utils import timezone
+from ..models import Book, Customer, OrderItem, CustomerRecommendation
+from .bulk_upsert import bulk_upsert
+from .recommendation_service import RecommendationService, get_precompute_limit
+
+# Catalog snapshot of the running batch, shared with forked workers (copy-on-write)
+_snapshot = None
+
+
+def load_snapshot(chunk_size=2000):
+    """
+    Read the catalog features and every customer's purchases with streaming queries
+
+    Returns:
+        dict: catalog feature arrays (id, author, avg_rating, rating_count, order_count)
+        plus purchases {customer_id: set of book IDs} and the customer IDs
+    """
+    ids, authors, avg_ratings, rating_counts, order_counts = [], [], [], [], []
+    author_codes = {}
+    for book_id, author, avg_rating, rating_count, order_count in Book.objects.annotate(
+        **RecommendationService.book_statistics()
+    ).order_by('id').values_list(
+        'id', 'author', 'avg_rating', 'rating_count', 'order_count'
+    ).iterator(chunk_size=chunk_size):
+        ids.append(book_id)
+        authors.append(author_codes.setdefault(author, len(author_codes)))
+        avg_ratings.append(avg_rating)
+        rating_counts.append(rating_count)
+        order_counts.append(order_count)
+
+    purchases = defaultdict(set)
+    for customer_id, book_id in OrderItem.objects.order_by().values_list(
+        'order__customer_id', 'book_id'
+    ).iterator(chunk_size=chunk_size):
+        purchases[customer_id].add(book_id)
+
+    return {
+        'id': np.array(ids, dtype=np.int64),
+        'author': np.array(authors, dtype=np.int64),
+        'avg_rating': np.array(avg_ratings, dtype=np.float64),
+        'rating_count': np.array(rating_counts, dtype=np.float64),
+        'order_count': np.array(order_counts, dtype=np.float64),
+        'purchases': dict(purchases),
+        'customer_ids': list(
+            Customer.objects.order_by('id').values_list('id', flat=True).iterator(chunk_size=chunk_size)
+        ),
+    }
+
+
+def recommend_from_snapshot(snapshot, customer_id, limit):
+    """
+    Score one customer against the snapshot (live scoring over the whole catalog)
+
+    Returns:
+        tuple: (book IDs, scores), best first
+    """
+    purchased = np.isin(snapshot['id'], list(snapshot['purchases'].get(customer_id, ())))
+    purchased_authors = np.unique(snapshot['author'][purchased])
+    candidates = ~purchased
+
+    features = {
+        name: snapshot[name][candidates]
+        for name in ('id', 'avg_rating', 'rating_count', 'order_count')
+    }
+    features['author_match'] = np.isin(snapshot['author'][candidates], purchased_authors).astype(np.float64)
+
+    scores, eligible = RecommendationService.score_candidates(features)
+    return RecommendationService.rank_candidates(features, scores, eligible, limit)
+
+
+def score_shard(args):
+    """Worker entry point: score the customers with customer_id % shards == shard"""
+    shard, shards, limit = args
+    rows = []
+    for customer_id in _snapshot['customer_ids']:
+        if customer_id % shards == shard:
+            book_ids, scores = recommend_from_snapshot(_snapshot, customer_id, limit)
+            rows.append((customer_id, book_ids, scores))
+    return shard, rows
+
+
+class RecommendationPrecomputeService:
+    """
+    Service class for the recommendation batch
+
+    The catalog and purchases are read once, customers are split into shards
+    (customer_id % shards) scored in worker processes, and each shard is
+    upserted into CustomerRecommendation as soon as it is done. Requests read
+    those lists through RecommendationService.get_recommendations_for_customer.
+    """
+
+    @staticmethod
+    def save_rows(rows, computed_at, limit):
+        """
+        Upsert (customer_id, book_ids, scores) rows
+
+        The batch limit is stored with each row so readers can tell a list
+        cut at the limit from one that holds every eligible book.
+        """
+        bulk_upsert(
+            CustomerRecommendation,
+            [
+                CustomerRecommendation(
+                    customer_id=customer_id,
+                    book_ids=book_ids,
+                    scores=[round(score, 4) for score in scores],
+                    computed_at=computed_at,
+                    limit=limit
+                )
+                for customer_id, book_ids, scores in rows
+            ],
+            unique_fields=['customer'],
+            update_fields=['book_ids', 'scores', 'computed_at', 'limit'],
+            batch_size=500
+        )
+
+    @staticmethod
+    def precompute(workers=1, shards=None, limit=None, chunk_size=2000, progress=None):
+        """
+        Recompute the recommendation list of every customer
+
+        Args:
+            workers: Scoring processes (fork start method; runs inline otherwise)
+            shards: Number of customer shards (default workers * 4)
+            limit: Books stored per customer (default RECOMMENDATION_PRECOMPUTE_LIMIT)
+            chunk_size: Rows fetched per round trip by the streaming reads
+            progress: Optional callback progress(shard, customers) after each shard
+
+        Returns:
+            int: Number of customers written
+        """
+        global _snapshot
+
+        limit = limit or get_precompute_limit()
+        shards = shards or max(workers * 4, 1)
+        computed_at = timezone.now()
+
+        _snapshot = load_snapshot(chunk_size)
+        tasks = [(shard, shards, limit) for shard in range(shards)]
+        written = 0
+        try:
+            if workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+                # Children inherit the snapshot but must not share the parent's connections
+                connections.close_all()
+                with multiprocessing.get_context('fork').Pool(workers) as pool:
+                    results = pool.imap_unordered(score_shard, tasks)
+                    for shard, rows in results:
+                        RecommendationPrecomputeService.save_rows(rows, computed_at, limit)
+                        written += len(rows)
+                        if progress:
+                            progress(shard, len(rows))
+            else:
+                for task in tasks:
+                    shard, rows = score_shard(task)
+                    RecommendationPrecomputeService.save_rows(rows, computed_at, limit)
+                    written += len(rows)
+                    if progress:
+                        progress(shard, len(rows))
+        finally:
+            _snapshot = None
+        return written
@@ -1,6 +1,41 @@
-from django.db import models
-from django.db.models import Count, Avg, Q
-from ..models import Book, Rating, Order, OrderItem, Customer
+import numpy as np
+from django.conf import settings
+from django.db.models import (
+    Count, Avg, OuterRef, Q, Subquery, Case, When, Value, IntegerField, FloatField
+)
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
+from ..models import Book, Rating, Order, OrderItem, Customer, CustomerRecommendation
+from .trending_service import TrendingService
+
+# Column order of the candidate feature query
+CANDIDATE_FEATURES = ('id', 'author_match', 'avg_rating', 'rating_count', 'order_count')
+
+# Ratings a book needs before its average rating is used
+DEFAULT_MIN_RATING_COUNT = 3
+
+# Feature weights used when neither the request nor settings give any
+DEFAULT_RECOMMENDATION_WEIGHTS = {
+    'author': 3.0,
+    'rating': 2.0,
+    'rating_count': 0.5,
+    'popularity': 1.0,
+}
+
+
+def get_precompute_limit():
+    """Number of recommendations stored per customer by the precompute command"""
+    return getattr(settings, 'RECOMMENDATION_PRECOMPUTE_LIMIT', 20)
+
+
+def get_candidate_pool():
+    """Most ordered / most rated books added to the live scoring candidates"""
+    return getattr(settings, 'RECOMMENDATION_CANDIDATE_POOL', 200)
+
+
+def get_recommendation_weights():
+    """Feature weights used when a request does not pass its own"""
+    return getattr(settings, 'DEFAULT_RECOMMENDATION_WEIGHTS', DEFAULT_RECOMMENDATION_WEIGHTS)
 
 
 class RecommendationService:
@@ -9,100 +44,223 @@ class RecommendationService:
     """
     
     @staticmethod
-    def get_recommendations_for_customer(customer, limit=10):
+    def book_statistics():
+        """
+        Rating and order statistics of a book as annotations
+        
+        Correlated subqueries served by the (book, score) and (order, book)
+        indexes; nothing is joined row by row.
+        """
+        book_ratings = Rating.objects.filter(book=OuterRef('pk')).order_by().values('book')
+        book_orders = OrderItem.objects.filter(book=OuterRef('pk')).order_by().values('book')
+        return {
+            'avg_rating': Coalesce(
+                Subquery(book_ratings.annotate(value=Avg('score')).values('value')),
+                Value(0.0),
+                output_field=FloatField()
+            ),
+            'rating_count': Coalesce(
+                Subquery(book_ratings.annotate(value=Count('id')).values('value')),
+                Value(0)
+            ),
+            'order_count': Coalesce(
+                Subquery(book_orders.annotate(value=Count('id')).values('value')),
+                Value(0)
+            ),
+        }
+    
+    @staticmethod
+    def most_counted_books(model, pool):
+        """
+        Subquery of the `pool` book IDs with the most rows in model's table (orders, ratings)
+        
+        The LIMIT sits in a derived table because MySQL rejects LIMIT directly
+        inside IN (...).
+        """
+        table = model._meta.db_table
+        column = model._meta.get_field('book').column
+        return RawSQL(
+            f'SELECT book_id FROM (SELECT {column} AS book_id FROM {table} '
+            f'GROUP BY {column} ORDER BY COUNT(*) DESC LIMIT %s) most_counted',
+            (pool,)
+        )
+    
+    @staticmethod
+    def get_candidate_features(customer, pool=None):
         """
-        Get book recommendations for a customer based on:
-        1. Purchase history (books from same authors)
-        2. High-rated books
-        3. Popular books (most purchased)
+        Fetch the features of the candidate books of a customer, in one query
+        
+        Candidates are pre-filtered inside the same query: books by authors the
+        customer bought, plus the `pool` most ordered and the `pool` most rated
+        books, purchased books excluded. The most popular books set the
+        normalisation maxima, so their scores match a scan of the whole catalog.
         
         Args:
             customer: Customer instance
-            limit: Maximum number of recommendations
+            pool: Most ordered / most rated books considered (default RECOMMENDATION_CANDIDATE_POOL)
             
         Returns:
-            QuerySet of recommended books
+            dict of NumPy arrays: id, author_match, avg_rating, rating_count, order_count
         """
-        # Get books the customer has already purchased
-        purchased_books = OrderItem.objects.filter(
-            order__customer=customer
-        ).values_list('book_id', flat=True).distinct()
+        pool = pool or get_candidate_pool()
+        purchased_books = OrderItem.objects.filter(order__customer=customer).values('book_id')
+        purchased_authors = Book.objects.filter(id__in=purchased_books).values('author')
         
-        # Get authors from customer's purchase history
-        purchased_authors = Book.objects.filter(
-            id__in=purchased_books
-        ).values_list('author', flat=True).distinct()
-        
-        # Recommendation strategy:
-        # 1. Books by same authors (not already purchased)
-        same_author_books = Book.objects.filter(
-            author__in=purchased_authors
+        rows = Book.objects.filter(
+            Q(author__in=purchased_authors)
+            | Q(id__in=RecommendationService.most_counted_books(OrderItem, pool))
+            | Q(id__in=RecommendationService.most_counted_books(Rating, pool))
         ).exclude(
             id__in=purchased_books
         ).annotate(
-            avg_rating=Avg('ratings__score')
+            author_match=Case(
+                When(author__in=purchased_authors, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField()
+            ),
+            **RecommendationService.book_statistics()
+        ).values_list(*CANDIDATE_FEATURES)
+        
+        data = np.array(list(rows), dtype=np.float64).reshape(-1, len(CANDIDATE_FEATURES))
+        features = {name: data[:, index] for index, name in enumerate(CANDIDATE_FEATURES)}
+        features['id'] = features['id'].astype(np.int64)
+        return features
+    
+    @staticmethod
+    def score_candidates(features, weights=None, min_rating_count=DEFAULT_MIN_RATING_COUNT):
+        """
+        Blend candidate features into one score per book
+        
+        Args:
+            features: Output of get_candidate_features
+            weights: Feature weights (defaults to DEFAULT_RECOMMENDATION_WEIGHTS)
+            min_rating_count: Ratings needed before the average rating counts
+            
+        Returns:
+            tuple: (scores, eligible mask) - a book is eligible when it shares an
+            author with past purchases, has enough ratings or was ordered at least once
+        """
+        weights = weights or get_recommendation_weights()
+        rating_count = features['rating_count']
+        order_count = features['order_count']
+        rated = rating_count >= min_rating_count
+        
+        def log_scaled(counts):
+            # log1p(count) / log1p(max) -> [0, 1], diminishing returns for very popular books
+            top = counts.max(initial=0)
+            return np.log1p(counts) / np.log1p(top) if top > 0 else np.zeros_like(counts)
+        
+        scores = (
+            weights['author'] * features['author_match']
+            + weights['rating'] * np.where(rated, features['avg_rating'] / 5.0, 0.0)
+            + weights['rating_count'] * log_scaled(rating_count)
+            + weights['popularity'] * log_scaled(order_count)
         )
+        eligible = (features['author_match'] > 0) | rated | (order_count > 0)
+        return scores, eligible
+    
+    @staticmethod
+    def rank_candidates(features, scores, eligible, limit):
+        """
+        Pick the best eligible candidates
         
-        # 2. High-rated books (not already purchased)
-        high_rated_books = Book.objects.exclude(
-            id__in=purchased_books
-        ).annotate(
-            avg_rating=Avg('ratings__score'),
-            rating_count=Count('ratings')
-        ).filter(
-            rating_count__gte=3  # At least 3 ratings
-        ).order_by('-avg_rating')
+        Returns:
+            tuple: (book IDs, scores) - best score first, lower ID first on ties
+        """
+        candidates = np.flatnonzero(eligible)
+        if candidates.size > limit:
+            # Top-k without sorting the whole catalog
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        ids = features['id']
+        ranked = candidates[np.lexsort((ids[candidates], -scores[candidates]))]
+        return ids[ranked].tolist(), scores[ranked].tolist()
+    
+    @staticmethod
+    def get_precomputed_recommendations(customer, limit):
+        """
+        Book IDs from the precomputed list (precompute_recommendations command)
         
-        # 3. Popular books (most purchased, not already purchased)
-        popular_books = Book.objects.exclude(
-            id__in=purchased_books
-        ).annotate(
-            order_count=Count('orderitem')
-        ).filter(
-            order_count__gte=1
-        ).order_by('-order_count')
+        Books the customer bought or rated after the list was computed are
+        dropped from it.
+        
+        Returns:
+            list of book IDs, or None if the customer has no list yet (cold user)
+            or what is left is shorter than the requested limit while the batch
+            cut the list at its own limit
+        """
+        row = CustomerRecommendation.objects.filter(
+            customer=customer
+        ).values_list('book_ids', 'computed_at', 'limit').first()
+        if row is None:
+            return None
+        book_ids, computed_at, stored_limit = row
         
-        # Combine recommendations (prioritize same author, then rating, then popularity)
-        recommended_ids = []
+        consumed = set(
+            OrderItem.objects.filter(
+                order__customer=customer, order__created_at__gt=computed_at
+            ).values_list('book_id', flat=True)
+        ) | set(
+            Rating.objects.filter(
+                customer=customer, updated_at__gt=computed_at
+            ).values_list('book_id', flat=True)
+        )
+        fresh_ids = [book_id for book_id in book_ids if book_id not in consumed]
+        if len(fresh_ids) < limit and len(book_ids) >= stored_limit:
+            return None
+        return fresh_ids[:limit]
+    
+    @staticmethod
+    def get_recommendations_for_customer(customer, limit=10, weights=None,
+                                         min_rating_count=DEFAULT_MIN_RATING_COUNT, use_precomputed=True):
+        """
+        Get book recommendations for a customer
         
-        # Add same author books
-        for book in same_author_books[:limit//2]:
-            if book.id not in recommended_ids:
-                recommended_ids.append(book.id)
+        Candidate books not yet purchased (see get_candidate_features) are scored on:
+        1. Purchase history (written by an author the customer bought before)
+        2. Average rating (books with at least min_rating_count ratings)
+        3. Number of ratings and number of orders (popularity)
         
-        # Add high-rated books
-        for book in high_rated_books[:limit]:
-            if book.id not in recommended_ids and len(recommended_ids) < limit:
-                recommended_ids.append(book.id)
+        With the default weights the precomputed list is served when there is
+        one; otherwise the candidates are scored live.
         
-        # Add popular books if still need more
-        for book in popular_books[:limit]:
-            if book.id not in recommended_ids and len(recommended_ids) < limit:
-                recommended_ids.append(book.id)
+        Args:
+            customer: Customer instance
+            limit: Maximum number of recommendations
+            weights: Feature weights (defaults to DEFAULT_RECOMMENDATION_WEIGHTS)
+            min_rating_count: Ratings needed before the average rating counts
+            use_precomputed: Read the precomputed list if available
+            
+        Returns:
+            list of recommended books, best first
+        """
+        if limit <= 0:
+            return []
         
-        # Return books maintaining the order
-        recommended_books = Book.objects.filter(id__in=recommended_ids)
+        ranked_ids = None
+        if use_precomputed and weights is None and min_rating_count == DEFAULT_MIN_RATING_COUNT:
+            ranked_ids = RecommendationService.get_precomputed_recommendations(customer, limit)
         
-        # Preserve order
-        id_to_book = {book.id: book for book in recommended_books}
-        ordered_books = [id_to_book[book_id] for book_id in recommended_ids if book_id in id_to_book]
+        if ranked_ids is None:
+            features = RecommendationService.get_candidate_features(customer)
+            scores, eligible = RecommendationService.score_candidates(features, weights, min_rating_count)
+            ranked_ids, _ = RecommendationService.rank_candidates(features, scores, eligible, limit)
         
-        return ordered_books
+        books = Book.objects.in_bulk(ranked_ids)
+        return [books[book_id] for book_id in ranked_ids if book_id in books]
     
     @staticmethod
-    def get_trending_books(limit=10):
+    def get_trending_books(limit=10, window=None):
         """
-        Get trending books based on recent orders and high ratings
+        Get trending books: highest time-decayed orders and ratings in a window
+
+        Args:
+            limit: Maximum number of books
+            window: Trending window name (half-life), see TRENDING_WINDOWS
+
+        Raises:
+            ValueError: If the window is not configured
         """
-        trending = Book.objects.annotate(
-            avg_rating=Avg('ratings__score'),
-            rating_count=Count('ratings'),
-            order_count=Count('orderitem')
-        ).filter(
-            Q(rating_count__gte=1) | Q(order_count__gte=1)
-        ).order_by('-order_count', '-avg_rating')[:limit]
-        
-        return trending
+        return TrendingService.get_trending_books(limit=limit, window=window)
     
     @staticmethod
     def get_similar_books_by_author(book, limit=5):
@@ -0,0 +1,303 @@
+"""
+Trending Service - Business Logic Layer
+Maintains exponentially time-decayed order and rating counters per book
+"""
+from collections import defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.db import connection, transaction, IntegrityError
+from django.db.models import F
+from django.utils import timezone
+from ..models import OrderItem, Rating, TrendingWindow, BookTrendingScore
+
+# Default windows: name -> half-life in seconds (TRENDING_WINDOWS overrides)
+DEFAULT_TRENDING_WINDOWS = {
+    'day': 24 * 3600,
+    'week': 7 * 24 * 3600,
+}
+
+# Scores are rebased (and near-zero rows pruned) once the newest event weighs
+# 2 ** REBASE_AFTER_HALF_LIVES relative to the epoch - far below float overflow
+REBASE_AFTER_HALF_LIVES = 256
+PRUNE_BELOW = 1e-9
+
+# Events older than this many half-lives are ignored by rebuild() (weight < 1e-18)
+REBUILD_HALF_LIVES = 60
+
+
+def get_trending_windows():
+    return getattr(settings, 'TRENDING_WINDOWS', DEFAULT_TRENDING_WINDOWS)
+
+
+def get_default_window():
+    return getattr(settings, 'TRENDING_DEFAULT_WINDOW', 'week')
+
+
+def get_rating_weight():
+    return getattr(settings, 'TRENDING_RATING_WEIGHT', 0.5)
+
+
+class TrendingService:
+    """
+    Service class for decayed-popularity trending
+
+    Every configured window keeps one row per book holding forward-decayed
+    counters: an event at time t adds weight * 2 ** ((t - epoch) / half_life).
+    All rows of a window decay at the same rate, so the current ranking is the
+    stored ranking and a top-K read walks the (window, -score) index.
+    Counters are updated after the writing transaction commits.
+
+    Writers hold a shared lock on the window rows, so they do not block each
+    other; the exclusive lock is only taken to create, reset, rescore or
+    rebase a window, which must not interleave with increments computed
+    against the previous epoch.
+    """
+
+    @staticmethod
+    def _growth(window, at):
+        """Weight multiplier of an event at `at` relative to the window epoch"""
+        return 2.0 ** ((at - window.epoch).total_seconds() / window.half_life)
+
+    @staticmethod
+    def _is_stale(window, half_life, rating_weight, now):
+        """True when the window is missing, reconfigured or due for a rebase"""
+        return (
+            window is None
+            or window.half_life != half_life
+            or window.rating_weight != rating_weight
+            or (now - window.epoch).total_seconds() / window.half_life > REBASE_AFTER_HALF_LIVES
+        )
+
+    @staticmethod
+    def _share_lock(names):
+        """Read windows with a shared row lock (plain read on SQLite, which serializes writers)"""
+        queryset = TrendingWindow.objects.filter(name__in=names)
+        if connection.vendor == 'sqlite':
+            return list(queryset)
+        sql, params = queryset.query.sql_with_params()
+        lock = ' LOCK IN SHARE MODE' if connection.vendor == 'mysql' else ' FOR SHARE'
+        return list(TrendingWindow.objects.raw(sql + lock, params))
+
+    @staticmethod
+    def _sync_windows(now, exclusive=False):
+        """
+        Lock and return the configured windows
+
+        The windows are checked without a lock first; when none is stale they
+        are only share-locked. Otherwise they are locked exclusively and checked
+        again: missing windows are created, a window whose half-life changed is
+        emptied (run the rebuild_trending command to refill it), a changed
+        TRENDING_RATING_WEIGHT is applied to the stored counters and windows
+        due for a rebase are rebased.
+
+        Args:
+            now: Current time
+            exclusive: Always take the exclusive lock (rebuild)
+        """
+        configured = get_trending_windows()
+        rating_weight = get_rating_weight()
+        if not exclusive:
+            windows = {window.name: window for window in TrendingWindow.objects.filter(name__in=configured)}
+            if not any(
+                TrendingService._is_stale(windows.get(name), half_life, rating_weight, now)
+                for name, half_life in configured.items()
+            ):
+                return TrendingService._share_lock(list(configured))
+
+        windows = {
+            window.name: window
+            for window in TrendingWindow.objects.select_for_update().filter(name__in=configured)
+        }
+        for name, half_life in configured.items():
+            window = windows.get(name)
+            if window is None:
+                try:
+                    with transaction.atomic():
+                        windows[name] = TrendingWindow.objects.create(
+                            name=name, half_life=half_life, epoch=now, rating_weight=rating_weight
+                        )
+                except IntegrityError:
+                    # Created by a concurrent writer
+                    windows[name] = TrendingWindow.objects.select_for_update().get(name=name)
+            elif window.half_life != half_life:
+                window.book_scores.all().delete()
+                window.half_life = half_life
+                window.epoch = now
+                window.rating_weight = rating_weight
+                window.save(update_fields=['half_life', 'epoch', 'rating_weight'])
+            else:
+                if window.rating_weight != rating_weight:
+                    TrendingService._rescore(window, rating_weight)
+                if (now - window.epoch).total_seconds() / window.half_life > REBASE_AFTER_HALF_LIVES:
+                    TrendingService._rebase(window, now)
+        return list(windows.values())
+
+    @staticmethod
+    def _rescore(window, rating_weight):
+        """Recompute the scores of a window for a new rating weight (counters are kept apart)"""
+        window.book_scores.update(score=F('orders') + rating_weight * F('ratings'))
+        window.rating_weight = rating_weight
+        window.save(update_fields=['rating_weight'])
+
+    @staticmethod
+    def _rebase(window, now):
+        """Move the epoch to now, scaling every score down by the same factor"""
+        factor = 1.0 / TrendingService._growth(window, now)
+        window.book_scores.update(
+            orders=F('orders') * factor,
+            ratings=F('ratings') * factor,
+            score=F('score') * factor
+        )
+        window.book_scores.filter(score__lt=PRUNE_BELOW, orders__lt=PRUNE_BELOW, ratings__lt=PRUNE_BELOW).delete()
+        window.epoch = now
+        window.save(update_fields=['epoch'])
+
+    @staticmethod
+    def _increment(window, book_id, orders, ratings):
+        changes = {
+            'orders': F('orders') + orders,
+            'ratings': F('ratings') + ratings,
+            'score': F('score') + orders + window.rating_weight * ratings
+        }
+        if BookTrendingScore.objects.filter(window=window, book_id=book_id).update(**changes):
+            return
+        try:
+            with transaction.atomic():
+                BookTrendingScore.objects.create(
+                    window=window, book_id=book_id,
+                    orders=orders, ratings=ratings,
+                    score=orders + window.rating_weight * ratings
+                )
+        except IntegrityError:
+            BookTrendingScore.objects.filter(window=window, book_id=book_id).update(**changes)
+
+    @staticmethod
+    @transaction.atomic
+    def apply(events):
+        """
+        Add events to every window now
+
+        Args:
+            events: Iterable of (book_id, at, orders, ratings) - negative values
+                remove an earlier event when `at` is the time of that event
+        """
+        now = timezone.now()
+        for window in TrendingService._sync_windows(now):
+            totals = defaultdict(lambda: [0.0, 0.0])
+            for book_id, at, orders, ratings in events:
+                growth = TrendingService._growth(window, at)
+                totals[book_id][0] += orders * growth
+                totals[book_id][1] += ratings * growth
+            for book_id, (orders, ratings) in totals.items():
+                TrendingService._increment(window, book_id, orders, ratings)
+
+    @staticmethod
+    def record(events):
+        """Apply events once the current transaction commits (rolled back writes are never counted)"""
+        events = list(events)
+        if events:
+            transaction.on_commit(lambda: TrendingService.apply(events))
+
+    @staticmethod
+    def record_order(order, items):
+        """
+        Count the units of a new order
+
+        Args:
+            order: Order instance
+            items: Iterable of (book_id, quantity)
+        """
+        TrendingService.record(
+            (book_id, order.created_at, float(quantity), 0.0) for book_id, quantity in items
+        )
+
+    @staticmethod
+    def record_order_cancelled(order, items):
+        """Remove the contribution of a cancelled order (weighted at its creation time)"""
+        TrendingService.record(
+            (book_id, order.created_at, -float(quantity), 0.0) for book_id, quantity in items
+        )
+
+    @staticmethod
+    def record_rating(book_id, score, at, previous=None):
+        """
+        Count a new or changed rating
+
+        Args:
+            book_id: Rated book ID
+            score: New score (1-5) or None when the rating was deleted
+            at: Time of the change
+            previous: (score, updated_at) of the replaced rating, if any
+        """
+        events = []
+        if previous is not None:
+            events.append((book_id, previous[1], 0.0, -previous[0] / 5.0))
+        if score is not None:
+            events.append((book_id, at, 0.0, score / 5.0))
+        TrendingService.record(events)
+
+    @staticmethod
+    def get_trending_books(limit=10, window=None):
+        """
+        Get the books with the highest decayed popularity
+
+        Args:
+            limit: Maximum number of books
+            window: Window name from TRENDING_WINDOWS (default TRENDING_DEFAULT_WINDOW)
+
+        Returns:
+            list of books, each with a `trending_score` attribute (current decayed score)
+
+        Raises:
+            ValueError: If the window is not configured
+        """
+        window_name = window or get_default_window()
+        if window_name not in get_trending_windows():
+            raise ValueError(f"Unknown trending window: {window_name}")
+
+        window = TrendingWindow.objects.filter(name=window_name).first()
+        if window is None:
+            return []
+
+        decay = 1.0 / TrendingService._growth(window, timezone.now())
+        rows = BookTrendingScore.objects.filter(
+            window=window, score__gt=0
+        ).select_related('book').order_by('-score')[:limit]
+
+        books = []
+        for row in rows:
+            row.book.trending_score = row.score * decay
+            books.append(row.book)
+        return books
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild():
+        """Recompute every window from orders and ratings (epoch = now)"""
+        now = timezone.now()
+        for window in TrendingService._sync_windows(now, exclusive=True):
+            window.book_scores.all().delete()
+            window.epoch = now
+            window.save(update_fields=['epoch'])
+
+            since = now - timedelta(seconds=window.half_life * REBUILD_HALF_LIVES)
+            totals = defaultdict(lambda: [0.0, 0.0])
+            for book_id, quantity, created_at in OrderItem.objects.filter(
+                order__created_at__gte=since
+            ).exclude(
+                order__status='cancelled'
+            ).values_list('book_id', 'quantity', 'order__created_at').iterator():
+                totals[book_id][0] += quantity * TrendingService._growth(window, created_at)
+            for book_id, score, updated_at in Rating.objects.filter(
+                updated_at__gte=since
+            ).order_by().values_list('book_id', 'score', 'updated_at').iterator():
+                totals[book_id][1] += score / 5.0 * TrendingService._growth(window, updated_at)
+
+            BookTrendingScore.objects.bulk_create([
+                BookTrendingScore(
+                    window=window, book_id=book_id,
+                    orders=orders, ratings=ratings,
+                    score=orders + window.rating_weight * ratings
+                )
+                for book_id, (orders, ratings) in totals.items()
+            ], batch_size=1000)
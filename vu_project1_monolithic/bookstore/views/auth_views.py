@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from ..serializers import RegisterSerializer, LoginSerializer, UserSerializer, CustomerSerializer
 from ..services.auth_service import AuthService
+from ..services.password_pool import LoginQueueFull
 
 
 @api_view(['POST'])
@@ -47,7 +48,12 @@ def user_login(request):
         password = serializer.validated_data['password']
         
         # Use service layer for authentication
-        user = AuthService.authenticate_user(username, password)
+        try:
+            user = AuthService.authenticate_user(username, password, request=request)
+        except LoginQueueFull as e:
+            return Response({
+                'error': str(e)
+            }, status=status.HTTP_429_TOO_MANY_REQUESTS, headers={'Retry-After': str(e.retry_after)})
         
         if user is not None:
             login(request, user)
@@ -2,6 +2,7 @@ from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from ..conditional import version_headers, not_modified, with_version
 from ..serializers import BookSerializer
 from ..services.book_service import BookService
 
@@ -12,7 +13,15 @@ def list_books(request):
     """
     API endpoint to view book catalog
     GET /api/books
+    
+    Returns 304 when If-None-Match / If-Modified-Since match the catalog version.
     """
+    updated_at, count = BookService.get_catalog_version()
+    etag, last_modified = version_headers(f'books-{count}', updated_at)
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+    
     # Get query parameters
     search = request.query_params.get('search', None)
     in_stock = request.query_params.get('in_stock', None)
@@ -22,10 +31,10 @@ def list_books(request):
     books = BookService.get_books_with_filters(search=search, in_stock=in_stock_bool)
     
     serializer = BookSerializer(books, many=True)
-    return Response({
+    return with_version(Response({
         'count': books.count(),
         'books': serializer.data
-    }, status=status.HTTP_200_OK)
+    }, status=status.HTTP_200_OK), etag, last_modified)
 
 
 @api_view(['GET'])
@@ -34,11 +43,44 @@ def get_book_detail(request, book_id):
     """
     API endpoint to get book detail
     GET /api/books/<book_id>
+    
+    The version is read first (updated_at only); a client holding the
+    current version gets 304 before the row is loaded or serialized.
     """
+    updated_at = BookService.get_book_version(book_id)
+    if updated_at is None:
+        return Response({
+            'error': 'Book not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    etag, last_modified = version_headers(f'book-{book_id}', updated_at)
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+    
     try:
         # Use service layer to get book
         book = BookService.get_book_by_id(book_id)
         serializer = BookSerializer(book)
+        return with_version(
+            Response(serializer.data, status=status.HTTP_200_OK),
+            *version_headers(f'book-{book_id}', book.updated_at)
+        )
+    except Exception:
+        return Response({
+            'error': 'Book not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def get_book_by_slug(request, slug):
+    """
+    API endpoint to get book detail by slug
+    GET /api/books/by-slug/<slug>
+    """
+    try:
+        book = BookService.get_book_by_slug(slug)
+        serializer = BookSerializer(book)
         return Response(serializer.data, status=status.HTTP_200_OK)
     except Exception:
         return Response({
@@ -1,10 +1,15 @@
+import csv
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from ..models import Rating, Book
 from ..serializers import RatingSerializer, CreateRatingSerializer
 from ..services.rating_service import RatingService
+from ..services.feed_parser import detect_format, parse_feed_lines
+from ..services.rating_import_service import (
+    RatingImportService, RATING_IMPORT_FORMATS, RATING_IMPORT_CHUNK_SIZE
+)
 
 
 class RatingViewSet(viewsets.ModelViewSet):
@@ -94,3 +99,37 @@ class RatingViewSet(viewsets.ModelViewSet):
                 {'error': 'Customer profile not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
+    
+    @action(detail=False, methods=['post'], url_path='import', permission_classes=[IsAdminUser])
+    def bulk_import(self, request):
+        """
+        Import ratings in bulk from a partner feed (staff only)
+        
+        Body: a multipart upload (field "file") or the raw CSV / NDJSON content.
+        Query params:
+            file_format: csv or ndjson (default: guessed from the file name / Content-Type)
+            dry_run: 1 to validate without writing
+        """
+        if request.content_type.startswith('multipart/form-data'):
+            upload = request.FILES.get('file')
+            if upload is None:
+                return Response({'error': 'No file uploaded'}, status=status.HTTP_400_BAD_REQUEST)
+            lines, name = upload, upload.name
+        else:
+            # Raw body, read line by line from the request stream
+            lines, name = request.stream or [], ''
+        
+        fmt = request.query_params.get('file_format') or detect_format(name, request.content_type)
+        if fmt not in RATING_IMPORT_FORMATS:
+            return Response({'error': f'Unsupported format: {fmt}'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            summary = RatingImportService.import_ratings(
+                parse_feed_lines(lines, fmt),
+                chunk_size=RATING_IMPORT_CHUNK_SIZE,
+                dry_run=request.query_params.get('dry_run') in ('1', 'true')
+            )
+        except (ValueError, csv.Error) as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response(summary)
@@ -36,10 +36,20 @@ def get_recommendations(request):
 @api_view(['GET'])
 def get_trending_books(request):
     """
-    Get trending books based on orders and ratings
+    Get trending books based on time-decayed orders and ratings
+
+    Query params:
+        limit: Maximum number of books (default 10)
+        window: Trending window, e.g. 'day' or 'week' (default TRENDING_DEFAULT_WINDOW)
     """
     limit = int(request.query_params.get('limit', 10))
-    trending = RecommendationService.get_trending_books(limit=limit)
+    try:
+        trending = RecommendationService.get_trending_books(
+            limit=limit,
+            window=request.query_params.get('window')
+        )
+    except ValueError as e:
+        return Response({'error': str(e)}, status=400)
     serializer = BookSerializer(trending, many=True)
     
     return Response({
@@ -136,9 +136,51 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'bookstore.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
 }
+
+# Password hashing: scrypt (memory-hard) for new hashes, older hashes are upgraded on login
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
+
+# Login password checks run in a process pool (bookstore.services.password_pool)
+LOGIN_HASH_WORKERS = 2
+LOGIN_HASH_MAX_PENDING = 32
+LOGIN_HASH_TIMEOUT = 5
+
+# Recommendation feature weights (bookstore.services.recommendation_service);
+# a request may pass its own weights, these are used otherwise
+DEFAULT_RECOMMENDATION_WEIGHTS = {
+    'author': 3.0,
+    'rating': 2.0,
+    'rating_count': 0.5,
+    'popularity': 1.0,
+}
+# Recommendations stored per customer by `manage.py precompute_recommendations`
+RECOMMENDATION_PRECOMPUTE_LIMIT = 20
+# Live scoring only considers books by authors the customer bought plus this many
+# of the most ordered and of the most rated books
+RECOMMENDATION_CANDIDATE_POOL = 200
+
+# Trending windows: name -> half-life in seconds (bookstore.services.trending_service)
+# Run `manage.py rebuild_trending` after changing a half-life
+TRENDING_WINDOWS = {
+    'day': 24 * 3600,
+    'week': 7 * 24 * 3600,
+}
+TRENDING_DEFAULT_WINDOW = 'week'
+# Weight of one 5-star rating relative to one ordered unit
+TRENDING_RATING_WEIGHT = 0.5
+
+# Token authentication cache (per worker process)
+TOKEN_AUTH_CACHE_TTL = 60
+TOKEN_AUTH_CACHE_MAX_SIZE = 10000